@@ -0,0 +1,115 @@
+""" Benchmark of the asynchronous evaluation
+
+Evolves a population with a slow evaluation function whose time varies a
+lot between the individuals (most evaluations are short, a few are long, the
+stragglers), and compares the evaluation throughput, in evaluations per
+second, of:
+
+   - the GSimpleGA with the multiprocessing evaluation (Pool.map), which
+     waits for the slowest individual of each generation
+   - the GSteadyStateGA with the asynchronous evaluation, which sends a new
+     offspring as soon as a worker is free
+
+Both use the same number of worker processes. The evaluation time is
+simulated with a sleep, so the benchmark doesn't need free cores.
+
+Before the timings, it checks that the DBSQLite adapter stores the *evalRate*
+statistic of the GSteadyStateGA, with and without the asynchronous
+evaluation, an AssertionError is raised when it doesn't.
+
+Usage:
+   python bench_async.py [workers] [evaluations]
+"""
+import os
+import sys
+import time
+import random
+import sqlite3
+import tempfile
+
+import benchutil
+from pyevolve import GSimpleGA, GSteadyStateGA, GPopulation, G1DList, DBAdapters, Consts
+
+SHORT_EVAL = 0.002
+LONG_EVAL = 0.05
+LONG_RATE = 0.05
+
+def eval_func(genome):
+   if random.random() < LONG_RATE:
+      time.sleep(LONG_EVAL)
+   else:
+      time.sleep(SHORT_EVAL)
+   return float(sum(genome))
+
+def build_genome():
+   genome = G1DList.G1DList(20)
+   genome.setParams(rangemin=0, rangemax=10)
+   genome.evaluator.set(eval_func)
+   return genome
+
+def bench_generational(workers, evaluations, size):
+   ga = GSimpleGA.GSimpleGA(build_genome(), seed=1, interactiveMode=False)
+   ga.setPopulationSize(size)
+   ga.setGenerations(max(1, evaluations / size))
+   ga.setMultiProcessing(True, max_processes=workers)
+   # The evaluation counts, the unchanged individuals are evaluated too
+   ga.setLazyEvaluation(False)
+   t0 = time.time()
+   best = ga.evolve()
+   elapsed = time.time() - t0
+   count = size * (ga.getCurrentGeneration() + 1)
+   return count / elapsed, best.score
+
+def bench_async(workers, evaluations, size):
+   ga = GSteadyStateGA.GSteadyStateGA(build_genome(), seed=1, interactiveMode=False)
+   ga.setPopulationSize(size)
+   ga.setGenerations(evaluations)
+   ga.setAsyncEvaluation(True, max_workers=workers)
+   # The initial population is only evaluated by the workers when the
+   # lazy evaluation is enabled
+   ga.setLazyEvaluation(True)
+   # Each step waits for at least one evaluation
+   ga.setMutationRate(0.2)
+   best = ga.evolve()
+   return ga.getStatistics()["evalRate"], best.score
+
+def check_db():
+   """ Checks that the DBSQLite adapter stores the evalRate of the steady-state
+   GA Engine, raises an AssertionError when it doesn't """
+   handle, dbname = tempfile.mkstemp(suffix=".db")
+   os.close(handle)
+   try:
+      for asynchronous in (False, True):
+         ga = GSteadyStateGA.GSteadyStateGA(build_genome(), seed=1, interactiveMode=False)
+         ga.setPopulationSize(20)
+         ga.setGenerations(20)
+         ga.setAsyncEvaluation(asynchronous, max_workers=2, threads=True)
+         identify = asynchronous and "asynchronous" or "serial"
+         ga.setDBAdapter(DBAdapters.DBSQLite(dbname=dbname, identify=identify, frequency=5))
+         ga.evolve()
+
+         connection = sqlite3.connect(dbname)
+         rows = connection.execute("select generation, evalRate from %s where identify = ?" % (Consts.CDefSQLiteDBTable,),
+                                   (identify,)).fetchall()
+         connection.close()
+         if not rows:
+            raise AssertionError("The %s run stored no statistics" % (identify,))
+         for generation, rate in rows:
+            if rate is None or rate <= 0.0:
+               raise AssertionError("The %s run stored the evalRate %r at the generation %d" % (identify, rate, generation))
+   finally:
+      os.remove(dbname)
+
+if __name__ == "__main__":
+   workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+   evaluations = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+   size = 40
+   check_db()
+   GPopulation.MULTI_PROCESSING = True
+   ideal = workers / (SHORT_EVAL * (1.0 - LONG_RATE) + LONG_EVAL * LONG_RATE)
+   print "%d workers, about %d evaluations, population of %d individuals" % (workers, evaluations, size)
+   print "   %-32s %8.1f evaluations/s" % ("all workers busy (ideal)", ideal)
+   rate, score = bench_generational(workers, evaluations, size)
+   print "   %-32s %8.1f evaluations/s (%3.0f%%)   best: %.1f" % ("GSimpleGA, multiprocessing", rate, rate * 100.0 / ideal, score)
+   rate, score = bench_async(workers, evaluations, size)
+   print "   %-32s %8.1f evaluations/s (%3.0f%%)   best: %.1f" % ("GSteadyStateGA, asynchronous", rate, rate * 100.0 / ideal, score)
@@ -0,0 +1,110 @@
+""" Benchmark of the iterative tree algorithms of the GTreeBase
+
+Times the tree methods on large GP trees, a random binary tree (bushy) and a
+bloated chain of unary nodes (deep), and compares them with the previous
+recursive implementations, which are reproduced here. The recursive versions
+can't handle the deep trees, they hit the python recursion limit.
+
+Usage:
+   python bench_gtree_iterative.py [nodes]
+"""
+import sys
+import random
+
+import benchutil
+from pyevolve import GTree, Consts
+
+def build_bushy(nodes):
+   """ Builds a random binary tree with *nodes* nodes """
+   root = GTree.GTreeNodeGP("add", Consts.nodeType["NONTERMINAL"])
+   leafs = [root]
+   count = 1
+   while count + 2 <= nodes:
+      node = leafs.pop(random.randint(0, len(leafs)-1))
+      node.setType(Consts.nodeType["NONTERMINAL"])
+      node.setData("add")
+      for i in xrange(2):
+         child = GTree.GTreeNodeGP("x", Consts.nodeType["TERMINAL"], node)
+         node.childs.append(child)
+         leafs.append(child)
+      count += 2
+   return root
+
+def build_deep(nodes):
+   """ Builds a chain of *nodes* unary nodes """
+   root = GTree.GTreeNodeGP("neg", Consts.nodeType["NONTERMINAL"])
+   node = root
+   for i in xrange(nodes-2):
+      child = GTree.GTreeNodeGP("neg", Consts.nodeType["NONTERMINAL"], node)
+      node.childs.append(child)
+      node = child
+   node.childs.append(GTree.GTreeNodeGP("x", Consts.nodeType["TERMINAL"], node))
+   return root
+
+def recursive_height(node):
+   height = 0
+   for child in node.getChilds():
+      h_inner = recursive_height(child) + 1
+      if h_inner > height:
+         height = h_inner
+   return height
+
+def recursive_count(node):
+   count = 1
+   for child in node.getChilds():
+      count += recursive_count(child)
+   return count
+
+def recursive_copy(node, node_parent=None):
+   newnode = node.clone()
+   newnode.setParent(node_parent)
+   for ci in xrange(len(newnode)):
+      newnode.childs[ci] = recursive_copy(newnode.childs[ci], newnode)
+   return newnode
+
+def report(name, iterative, other=None, other_name="recursive"):
+   if other is None:
+      print "   %-28s %9.2f ms" % (name, iterative * 1000.0)
+      return
+   if other is False:
+      print "   %-28s %9.2f ms   %s: recursion limit" % (name, iterative * 1000.0, other_name)
+      return
+   print "   %-28s %9.2f ms   %s: %9.2f ms" % (name, iterative * 1000.0, other_name, other * 1000.0)
+
+def bench(name, root):
+   genome = GTree.GTreeGP(root)
+   genome.processNodes()
+   print "%s tree: %d nodes, height %d" % (name, len(genome), genome.getHeight())
+
+   def recursive_or_false(func):
+      try:
+         return benchutil.best_time(func)
+      except RuntimeError:
+         # The recursion limit
+         return False
+
+   report("processNodes", benchutil.best_time(genome.processNodes))
+   report("getNodesProperties", benchutil.best_time(genome.getNodesProperties))
+   report("getNodeHeight(root)", benchutil.best_time(lambda: genome.getNodeHeight(root)),
+          recursive_or_false(lambda: recursive_height(root)))
+   report("getNodesCount", benchutil.best_time(genome.getNodesCount),
+          recursive_or_false(lambda: recursive_count(root)))
+   report("copy", benchutil.best_time(lambda: GTree.GTreeBase.copy(genome, GTree.GTreeGP(cloning=True))),
+          recursive_or_false(lambda: recursive_copy(root)))
+   report("clone", benchutil.best_time(genome.clone))
+   report("getPreOrderExpression", benchutil.best_time(genome.getPreOrderExpression))
+   report("getSExpression", benchutil.best_time(genome.getSExpression))
+
+   leaf = genome.nodes_leaf[-1]
+   report("getNodeDepth(leaf)", benchutil.best_time(lambda: genome.getNodeDepth(leaf)))
+   report("height+depth of every node", benchutil.best_time(genome.getNodesProperties, 1),
+          None if genome.getHeight() > 100 else
+          benchutil.best_time(lambda: [(genome.getNodeHeight(n), genome.getNodeDepth(n)) for n in genome], 1),
+          "one node at a time")
+
+if __name__ == "__main__":
+   nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 20001
+   random.seed(1)
+   print "Python recursion limit: %d" % sys.getrecursionlimit()
+   bench("Bushy", build_bushy(nodes))
+   bench("Deep", build_deep(nodes))
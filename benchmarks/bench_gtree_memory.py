@@ -0,0 +1,91 @@
+""" Memory benchmark of the GP tree nodes and genome clones
+
+Compares the slotted :class:`GTree.GTreeNodeGP` with the dict based layout of
+the previous node classes, on a population of GP trees, and counts the
+:class:`FunctionSlot.FunctionSlot` instances allocated by the genome clones.
+
+Usage:
+   python bench_gtree_memory.py [population size] [nodes per tree]
+"""
+import sys
+import time
+import random
+
+import benchutil
+from pyevolve import GTree, Consts
+from pyevolve import FunctionSlot
+
+class DictNodeGP:
+   """ The node layout before the __slots__, one __dict__ for each node """
+   def __init__(self, data, node_type=0, parent=None):
+      self.parent = parent
+      self.childs = []
+      self.node_type = node_type
+      self.node_data = data
+
+def build_tree(node_class, nodes):
+   """ Builds a random binary tree with *nodes* nodes """
+   root = node_class("add", Consts.nodeType["NONTERMINAL"])
+   leafs = [root]
+   count = 1
+   while count + 2 <= nodes:
+      node = leafs.pop(random.randint(0, len(leafs)-1))
+      for i in xrange(2):
+         child = node_class("x", Consts.nodeType["TERMINAL"], node)
+         node.childs.append(child)
+         leafs.append(child)
+      count += 2
+   return root
+
+def tree_bytes(root):
+   """ Returns the number of nodes and the bytes of the nodes """
+   total, count = 0, 0
+   stack = [root]
+   while stack:
+      node = stack.pop()
+      total += sys.getsizeof(node) + sys.getsizeof(node.childs)
+      if hasattr(node, "__dict__"):
+         total += sys.getsizeof(node.__dict__)
+      count += 1
+      stack.extend(node.childs)
+   return count, total
+
+def bench_nodes(node_class, pop_size, nodes):
+   random.seed(1)
+   t0 = time.time()
+   trees = [build_tree(node_class, nodes) for i in xrange(pop_size)]
+   elapsed = time.time() - t0
+   count, total = 0, 0
+   for root in trees:
+      c, t = tree_bytes(root)
+      count += c
+      total += t
+   print "%-12s %9d nodes %10.1f MB %6.1f bytes/node   build %.2fs" % \
+         (node_class.__name__, count, total / 1048576.0, float(total) / count, elapsed)
+   return total
+
+def bench_clones(pop_size):
+   created = [0]
+   slot_init = FunctionSlot.FunctionSlot.__init__
+   def counting_init(self, *args, **kwargs):
+      created[0] += 1
+      slot_init(self, *args, **kwargs)
+   FunctionSlot.FunctionSlot.__init__ = counting_init
+
+   genome = GTree.GTreeGP(build_tree(GTree.GTreeNodeGP, 15))
+   genome.processNodes()
+   created[0] = 0
+   t0 = time.time()
+   clones = [genome.clone() for i in xrange(pop_size)]
+   elapsed = time.time() - t0
+   FunctionSlot.FunctionSlot.__init__ = slot_init
+   print "%d clones: %d FunctionSlot instances allocated, %.3fs" % (pop_size, created[0], elapsed)
+
+if __name__ == "__main__":
+   pop_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+   nodes = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+   print "Population of %d trees with %d nodes" % (pop_size, nodes)
+   slotted = bench_nodes(GTree.GTreeNodeGP, pop_size, nodes)
+   legacy = bench_nodes(DictNodeGP, pop_size, nodes)
+   print "Slotted nodes use %.1f%% of the dict based nodes memory" % (100.0 * slotted / legacy)
+   bench_clones(pop_size)
@@ -0,0 +1,107 @@
+""" Benchmark of the population sort in the GA Engine step
+
+Times the step() of the GA Engine on a large population and the part of it
+spent sorting the populations (GPopulation.sort and GPopulation.bestRaw),
+with the key-based sort and the lazy partial raw ordering, and with the
+previous cmp-based sort, which is reproduced here. Both sort types are
+timed, the scaled sort type is the default one.
+
+Usage:
+   python bench_population_sort.py [population size] [steps]
+"""
+import sys
+import time
+import random
+
+import benchutil
+from pyevolve import GSimpleGA, G1DList, GPopulation, Consts, Util
+
+def legacy_sort(self):
+   """ The previous GPopulation.sort method """
+   if self.sorted: return
+   rev = (self.minimax == Consts.minimaxType["maximize"])
+
+   if self.sortType == Consts.sortType["raw"]:
+      self.internalPop.sort(cmp=Util.cmp_individual_raw, reverse=rev)
+   else:
+      self.scale()
+      self.internalPop.sort(cmp=Util.cmp_individual_scaled, reverse=rev)
+      self.internalPopRaw = self.internalPop[:]
+      self.internalPopRaw.sort(cmp=Util.cmp_individual_raw, reverse=rev)
+
+   self.sorted = True
+
+def legacy_bestRaw(self, index=0):
+   """ The previous GPopulation.bestRaw method """
+   if self.sortType == Consts.sortType["raw"]:
+      return self.internalPop[index]
+   else:
+      self.sort()
+      return self.internalPopRaw[index]
+
+class SortTimer:
+   """ Accumulates the time spent in the sort methods of the population """
+
+   def __init__(self, sort, best_raw):
+      self.elapsed = 0.0
+      self.depth = 0
+      self.sort = self.wrap(sort)
+      self.bestRaw = self.wrap(best_raw)
+
+   def wrap(self, method):
+      timer = self
+      def timed(*args, **kwargs):
+         timer.depth += 1
+         t0 = time.time()
+         try:
+            return method(*args, **kwargs)
+         finally:
+            timer.depth -= 1
+            # The nested calls (bestRaw calls sort) are counted once
+            if timer.depth == 0:
+               timer.elapsed += time.time() - t0
+      return timed
+
+def eval_func(genome):
+   return float(sum(genome))
+
+def bench(name, sort, best_raw, sort_type, size, steps):
+   timer = SortTimer(sort, best_raw)
+   original = (GPopulation.GPopulation.sort, GPopulation.GPopulation.bestRaw)
+   GPopulation.GPopulation.sort = timer.sort
+   GPopulation.GPopulation.bestRaw = timer.bestRaw
+
+   try:
+      genome = G1DList.G1DList(5)
+      genome.evaluator.set(eval_func)
+      ga = GSimpleGA.GSimpleGA(genome, seed=1, interactiveMode=False)
+      ga.setPopulationSize(size)
+      ga.setSortType(sort_type)
+      ga.setGenerations(steps)
+      ga.initialize()
+      ga.internalPop.evaluate()
+      ga.internalPop.sort()
+
+      timer.elapsed = 0.0
+      t0 = time.time()
+      for i in xrange(steps):
+         ga.step()
+      total = time.time() - t0
+   finally:
+      GPopulation.GPopulation.sort, GPopulation.GPopulation.bestRaw = original
+
+   print "   %-10s step: %8.1f ms   sort: %7.1f ms (%4.1f%%)" % (name, total * 1000.0 / steps,
+         timer.elapsed * 1000.0 / steps, timer.elapsed * 100.0 / total)
+   return ga.bestIndividual().score
+
+if __name__ == "__main__":
+   size = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+   steps = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+   random.seed(1)
+   print "Population of %d individuals, %d steps" % (size, steps)
+   for sort_type in ("scaled", "raw"):
+      print "Sort type: %s" % (sort_type,)
+      current = bench("key-based", GPopulation.GPopulation.sort.im_func,
+                      GPopulation.GPopulation.bestRaw.im_func, Consts.sortType[sort_type], size, steps)
+      previous = bench("cmp-based", legacy_sort, legacy_bestRaw, Consts.sortType[sort_type], size, steps)
+      print "   best raw score: %.1f (cmp-based: %.1f)" % (current, previous)
@@ -0,0 +1,103 @@
+""" Benchmark of the scaling schemes
+
+Times each scaling scheme (the scale() of a population, with its statistics)
+on populations of 100 to 100k individuals, with the loops of the individuals
+and, when NumPy is installed, with the array operations. The largest
+difference of the fitness of both versions is shown. The individuals are
+light objects with only the scores, so the large populations fit in memory.
+
+It checks the Boltzmann scaling with large scores too, the previous version,
+reproduced here, overflows.
+
+Usage:
+   python bench_scaling.py [max population size]
+"""
+import sys
+import math
+import random
+
+import benchutil
+from pyevolve import G1DList, GPopulation, Scaling, Consts
+
+class Individual:
+   """ A light individual, only the scores """
+   def __init__(self, score):
+      self.score = score
+      self.fitness = score
+
+def legacy_boltzmann(pop):
+   """ The previous exponentials of the Boltzmann scaling """
+   temperature = Consts.CDefScaleBoltzStart - Consts.CDefScaleBoltzFactor
+   return [math.exp(ind.score / temperature) for ind in pop]
+
+def build_population(size, mean=100.0, dev=15.0):
+   pop = GPopulation.GPopulation(G1DList.G1DList(1))
+   pop.internalPop = [Individual(abs(random.gauss(mean, dev))) for i in xrange(size)]
+   return pop
+
+def run_scaling(pop, scheme):
+   """ Scales the population, the statistics and the arrays are computed again """
+   pop.clearFlags()
+   pop.scaleMethod.set(scheme)
+   pop.scale()
+   return [ind.fitness for ind in pop]
+
+def max_difference(a, b):
+   return max(abs(x - y) / max(abs(x), abs(y), 1e-300) for x, y in zip(a, b))
+
+def bench(size):
+   pop = build_population(size)
+   print "Population of %d individuals" % (size,)
+
+   schemes = [("LinearScaling", Scaling.LinearScaling),
+              ("SigmaTruncScaling", Scaling.SigmaTruncScaling),
+              ("PowerLawScaling", Scaling.PowerLawScaling),
+              ("BoltzmannScaling", Scaling.BoltzmannScaling),
+              ("ExponentialScaling", Scaling.ExponentialScaling),
+              ("SaturatedScaling", Scaling.SaturatedScaling)]
+
+   for name, scheme in schemes:
+      have_numpy = GPopulation.HAVE_NUMPY
+      GPopulation.HAVE_NUMPY = False
+      try:
+         loops = benchutil.best_time(lambda: run_scaling(pop, scheme))
+         loops_fitness = run_scaling(pop, scheme)
+      finally:
+         GPopulation.HAVE_NUMPY = have_numpy
+
+      line = "   %-20s loops: %9.2f ms" % (name, loops * 1000.0)
+      if pop.useArrays():
+         elapsed = benchutil.best_time(lambda: run_scaling(pop, scheme))
+         diff = max_difference(loops_fitness, run_scaling(pop, scheme))
+         line += "   arrays: %9.2f ms (x%5.1f)   relative diff: %.1e" % (elapsed * 1000.0, loops / elapsed, diff)
+      print line
+
+def overflow():
+   pop = build_population(1000, 1e5, 1e3)
+   print "Boltzmann scaling, raw scores around 1e5"
+   try:
+      legacy_boltzmann(pop)
+      print "   previous: no overflow"
+   except OverflowError, e:
+      print "   previous: OverflowError (%s)" % (e,)
+
+   for arrays in (False, True):
+      have_numpy = GPopulation.HAVE_NUMPY
+      GPopulation.HAVE_NUMPY = have_numpy and arrays
+      try:
+         if arrays and not pop.useArrays(): continue
+         fitness = run_scaling(pop, Scaling.BoltzmannScaling)
+      finally:
+         GPopulation.HAVE_NUMPY = have_numpy
+      print "   %-8s fitness max/min: %.3e/%.3e, mean: %.3f" % ("arrays:" if arrays else "loops:",
+            max(fitness), min(fitness), sum(fitness) / len(fitness))
+
+if __name__ == "__main__":
+   max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+   random.seed(1)
+   print "Arrays are used from %d individuals" % (Consts.CDefPopVectorSize,)
+   size = 100
+   while size <= max_size:
+      bench(size)
+      size *= 10
+   overflow()
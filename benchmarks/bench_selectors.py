@@ -0,0 +1,96 @@
+""" Benchmark of the selection methods
+
+Times the selection of all the parents of one generation (as many parents as
+individuals) on populations of 100 to 100k individuals. The reference is the
+previous Roulette Wheel, a function called once per parent which searches the
+cumulative sums by hand, it's reproduced here. The selectors are timed with
+their pure python draws and, when NumPy is installed, with their vectorized
+draws. The times include the preparation of the tables of each generation.
+
+Usage:
+   python bench_selectors.py [max population size]
+"""
+import sys
+import random
+
+import benchutil
+from pyevolve import G1DList, GPopulation, Selectors, Consts
+
+def legacy_roulette(population, **args):
+   """ The previous Roulette Wheel selector """
+   if args["popID"] != legacy_roulette.cachePopID:
+      legacy_roulette.cachePopID = args["popID"]
+      legacy_roulette.cacheWheel = Selectors.GRouletteWheel_PrepareWheel(population)
+   psum = legacy_roulette.cacheWheel
+
+   cutoff = random.random()
+   lower = 0
+   upper = len(population) - 1
+   while(upper >= lower):
+      i = lower + ((upper-lower)/2)
+      if psum[i] > cutoff: upper = i-1
+      else: lower = i+1
+
+   lower = min(len(population)-1, lower)
+   lower = max(0, lower)
+   return population.bestFitness(lower)
+
+legacy_roulette.cachePopID = None
+legacy_roulette.cacheWheel = None
+
+def build_population(size):
+   """ Creates a sorted population with random raw scores """
+   genome = G1DList.G1DList(1)
+   pop = GPopulation.GPopulation(genome)
+   pop.setPopulationSize(size)
+   pop.setSortType(Consts.sortType["raw"])
+   pop.create(minimax=Consts.minimaxType["maximize"])
+   for ind in pop:
+      ind.score = ind.fitness = random.uniform(0.0, 100.0)
+   pop.sort()
+   return pop
+
+def bench(size):
+   pop = build_population(size)
+   print "Population of %d individuals, %d parents" % (size, size)
+
+   generation = [0]
+   def legacy():
+      generation[0] += 1
+      for i in xrange(size):
+         legacy_roulette(pop, popID=generation[0])
+
+   reference = benchutil.best_time(legacy)
+   print "   %-32s %10.2f ms" % ("legacy GRouletteWheel", reference * 1000.0)
+
+   selectors = [("GRouletteWheel", Selectors.GRouletteWheel),
+                ("GRouletteWheelAlias", Selectors.GRouletteWheelAlias),
+                ("GStochasticUniversalSampling", Selectors.GStochasticUniversalSampling),
+                ("GLinearRankSelector", Selectors.GLinearRankSelector),
+                ("GTruncationSelector", Selectors.GTruncationSelector),
+                ("GTournamentSelector", Selectors.GTournamentSelector),
+                ("GTournamentSelectorAlternative", Selectors.GTournamentSelectorAlternative)]
+
+   for name, selector in selectors:
+      def python_draw():
+         pop.selectionStates.clear()
+         selector.drawIndexes(selector.prepare(pop), size)
+
+      def vector_draw():
+         pop.selectionStates.clear()
+         selector.drawIndexesVector(selector.prepare(pop), size)
+
+      elapsed = benchutil.best_time(python_draw)
+      line = "   %-32s %10.2f ms (x%5.1f)" % (name, elapsed * 1000.0, reference / elapsed)
+      if Selectors.HAVE_NUMPY:
+         elapsed = benchutil.best_time(vector_draw)
+         line += "   NumPy: %9.2f ms (x%6.1f)" % (elapsed * 1000.0, reference / elapsed)
+      print line
+
+if __name__ == "__main__":
+   max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+   random.seed(1)
+   size = 100
+   while size <= max_size:
+      bench(size)
+      size *= 10
@@ -0,0 +1,179 @@
+""" Benchmark of the population statistics
+
+Times the statistics of the raw scores and of the fitness of a population
+(GPopulation.statistics and the statistics of GPopulation.scale) on
+populations of 10k and 1M individuals, with the single pass Welford's method,
+with NumPy (when it's installed) and with the previous implementation, which
+walks the population four times and is reproduced here. The individuals are
+light objects with only the scores, so the large populations fit in memory.
+
+It checks the numerical stability too: the variance of values with a large
+offset is compared with the exact variance, computed with rational numbers,
+for the Welford's method, NumPy and the textbook single pass formula
+(mean of the squares minus the square of the mean).
+
+Before the timings, the statistics are checked, an AssertionError is raised
+when a check fails: the Welford's variance must be close to the exact one,
+the variance of a population of one individual must be 0.0 and the NumPy and
+the python versions must agree.
+
+Usage:
+   python bench_statistics.py [population sizes]
+"""
+import sys
+import random
+from math import sqrt as math_sqrt
+from fractions import Fraction
+
+import benchutil
+from pyevolve import G1DList, GPopulation, Util, Consts
+
+class Individual:
+   """ A light individual, only the scores """
+   def __init__(self, score):
+      self.score = score
+      self.fitness = score
+
+def legacy_statistics(pop):
+   """ The previous statistics of GPopulation.statistics and GPopulation.scale """
+   raw_sum = 0
+   len_pop = len(pop)
+   for ind in xrange(len_pop):
+      raw_sum += pop[ind].score
+
+   pop.stats["rawMax"] = max(pop, key=GPopulation.key_raw_score).score
+   pop.stats["rawMin"] = min(pop, key=GPopulation.key_raw_score).score
+   pop.stats["rawAve"] = raw_sum / float(len_pop)
+
+   tmpvar = 0.0
+   for ind in xrange(len_pop):
+      s = pop[ind].score - pop.stats["rawAve"]
+      s*= s
+      tmpvar += s
+
+   tmpvar/= float((len(pop) - 1))
+   pop.stats["rawDev"] = math_sqrt(tmpvar)
+   pop.stats["rawVar"] = tmpvar
+
+   fit_sum = 0
+   for ind in xrange(len(pop)):
+      fit_sum += pop[ind].fitness
+
+   pop.stats["fitMax"] = max(pop, key=GPopulation.key_fitness_score).fitness
+   pop.stats["fitMin"] = min(pop, key=GPopulation.key_fitness_score).fitness
+   pop.stats["fitAve"] = fit_sum / float(len(pop))
+
+def current_statistics(pop):
+   """ The statistics of GPopulation.statistics and GPopulation.scale,
+   the score arrays are gathered again at each call """
+   pop.clearFlags()
+   pop.statistics()
+   fit_min, fit_max, fit_ave, fit_var = Util.summaryStatistics(pop.getFitnesses())
+   pop.stats["fitMax"] = fit_max
+   pop.stats["fitMin"] = fit_min
+   pop.stats["fitAve"] = fit_ave
+   pop.stats["fitVar"] = fit_var
+   pop.stats["fitDev"] = math_sqrt(fit_var)
+
+def bench(size):
+   pop = GPopulation.GPopulation(G1DList.G1DList(1))
+   pop.internalPop = [Individual(random.gauss(100.0, 15.0)) for i in xrange(size)]
+   print "Population of %d individuals" % (size,)
+
+   reference = benchutil.best_time(lambda: legacy_statistics(pop))
+   legacy = (pop.stats["rawAve"], pop.stats["rawVar"])
+   print "   %-20s %9.1f ms" % ("previous", reference * 1000.0)
+
+   have_numpy = Util.HAVE_NUMPY
+   Util.HAVE_NUMPY = GPopulation.HAVE_NUMPY = False
+   try:
+      elapsed = benchutil.best_time(lambda: current_statistics(pop))
+   finally:
+      Util.HAVE_NUMPY = GPopulation.HAVE_NUMPY = have_numpy
+   print "   %-20s %9.1f ms (x%4.1f)   mean/variance diff: %.1e/%.1e" % ("Welford", elapsed * 1000.0,
+         reference / elapsed, abs(pop.stats["rawAve"] - legacy[0]), abs(pop.stats["rawVar"] - legacy[1]))
+
+   if have_numpy:
+      elapsed = benchutil.best_time(lambda: current_statistics(pop))
+      print "   %-20s %9.1f ms (x%4.1f)   mean/variance diff: %.1e/%.1e" % ("NumPy", elapsed * 1000.0,
+            reference / elapsed, abs(pop.stats["rawAve"] - legacy[0]), abs(pop.stats["rawVar"] - legacy[1]))
+
+def textbook_variance(values):
+   """ The single pass textbook formula, unstable """
+   n = len(values)
+   total = 0.0
+   squares = 0.0
+   for x in values:
+      total += x
+      squares += x * x
+   return (squares - total * total / n) / (n - 1)
+
+def exact_variance(values):
+   """ The exact sample variance, with rational numbers """
+   values = [Fraction(x) for x in values]
+   n = len(values)
+   mean = sum(values) / n
+   return float(sum((x - mean) ** 2 for x in values) / (n - 1))
+
+def python_statistics(values):
+   """ The Util.summaryStatistics without NumPy """
+   have_numpy = Util.HAVE_NUMPY
+   Util.HAVE_NUMPY = False
+   try:
+      return Util.summaryStatistics(values)
+   finally:
+      Util.HAVE_NUMPY = have_numpy
+
+def expect(condition, message):
+   """ Raises an AssertionError with the message when the condition is False """
+   if not condition:
+      raise AssertionError(message)
+
+def check():
+   """ Checks the statistics, raises an AssertionError when a check fails """
+   for offset in (0.0, 1e4, 1e8):
+      values = [offset + random.uniform(0.0, 1.0) for i in xrange(1000)]
+      exact = exact_variance(values)
+      welford = python_statistics(values)[3]
+      expect(abs(welford - exact) <= 1e-6 * exact,
+             "Welford's variance %r, the exact one is %r (offset %r)" % (welford, exact, offset))
+
+   pop = GPopulation.GPopulation(G1DList.G1DList(1))
+   pop.internalPop = [Individual(42.0)]
+   current_statistics(pop)
+   for key in ("rawVar", "rawDev", "fitVar", "fitDev"):
+      expect(pop.stats[key] == 0.0, "%s of a population of one individual is %r" % (key, pop.stats[key]))
+   expect(python_statistics([7]) == (7.0, 7.0, 7.0, 0.0), "the statistics of [7] are %r" % (python_statistics([7]),))
+
+   if not Util.HAVE_NUMPY: return
+   for values in ([random.gauss(100.0, 15.0) for i in xrange(1000)],
+                  [random.randint(0, 100) for i in xrange(1000)]):
+      vector = Util.summaryStatistics(values)
+      loops = python_statistics(values)
+      for name, a, b in zip(("minimum", "maximum", "mean", "variance"), vector, loops):
+         expect(type(a) == type(b) and abs(a - b) <= 1e-9 * max(abs(a), abs(b), 1.0),
+                "the %s is %r with NumPy and %r without it" % (name, a, b))
+
+def stability(offset, count=10000):
+   values = [offset + random.uniform(0.0, 1.0) for i in xrange(count)]
+   exact = exact_variance(values)
+
+   welford = python_statistics(values)[3]
+
+   line = "   offset %7.0e  relative error of the variance, Welford: %.1e" % (offset, abs(welford - exact) / exact)
+   if Util.HAVE_NUMPY:
+      line += "  NumPy: %.1e" % (abs(Util.summaryStatistics(values)[3] - exact) / exact,)
+   line += "  textbook: %.1e" % (abs(textbook_variance(values) - exact) / exact,)
+   print line
+
+if __name__ == "__main__":
+   sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 1000000]
+   random.seed(1)
+   check()
+   print "NumPy is used from %d individuals" % (Consts.CDefPopVectorSize,)
+   for size in sizes:
+      bench(size)
+
+   print "Numerical stability, 10000 values uniform in [offset, offset + 1]"
+   for offset in (0.0, 1e4, 1e8, 1e12):
+      stability(offset)
@@ -0,0 +1,29 @@
+""" Helpers shared by the benchmarks
+
+Importing this module puts the pyevolve source tree (the parent directory of
+the benchmarks) first on the module search path, so the benchmarks measure
+this version of pyevolve, whatever the current directory is.
+"""
+import os
+import sys
+from timeit import default_timer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def best_time(func, repeat=3):
+   """ Returns the best time, in seconds, of *repeat* calls of *func*, the
+   least disturbed by the other processes. The timeit.Timer of Python 2.5
+   accepts only statements as strings, not functions.
+
+   :param func: the function, without parameters
+   :param repeat: the number of calls
+   :rtype: the best time
+   """
+   best = None
+   for i in xrange(repeat):
+      t0 = default_timer()
+      func()
+      elapsed = default_timer() - t0
+      if best is None or elapsed < best:
+         best = elapsed
+   return best
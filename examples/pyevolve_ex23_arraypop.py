@@ -0,0 +1,42 @@
+from pyevolve import GSimpleGA
+from pyevolve import G1DList
+from pyevolve import GArrayPopulation
+from pyevolve import Consts
+import numpy
+import math
+
+# The Rastrigin Function, evaluated for all the population at once,
+# each row of the genes matrix is one individual
+def rastrigin_matrix(genes):
+   n = genes.shape[1]
+   return (10*n) + (genes**2 - 10*numpy.cos(2*math.pi*genes)).sum(axis=1)
+
+def run_main():
+   # Genome instance
+   genome = G1DList.G1DList(20)
+   genome.setParams(rangemin=-5.2, rangemax=5.30, bestrawscore=0.00)
+
+   # The array population, all the chromosomes are kept in a NumPy array
+   pop = GArrayPopulation.G1DListArrayPopulation(genome)
+   pop.initializator.set(GArrayPopulation.ArrayInitializatorReal)
+   pop.mutator.set(GArrayPopulation.ArrayMutatorRealGaussian)
+   pop.crossover.set(GArrayPopulation.ArrayCrossoverUniform)
+   pop.batchEvaluator.set(rastrigin_matrix)
+
+   # Genetic Algorithm Instance
+   ga = GSimpleGA.GSimpleGA(genome)
+   ga.setPopulation(pop)
+   ga.terminationCriteria.set(GSimpleGA.RawScoreCriteria)
+   ga.setMinimax(Consts.minimaxType["minimize"])
+   ga.setGenerations(3000)
+   ga.setCrossoverRate(0.8)
+   ga.setPopulationSize(100)
+   ga.setMutationRate(0.06)
+
+   ga.evolve(freq_stats=50)
+
+   best = ga.bestIndividual()
+   print best
+
+if __name__ == "__main__":
+   run_main()
@@ -0,0 +1,41 @@
+from pyevolve import GSimpleGA
+from pyevolve import GTree
+from pyevolve import Consts
+import numpy
+
+# The 1000 fitness cases, the terminals are bound to these arrays
+a = numpy.random.uniform(-5.0, 5.0, 1000)
+b = numpy.random.uniform(-5.0, 5.0, 1000)
+target = numpy.sqrt(a**2 + b**2)
+
+def gp_add(x, y): return x + y
+def gp_sub(x, y): return x - y
+def gp_mul(x, y): return x * y
+gp_div  = GTree.protectedDiv
+gp_sqrt = GTree.protectedSqrt
+
+def eval_func(chromosome):
+   # The tree is evaluated only once for all the cases
+   outputs = chromosome.evaluateCases({"a": a, "b": b})
+   return numpy.sqrt(((outputs - target) ** 2).mean())
+
+def main_run():
+   genome = GTree.GTreeGP()
+   genome.setParams(max_depth=4, method="ramped")
+   genome.evaluator += eval_func
+
+   ga = GSimpleGA.GSimpleGA(genome)
+   ga.setParams(gp_terminals       = ['a', 'b'],
+                gp_function_prefix = "gp")
+
+   ga.setMinimax(Consts.minimaxType["minimize"])
+   ga.setGenerations(50)
+   ga.setCrossoverRate(1.0)
+   ga.setMutationRate(0.08)
+   ga.setPopulationSize(800)
+   
+   ga(freq_stats=10)
+   print ga.bestIndividual()
+
+if __name__ == "__main__":
+   main_run()
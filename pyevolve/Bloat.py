@@ -0,0 +1,219 @@
+"""
+
+:mod:`Bloat` -- the bloat control module
+=====================================================================
+
+The Genetic Programming trees tend to grow over the generations without
+improving the fitness (the *bloat*), so the evaluation of each generation
+becomes slower and slower. This module contains the
+:class:`Bloat.BloatControl` class, used by the GA Engine in GP mode to
+restrict the growth of the trees. The methods can be combined:
+
+**Size limit**
+   The offspring with more than *max_nodes* nodes are discarded and the
+   GA Engine breeds other ones.
+
+**Tarpeian bloat control**
+   Before the evaluation, each individual larger than the average size of
+   the population receives, with the *tarpeian_rate* probability, the worst
+   raw score of the previous generation and is not evaluated.
+
+**Operator equalisation**
+   The sizes are grouped in bins of *bin_width* nodes and each bin has a
+   capacity of individuals, the offspring which fall in a full bin are
+   discarded too. With the "flat" target
+   all the bins have the same capacity, with the "dynamic" target the
+   capacity of a bin is proportional to the average rank of the parents
+   in the bin. The bins go up to one bin beyond the size of the best
+   individual, so the offspring can't be much larger than the best one.
+
+When too many offspring are discarded in a generation (see the
+:attr:`Consts.CDefBloatMaxRejections`), the bin capacities are ignored and
+the offspring larger than *max_nodes* are replaced by a copy of their parent.
+
+The lexicographic parsimony pressure is a selection method, see the
+:class:`Selectors.TournamentSelectorLexicographic`.
+
+Example:
+   >>> bloat = Bloat.BloatControl(max_nodes=200, tarpeian_rate=0.3)
+   >>> ga_engine.setBloatControl(bloat)
+
+The average and the maximum tree size and the evaluation time of each
+generation are in the statistics as *sizeAve*, *sizeMax* and *evalTime*.
+
+.. versionadded:: 0.6
+   The *Bloat* module.
+
+"""
+import logging
+import Consts
+import Util
+
+class BloatControl:
+   """ BloatControl Class - The bloat control methods of the GA Engine
+
+   :param max_nodes: the maximum number of nodes of the offspring, None
+                     (default) disables the size limit
+   :param tarpeian_rate: the probability of the Tarpeian penalty, 0.0
+                         (default) disables the Tarpeian method
+   :param equalisation: the target of the operator equalisation, "flat",
+                        "dynamic" or None (default) to disable it
+   :param bin_width: the number of different sizes of each bin of the
+                     operator equalisation
+
+   .. versionadded:: 0.6
+      The *BloatControl* class.
+   """
+
+   def __init__(self, max_nodes=None, tarpeian_rate=0.0, equalisation=None,
+                bin_width=Consts.CDefBloatBinWidth):
+      if (max_nodes is not None) and (max_nodes < 1):
+         Util.raiseException("The max_nodes must be >= 1", ValueError)
+
+      if (tarpeian_rate < 0.0) or (tarpeian_rate > 1.0):
+         Util.raiseException("The tarpeian_rate must be between 0.0 and 1.0", ValueError)
+
+      if equalisation not in (None, "flat", "dynamic"):
+         Util.raiseException("Unknown operator equalisation target [%s] !" % equalisation, ValueError)
+
+      if bin_width < 1:
+         Util.raiseException("The bin_width must be >= 1", ValueError)
+
+      self.maxNodes = max_nodes
+      self.tarpeianRate = tarpeian_rate
+      self.equalisation = equalisation
+      self.binWidth = bin_width
+
+      self.binCapacity = None
+      self.binCount = None
+      self.rejected = 0
+      self.maxRejections = 0
+
+   def __repr__(self):
+      """ Returns the string representation of the bloat control """
+      ret  = "- BloatControl\n"
+      ret += "\tMax nodes:\t\t %s\n" % (self.maxNodes,)
+      ret += "\tTarpeian rate:\t\t %s\n" % (self.tarpeianRate,)
+      ret += "\tEqualisation:\t\t %s\n" % (self.equalisation,)
+      ret += "\tBin width:\t\t %d\n" % (self.binWidth,)
+      return ret
+
+   def getBin(self, individual):
+      """ Returns the operator equalisation bin of the individual
+
+      :param individual: the individual
+      :rtype: the bin index
+      """
+      return (len(individual) - 1) // self.binWidth
+
+   def prepare(self, population):
+      """ Computes the bin capacities of the operator equalisation, called
+      by the GA Engine before breeding a new generation
+
+      :param population: the parents population, sorted
+      """
+      len_pop = len(population)
+      self.rejected = 0
+      self.maxRejections = len_pop * Consts.CDefBloatMaxRejections
+
+      if self.equalisation is None: return
+
+      nbins = self.getBin(population.bestRaw()) + 2
+
+      if self.equalisation == "flat":
+         weights = [1.0] * nbins
+      else:
+         # The average rank of the parents in each bin, the best has rank len_pop
+         rank_sum = [0.0] * nbins
+         count = [0] * nbins
+         for i in xrange(len_pop):
+            b = self.getBin(population.bestRaw(i))
+            if b >= nbins: continue
+            rank_sum[b] += len_pop - i
+            count[b] += 1
+         weights = [rank_sum[b] / count[b] if count[b] > 0 else 0.0 for b in xrange(nbins)]
+         # The bin beyond the best individual
+         weights[-1] = weights[-2]
+
+      total = sum(weights)
+      self.binCapacity = [max(1, int(round(len_pop * w / total))) if w > 0.0 else 0 for w in weights]
+      self.binCount = [0] * nbins
+
+   def filterChild(self, child, parent):
+      """ Applies the size limit and the operator equalisation to a new
+      offspring, called by the GA Engine for each offspring
+
+      :param child: the offspring
+      :param parent: the parent of the offspring
+      :rtype: the individual to add to the new population or None
+              when the offspring was discarded
+      """
+      if (self.maxNodes is not None) and (len(child) > self.maxNodes):
+         if self.rejected < self.maxRejections:
+            self.rejected += 1
+            return None
+         return parent.clone()
+
+      if self.binCapacity is None:
+         return child
+
+      b = self.getBin(child)
+      if b < len(self.binCapacity) and self.binCount[b] < self.binCapacity[b]:
+         self.binCount[b] += 1
+         return child
+
+      # The bin is full or the offspring is too large
+      if self.rejected < self.maxRejections:
+         self.rejected += 1
+         return None
+
+      # Too many discarded offspring, the bin capacities are ignored
+      if b >= len(self.binCapacity):
+         return parent.clone()
+      return child
+
+   def penalize(self, population, parents):
+      """ Applies the Tarpeian penalty to the population, the penalized
+      individuals receive the worst raw score of the parents and are
+      marked as evaluated
+
+      :param population: the population
+      :param parents: the parents population, evaluated
+      :rtype: the number of penalized individuals
+      """
+      if self.tarpeianRate <= 0.0: return 0
+
+      parents.statistics()
+      if population.minimax == Consts.minimaxType["maximize"]:
+         worst = parents.stats["rawMin"]
+      else:
+         worst = parents.stats["rawMax"]
+
+      sizes = [len(ind) for ind in population]
+      size_ave = sum(sizes) / float(len(sizes))
+
+      penalized = 0
+      for ind, size in zip(population, sizes):
+         if size > size_ave and Util.randomFlipCoin(self.tarpeianRate):
+            ind.resetStats()
+            ind.score = worst
+            ind.setModified(False)
+            penalized += 1
+
+      logging.debug("Tarpeian bloat control: %d individuals penalized", penalized)
+      return penalized
+
+   def evaluate(self, population, parents):
+      """ Evaluates the population with the Tarpeian penalty, the penalized
+      individuals are not evaluated when the lazy evaluation is enabled
+
+      :param population: the population
+      :param parents: the parents population, evaluated
+      """
+      lazy = population.lazyEvaluation
+      if lazy:
+         self.penalize(population, parents)
+      population.evaluate()
+      if not lazy:
+         self.penalize(population, parents)
+         population.clearFlags()
@@ -35,6 +35,15 @@ General constants
    Example:
       >>> minmax = Consts.minimaxType["minimize"]
       >>> minmax = Consts.minimaxType["maximize]
+
+.. attribute:: replacementType
+
+   The replacement policy of the steady-state GA Engine, worst or random
+   (see the :mod:`GSteadyStateGA`).
+
+   Example:
+      >>> replacement = Consts.replacementType["worst"]
+      >>> replacement = Consts.replacementType["random"]
   
 .. attribute:: CDefESCKey
 
@@ -65,12 +74,36 @@ General constants
    The classes which are used in Genetic Programming, used to detected the
    correct mode when starting the evolution
 
+Bloat control constants (:mod:`Bloat`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefBloatBinWidth
+
+   The default number of different tree sizes in each bin of the operator equalisation (:class:`Bloat.BloatControl`).
+
+.. attribute:: CDefBloatMaxRejections
+
+   The number of offspring, per individual of the population, which the operator equalisation can discard in a generation, when the limit is reached, the bin capacities are ignored.
+
 Selection methods constants (:mod:`Selectors`)
 ----------------------------------------------------------------------------
 
 .. attribute:: CDefTournamentPoolSize
 
-   The default pool size for the Tournament Selector (:func:`Selectors.GTournamentSelector`).
+   The default pool size for the Tournament Selector (:class:`Selectors.TournamentSelector`).
+
+.. attribute:: CDefLinearRankPressure
+
+   The default selection pressure of the Linear Ranking Selector (:class:`Selectors.LinearRankSelector`).
+
+.. attribute:: CDefTruncationRate
+
+   The default fraction of the population selected by the Truncation Selector (:class:`Selectors.TruncationSelector`).
+
+.. attribute:: CDefSelectionVectorSize
+
+   The minimum number of individuals drawn in one call to use the vectorized
+   selection methods, when NumPy is installed (see the :mod:`Selectors`).
 
 Scaling scheme constants (:mod:`Scaling`)
 ----------------------------------------------------------------------------
@@ -117,6 +150,26 @@ Population constants (:class:`GPopulation.GPopulation`)
 
    Default scaling scheme.
 
+.. attribute:: CDefPopLazyEvaluation
+
+   Default lazy evaluation option, when True, the individuals not changed
+   after their last evaluation are not evaluated again. It's disabled by
+   default, the evaluation functions may not be deterministic.
+
+.. attribute:: CDefPopVectorSize
+
+   The minimum population size to keep the scores in NumPy arrays and to
+   compute the statistics and the sort with NumPy, when it's installed
+   (see the :meth:`GPopulation.GPopulation.getScores`).
+
+Array Population constants (:class:`GArrayPopulation.G1DListArrayPopulation`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefArrayPopMaxSeed
+
+   The maximum seed of the NumPy random generator, the seed is drawn
+   from the python random module, so the engine seed is respected
+
 
 1D Binary String Defaults (:class:`G1DBinaryString.G1DBinaryString`)
 ----------------------------------------------------------------------------
@@ -137,6 +190,21 @@ Population constants (:class:`GPopulation.GPopulation`)
 
    The default uniform probability used for some uniform genetic operators for the 1D Binary String (:class:`G1DBinaryString.G1DBinaryString`) chromosome.
 
+1D Packed Binary String Defaults (:class:`G1DBinaryString.G1DBinaryStringPacked`)
+-------------------------------------------------------------------------
+
+.. attribute:: CDefG1DBinaryStringPackedMutator
+
+   The default mutator for the packed 1D Binary String (:class:`G1DBinaryString.G1DBinaryStringPacked`) chromosome.
+
+.. attribute:: CDefG1DBinaryStringPackedCrossover
+
+   The default crossover method for the packed 1D Binary String (:class:`G1DBinaryString.G1DBinaryStringPacked`) chromosome.
+
+.. attribute:: CDefG1DBinaryStringPackedInit
+
+   The default initializator for the packed 1D Binary String (:class:`G1DBinaryString.G1DBinaryStringPacked`) chromosome.
+
 
 2D Binary String Defaults (:class:`G2DBinaryString.G2DBinaryString`)
 ----------------------------------------------------------------------------
@@ -157,6 +225,21 @@ Population constants (:class:`GPopulation.GPopulation`)
 
    The default uniform probability used for some uniform genetic operators for the 2D Binary String (:class:`G2DBinaryString.G2DBinaryString`) chromosome.
 
+2D Packed Binary String Defaults (:class:`G2DBinaryString.G2DBinaryStringPacked`)
+---------------------------------------------------------------------------------
+
+.. attribute:: CDefG2DBinaryStringPackedMutator
+
+   The default mutator for the packed 2D Binary String (:class:`G2DBinaryString.G2DBinaryStringPacked`) chromosome.
+
+.. attribute:: CDefG2DBinaryStringPackedCrossover
+
+   The default crossover method for the packed 2D Binary String (:class:`G2DBinaryString.G2DBinaryStringPacked`) chromosome.
+
+.. attribute:: CDefG2DBinaryStringPackedInit
+
+   The default initializator for the packed 2D Binary String (:class:`G2DBinaryString.G2DBinaryStringPacked`) chromosome.
+
 
 1D List chromosome constants (:class:`G1DList.G1DList`)
 ----------------------------------------------------------------------------
@@ -192,6 +275,47 @@ Tree chromosome constants (:class:`GTree.GTree`)
 .. attribute:: CDefGTreeCrossover
 
    Default crossover of the tree chromosome.
+
+GP Tree chromosome constants (:class:`GTree.GTreeGP`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefGTreeGPCodeCacheSize
+
+   The maximum number of compiled code objects kept by the class-level cache of the GP tree chromosome, see the :meth:`GTree.GTreeGP.getCodeCache`.
+
+.. attribute:: CDefGPProtectedEpsilon
+
+   The smallest absolute value accepted by the protected GP operators (:func:`GTree.protectedDiv` and :func:`GTree.protectedLog`).
+
+Subtree-sharing GP Tree chromosome constants (:class:`GTreeDAG.GTreeGPDAG`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefGTreeGPDAGInit
+
+   Default initializator of the subtree-sharing GP tree chromosome.
+
+.. attribute:: CDefGTreeGPDAGMutator
+
+   Default mutator of the subtree-sharing GP tree chromosome.
+
+.. attribute:: CDefGTreeGPDAGCrossover
+
+   Default crossover of the subtree-sharing GP tree chromosome.
+
+Linear GP Tree chromosome constants (:class:`GTreeLinear.GTreeGPLinear`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefGTreeGPLinearInit
+
+   Default initializator of the linear (prefix array) GP tree chromosome.
+
+.. attribute:: CDefGTreeGPLinearMutator
+
+   Default mutator of the linear (prefix array) GP tree chromosome.
+
+.. attribute:: CDefGTreeGPLinearCrossover
+
+   Default crossover of the linear (prefix array) GP tree chromosome.
   
 
 2D List chromosome constants (:class:`G2DList.G2DList`)
@@ -229,6 +353,25 @@ Tree chromosome constants (:class:`GTree.GTree`)
 
    Default uniform probability for the 2D List Uniform Crossover method (:func:`Crossovers.G2DListCrossoverUniform`).
 
+2D List array chromosome constants (:class:`G2DList.G2DListArray`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefG2DListArrayTypecode
+
+   Default :mod:`array` type code of the genes buffer of the 2D List array chromosome, *'l'* for integers.
+
+.. attribute:: CDefG2DListArrayMutator
+
+   Default mutator for the 2D List array chromosome.
+
+.. attribute:: CDefG2DListArrayCrossover
+
+   Default crossover method for the 2D List array chromosome.
+
+.. attribute:: CDefG2DListArrayInit
+
+   Default initializator for the 2D List array chromosome.
+
 
 GA Engine constants (:class:`GSimpleGA.GSimpleGA`)
 ----------------------------------------------------------------------------
@@ -253,6 +396,17 @@ GA Engine constants (:class:`GSimpleGA.GSimpleGA`)
 
    Default selector method.
 
+Steady-state GA Engine constants (:class:`GSteadyStateGA.GSteadyStateGA`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefSSGAOffspring
+
+   Default number of offspring bred and evaluated each step.
+
+.. attribute:: CDefSSGAReplacement
+
+   Default replacement policy.
+
 DB Adapters constants (:mod:`DBAdapters`)
 ----------------------------------------------------------------------------
 Constants for the DB Adapters
@@ -373,6 +527,8 @@ import Mutators
 import Crossovers
 import logging
 from GTree import GTreeGP
+from GTreeDAG import GTreeGPDAG
+from GTreeLinear import GTreeGPLinear
 
 # Required python version 2.5+
 CDefPythonRequire = (2, 5)
@@ -395,9 +551,17 @@ minimaxType = { "minimize" : 0,
                 "maximize" : 1
                }
 
+# Replacement policies of the steady-state GA Engine
+# - worst: the offspring replaces the worst individual
+# - random: the offspring replaces a random individual
+replacementType = { "worst"  : 0,
+                    "random" : 1
+                  }
+
 CDefESCKey = 27
 
 CDefImportList = {"visual.graph": "you must install VPython !",
+                  "concurrent.futures": "concurrent.futures module not found, you must install the futures package !",
                   "csv" : "csv module not found !",
                   "urllib" : "urllib module not found !",
                   "sqlite3": "sqlite3 module not found, are you using Jython or IronPython ?",
@@ -412,6 +576,15 @@ CDefImportList = {"visual.graph": "you must install VPython !",
 # - Tournament selector
 CDefTournamentPoolSize = 2
 
+# - Selection methods
+CDefLinearRankPressure  = 1.5
+CDefTruncationRate      = 0.5
+CDefSelectionVectorSize = 64
+
+# - Bloat control defaults
+CDefBloatBinWidth      = 5
+CDefBloatMaxRejections = 5
+
 # - Scale methods defaults
 CDefScaleLinearMultiplier     = 1.2
 CDefScaleSigmaTruncMultiplier = 2.0
@@ -424,8 +597,13 @@ CDefScaleBoltzStart           = 40.0
 # - Population Defaults
 CDefPopSortType               = sortType["scaled"]
 CDefPopMinimax                = minimaxType["maximize"]
+CDefPopLazyEvaluation         = False
+CDefPopVectorSize             = 200
 CDefPopScale                  = Scaling.LinearScaling
 
+# - Array Population Defaults
+CDefArrayPopMaxSeed           = 2**31 - 1
+
 # - GA Engine defaults
 CDefGAGenerations    = 100
 CDefGAMutationRate   = 0.02
@@ -434,6 +612,10 @@ CDefGAPopulationSize = 80
 CDefGASelector       = Selectors.GRankSelector
 CDefGAElitismReplacement = 1
 
+# - Steady-state GA Engine defaults
+CDefSSGAOffspring    = 2
+CDefSSGAReplacement  = replacementType["worst"]
+
 # - This is general used by integer/real ranges defaults
 CDefRangeMin = 0
 CDefRangeMax = 100
@@ -444,12 +626,22 @@ CDefG1DBinaryStringCrossover   = Crossovers.G1DBinaryStringXSinglePoint
 CDefG1DBinaryStringInit        = Initializators.G1DBinaryStringInitializator
 CDefG1DBinaryStringUniformProb = 0.5
 
+# - G1DBinaryStringPacked defaults
+CDefG1DBinaryStringPackedMutator     = Mutators.G1DBinaryStringPackedMutatorFlip
+CDefG1DBinaryStringPackedCrossover   = Crossovers.G1DBinaryStringPackedXSinglePoint
+CDefG1DBinaryStringPackedInit        = Initializators.G1DBinaryStringPackedInitializator
+
 # - G2DBinaryString defaults
 CDefG2DBinaryStringMutator     = Mutators.G2DBinaryStringMutatorFlip
 CDefG2DBinaryStringCrossover   = Crossovers.G2DBinaryStringXUniform
 CDefG2DBinaryStringInit        = Initializators.G2DBinaryStringInitializator
 CDefG2DBinaryStringUniformProb = 0.5
 
+# - G2DBinaryStringPacked defaults
+CDefG2DBinaryStringPackedMutator     = Mutators.G2DBinaryStringPackedMutatorFlip
+CDefG2DBinaryStringPackedCrossover   = Crossovers.G2DBinaryStringPackedXUniform
+CDefG2DBinaryStringPackedInit        = Initializators.G2DBinaryStringPackedInitializator
+
 # - GTree defaults
 CDefGTreeInit      = Initializators.GTreeInitializatorInteger
 CDefGGTreeMutator  = Mutators.GTreeMutatorIntegerRange
@@ -459,6 +651,18 @@ CDefGTreeCrossover = Crossovers.GTreeCrossoverSinglePointStrict
 CDefGTreeGPInit      = Initializators.GTreeGPInitializator
 CDefGGTreeGPMutator  = Mutators.GTreeGPMutatorSubtree
 CDefGTreeGPCrossover = Crossovers.GTreeGPCrossoverSinglePoint
+CDefGTreeGPCodeCacheSize = 5000
+CDefGPProtectedEpsilon = 1e-10
+
+# - GTreeGPDAG defaults
+CDefGTreeGPDAGInit      = Initializators.GTreeGPDAGInitializator
+CDefGTreeGPDAGMutator   = Mutators.GTreeGPDAGMutatorSubtree
+CDefGTreeGPDAGCrossover = Crossovers.GTreeGPDAGCrossoverSinglePoint
+
+# - GTreeGPLinear defaults
+CDefGTreeGPLinearInit      = Initializators.GTreeGPLinearInitializator
+CDefGTreeGPLinearMutator   = Mutators.GTreeGPLinearMutatorSubtree
+CDefGTreeGPLinearCrossover = Crossovers.GTreeGPLinearCrossoverSinglePoint
 
 # - G1DList defaults
 CDefG1DListMutIntMU = 2
@@ -489,6 +693,12 @@ CDefG2DListCrossover = Crossovers.G2DListCrossoverUniform
 CDefG2DListInit      = Initializators.G2DListInitializatorInteger
 CDefG2DListCrossUniformProb = 0.5
 
+# - G2DListArray defaults
+CDefG2DListArrayTypecode  = 'l'
+CDefG2DListArrayMutator   = Mutators.G2DListArrayMutatorSwap
+CDefG2DListArrayCrossover = Crossovers.G2DListArrayCrossoverUniform
+CDefG2DListArrayInit      = Initializators.G2DListArrayInitializatorInteger
+
 # - DB Adapters SQLite defaults
 CDefSQLiteDBName = "pyevolve.db"
 CDefSQLiteDBTable = "statistics"
@@ -519,7 +729,7 @@ CDefXMLRPCStatsGenFreq = 20
 CDefBroadcastAddress = "255.255.255.255"
 nodeType = {"TERMINAL" : 0, "NONTERMINAL": 1}
 
-CDefGPGenomes = [GTreeGP]
+CDefGPGenomes = [GTreeGP, GTreeGPDAG, GTreeGPLinear]
 
 # Migration Consts
 CDefGenMigrationRate = 20
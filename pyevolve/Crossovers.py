@@ -96,6 +96,95 @@ def G1DBinaryStringXUniform(genome, **args):
             
    return (sister, brother)
 
+def G1DBinaryStringPackedXSinglePoint(genome, **args):
+   """ The crossover of packed 1D Binary String, Single Point
+
+   .. warning:: You can't use this crossover method for binary strings with length of 1.
+
+   .. versionadded:: 0.6
+      The *G1DBinaryStringPackedXSinglePoint* function
+   """
+   sister = None
+   brother = None
+   gMom = args["mom"]
+   gDad = args["dad"]
+   length = len(gMom)
+
+   if length == 1:
+      Util.raiseException("The Binary String have one element, can't use the Single Point Crossover method !", TypeError)
+
+   cut = rand_randint(1, length-1)
+   mask = (1 << (length - cut)) - 1
+
+   if args["count"] >= 1:
+      sister = gMom.clone()
+      sister.resetStats()
+      sister.setBits((gMom.getBits() & ~mask) | (gDad.getBits() & mask), length)
+
+   if args["count"] == 2:
+      brother = gDad.clone()
+      brother.resetStats()
+      brother.setBits((gDad.getBits() & ~mask) | (gMom.getBits() & mask), length)
+
+   return (sister, brother)
+
+def G1DBinaryStringPackedXTwoPoint(genome, **args):
+   """ The packed 1D Binary String crossover, Two Point
+
+   .. warning:: You can't use this crossover method for binary strings with length of 1.
+
+   .. versionadded:: 0.6
+      The *G1DBinaryStringPackedXTwoPoint* function
+   """
+   sister = None
+   brother = None
+   gMom = args["mom"]
+   gDad = args["dad"]
+   length = len(gMom)
+
+   if length == 1:
+      Util.raiseException("The Binary String have one element, can't use the Two Point Crossover method !", TypeError)
+
+   cuts = [rand_randint(1, length-1), rand_randint(1, length-1)]
+
+   if cuts[0] > cuts[1]:
+      Util.listSwapElement(cuts, 0, 1)
+
+   mask = ((1 << (cuts[1] - cuts[0])) - 1) << (length - cuts[1])
+
+   if args["count"] >= 1:
+      sister = gMom.clone()
+      sister.resetStats()
+      sister.setBits((gMom.getBits() & ~mask) | (gDad.getBits() & mask), length)
+
+   if args["count"] == 2:
+      brother = gDad.clone()
+      brother.resetStats()
+      brother.setBits((gDad.getBits() & ~mask) | (gMom.getBits() & mask), length)
+
+   return (sister, brother)
+
+def G1DBinaryStringPackedXUniform(genome, **args):
+   """ The packed 1D Binary String Uniform Crossover
+
+   .. versionadded:: 0.6
+      The *G1DBinaryStringPackedXUniform* function
+   """
+   gMom = args["mom"]
+   gDad = args["dad"]
+   length = len(gMom)
+
+   sister = gMom.clone()
+   brother = gDad.clone()
+   sister.resetStats()
+   brother.resetStats()
+
+   mask = Util.randomBitMask(length, Consts.CDefG1DBinaryStringUniformProb)
+   sister.setBits((gMom.getBits() & ~mask) | (gDad.getBits() & mask), length)
+   brother.setBits((gDad.getBits() & ~mask) | (gMom.getBits() & mask), length)
+
+   return (sister, brother)
+
 ####################
 ##     1D List    ##
 ####################
@@ -438,6 +527,86 @@ def G2DListCrossoverSingleHPoint(genome, **args):
    return (sister, brother)
 
 
+def G2DListArrayCrossoverUniform(genome, **args):
+   """ The G2DListArray Uniform Crossover, works on the genes buffers
+
+   .. versionadded:: 0.6
+      The *G2DListArrayCrossoverUniform* function
+   """
+   gMom = args["mom"]
+   gDad = args["dad"]
+
+   sister = gMom.clone()
+   brother = gDad.clone()
+   sister.resetStats()
+   brother.resetStats()
+
+   sister_genes = sister.getInternalArray()
+   brother_genes = brother.getInternalArray()
+
+   for i in xrange(len(sister_genes)):
+      if Util.randomFlipCoin(Consts.CDefG2DListCrossUniformProb):
+         sister_genes[i], brother_genes[i] = brother_genes[i], sister_genes[i]
+
+   return (sister, brother)
+
+def G2DListArrayCrossoverSingleVPoint(genome, **args):
+   """ The crossover of G2DListArray, Single Vertical Point, copies
+   one slice of the genes buffer for each row
+
+   .. versionadded:: 0.6
+      The *G2DListArrayCrossoverSingleVPoint* function
+   """
+   sister = None
+   brother = None
+   gMom = args["mom"]
+   gDad = args["dad"]
+
+   height, width = gMom.getSize()
+   cut = rand_randint(1, width-1)
+
+   if args["count"] >= 1:
+      sister = gMom.clone()
+      sister.resetStats()
+      sister_genes, dad_genes = sister.getInternalArray(), gDad.getInternalArray()
+      for row in xrange(0, height*width, width):
+         sister_genes[row+cut:row+width] = dad_genes[row+cut:row+width]
+
+   if args["count"] == 2:
+      brother = gDad.clone()
+      brother.resetStats()
+      brother_genes, mom_genes = brother.getInternalArray(), gMom.getInternalArray()
+      for row in xrange(0, height*width, width):
+         brother_genes[row+cut:row+width] = mom_genes[row+cut:row+width]
+
+   return (sister, brother)
+
+def G2DListArrayCrossoverSingleHPoint(genome, **args):
+   """ The crossover of G2DListArray, Single Horizontal Point, copies
+   a single slice of the genes buffer
+
+   .. versionadded:: 0.6
+      The *G2DListArrayCrossoverSingleHPoint* function
+   """
+   sister = None
+   brother = None
+   gMom = args["mom"]
+   gDad = args["dad"]
+
+   cut = rand_randint(1, gMom.getHeight()-1) * gMom.getWidth()
+
+   if args["count"] >= 1:
+      sister = gMom.clone()
+      sister.resetStats()
+      sister.getInternalArray()[cut:] = gDad.getInternalArray()[cut:]
+
+   if args["count"] == 2:
+      brother = gDad.clone()
+      brother.resetStats()
+      brother.getInternalArray()[cut:] = gMom.getInternalArray()[cut:]
+
+   return (sister, brother)
+
 #############################
 ##     2D Binary String    ##
 #############################
@@ -526,6 +695,89 @@ def G2DBinaryStringXSingleHPoint(genome, **args):
 
    return (sister, brother)
 
+def G2DBinaryStringPackedXUniform(genome, **args):
+   """ The G2DBinaryStringPacked Uniform Crossover, uses a random mask
+   for each row
+   
+   .. versionadded:: 0.6
+      The *G2DBinaryStringPackedXUniform* function
+   """
+   gMom = args["mom"]
+   gDad = args["dad"]
+
+   sister = gMom.clone()
+   brother = gDad.clone()
+   sister.resetStats()
+   brother.resetStats()
+
+   width = gMom.getWidth()
+   sister_rows, brother_rows = sister.getRows(), brother.getRows()
+   mom_rows, dad_rows = gMom.getRows(), gDad.getRows()
+
+   for i in xrange(gMom.getHeight()):
+      mask = Util.randomBitMask(width, Consts.CDefG2DBinaryStringUniformProb)
+      sister_rows[i] = (mom_rows[i] & ~mask) | (dad_rows[i] & mask)
+      brother_rows[i] = (dad_rows[i] & ~mask) | (mom_rows[i] & mask)
+
+   return (sister, brother)
+
+def G2DBinaryStringPackedXSingleVPoint(genome, **args):
+   """ The crossover of G2DBinaryStringPacked, Single Vertical Point
+   
+   .. versionadded:: 0.6
+      The *G2DBinaryStringPackedXSingleVPoint* function
+   """
+   sister = None
+   brother = None
+   gMom = args["mom"]
+   gDad = args["dad"]
+   mom_rows, dad_rows = gMom.getRows(), gDad.getRows()
+
+   cut = rand_randint(1, gMom.getWidth()-1)
+   mask = (1 << (gMom.getWidth() - cut)) - 1
+
+   if args["count"] >= 1:
+      sister = gMom.clone()
+      sister.resetStats()
+      sister_rows = sister.getRows()
+      for i in xrange(sister.getHeight()):
+         sister_rows[i] = (mom_rows[i] & ~mask) | (dad_rows[i] & mask)
+
+   if args["count"] == 2:
+      brother = gDad.clone()
+      brother.resetStats()
+      brother_rows = brother.getRows()
+      for i in xrange(brother.getHeight()):
+         brother_rows[i] = (dad_rows[i] & ~mask) | (mom_rows[i] & mask)
+
+   return (sister, brother)
+
+def G2DBinaryStringPackedXSingleHPoint(genome, **args):
+   """ The crossover of G2DBinaryStringPacked, Single Horizontal Point,
+   the rows are copied as slices of the row words
+   
+   .. versionadded:: 0.6
+      The *G2DBinaryStringPackedXSingleHPoint* function
+   """
+   sister = None
+   brother = None
+   gMom = args["mom"]
+   gDad = args["dad"]
+
+   cut = rand_randint(1, gMom.getHeight()-1)
+
+   if args["count"] >= 1:
+      sister = gMom.clone()
+      sister.resetStats()
+      sister.getRows()[cut:] = gDad.getRows()[cut:]
+
+   if args["count"] == 2:
+      brother = gDad.clone()
+      brother.resetStats()
+      brother.getRows()[cut:] = gMom.getRows()[cut:]
+
+   return (sister, brother)
+
 #############################
 ##          Tree           ##
 #############################
@@ -780,5 +1032,143 @@ def GTreeGPCrossoverSinglePoint(genome, **args):
 
    return (sister, brother)
 
+def GTreeGPDAGCrossoverSinglePoint(genome, **args):
+   """ The crossover of the GTreeGPDAG, Single Point for Genetic Programming,
+   the subtrees are shared by the parents and the offspring, only the nodes
+   on the paths to the crossover points are created
+
+   ..note:: This crossover method creates offspring with restriction of the
+            *max_depth* parameter.
+
+   Accepts the *max_attempt* parameter, *max_depth* (required).
+
+   .. versionadded:: 0.6
+      The *GTreeGPDAGCrossoverSinglePoint* function
+   """
+   sister = None
+   brother = None
+
+   gMom = args["mom"].clone()
+   gDad = args["dad"].clone()
+
+   gMom.resetStats()
+   gDad.resetStats()
+
+   max_depth   = gMom.getParam("max_depth", None)
+   max_attempt = gMom.getParam("max_attempt", 15)
+
+   if max_depth is None:
+      Util.raiseException("You must specify the max_depth genome parameter !", ValueError)
+
+   if max_depth < 0:
+      Util.raiseException("The max_depth must be >= 1, if you want to use GTreeGPDAGCrossoverSinglePoint crossover !", ValueError)
+
+   for i in xrange(max_attempt):
+
+      nodeDad, pathDad = gDad.getRandomPath()
+
+      if nodeDad.getType() == Consts.nodeType["TERMINAL"]:
+         nodeMom, pathMom = gMom.getRandomPath(1)
+      else:
+         nodeMom, pathMom = gMom.getRandomPath(2)
+
+      if nodeMom is None: continue
+
+      mD, dD = len(pathMom), len(pathDad)
+
+      # Two nodes are root
+      if mD==0 and dD==0: continue
+
+      if dD+nodeMom.height > max_depth: continue
+      if mD+nodeDad.height > max_depth: continue
+
+      break
+   else:
+      return (gMom, gDad)
+
+   # Sister
+   if args["count"] >= 1:
+      sister = gMom
+      sister.replaceSubtree(pathMom, nodeDad)
+      assert sister.getHeight() <= max_depth
+
+   # Brother
+   if args["count"] == 2:
+      brother = gDad
+      brother.replaceSubtree(pathDad, nodeMom)
+      assert brother.getHeight() <= max_depth
+
+   return (sister, brother)
+
+def GTreeGPLinearCrossoverSinglePoint(genome, **args):
+   """ The crossover of the GTreeGPLinear, Single Point for Genetic Programming,
+   the subtrees are swapped as slices of the prefix programs
+
+   ..note:: This crossover method creates offspring with restriction of the
+            *max_depth* parameter.
+
+   Accepts the *max_attempt* parameter, *max_depth* (required).
+
+   .. versionadded:: 0.6
+      The *GTreeGPLinearCrossoverSinglePoint* function
+   """
+   sister = None
+   brother = None
+
+   gMom = args["mom"].clone()
+   gDad = args["dad"].clone()
+
+   gMom.resetStats()
+   gDad.resetStats()
+
+   max_depth   = gMom.getParam("max_depth", None)
+   max_attempt = gMom.getParam("max_attempt", 15)
+
+   if max_depth is None:
+      Util.raiseException("You must specify the max_depth genome parameter !", ValueError)
+
+   if max_depth < 0:
+      Util.raiseException("The max_depth must be >= 1, if you want to use GTreeGPLinearCrossoverSinglePoint crossover !", ValueError)
+
+   for i in xrange(max_attempt):
+
+      indexDad = gDad.getRandomIndex()
+
+      if gDad.arities[indexDad] == 0:
+         indexMom = gMom.getRandomIndex(1)
+      else:
+         indexMom = gMom.getRandomIndex(2)
+
+      if indexMom is None: continue
+
+      mD, dD = gMom.getNodeDepth(indexMom), gDad.getNodeDepth(indexDad)
+
+      # Two nodes are root
+      if mD==0 and dD==0: continue
+
+      if dD+gMom.getNodeHeight(indexMom) > max_depth: continue
+      if mD+gDad.getNodeHeight(indexDad) > max_depth: continue
+
+      break
+   else:
+      return (gMom, gDad)
+
+   subtreeMom = gMom.getSubtree(indexMom)
+   subtreeDad = gDad.getSubtree(indexDad)
+
+   # Sister
+   if args["count"] >= 1:
+      sister = gMom
+      sister.replaceSubtree(indexMom, *subtreeDad)
+      assert sister.getHeight() <= max_depth
+
+   # Brother
+   if args["count"] == 2:
+      brother = gDad
+      brother.replaceSubtree(indexDad, *subtreeMom)
+      assert brother.getHeight() <= max_depth
+
+   return (sister, brother)
+
 
 
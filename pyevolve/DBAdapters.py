@@ -245,7 +245,7 @@ class DBURLPost(DBBaseAdapter):
       logging.debug("Sending http request to %s.", self.url)
       stats = ga_engine.getStatistics()
       response = None
-      params = stats.internalDict.copy()
+      params = dict(stats.items())
       params["generation"] = ga_engine.getCurrentGeneration()
       params["identify"] = self.getIdentify()
       if self.post: # POST
@@ -296,6 +296,7 @@ class DBSQLite(DBBaseAdapter):
       self.typeDict = { types.FloatType : "real" }
       self.cursorPool = None
       self.commitFreq = commit_freq
+      self.statsColumns = None
 
    def __repr__(self):
       """ The string representation of adapter """
@@ -365,6 +366,7 @@ class DBSQLite(DBBaseAdapter):
 
       """
       c = self.getCursor()
+      self.statsColumns = None
       pstmt = "create table if not exists %s(identify text, generation integer, " % (Consts.CDefSQLiteDBTable)
       for k, v in stats.items():
          pstmt += "%s %s, " % (k, self.typeDict[type(v)])
@@ -408,6 +410,27 @@ class DBSQLite(DBBaseAdapter):
       self.commit()
       self.createStructure(stats)
       
+   def addColumns(self, stats):
+      """ Add the columns of the statistics that the table doesn't have yet,
+      like the ones that apply only to some runs or a table created by a
+      previous version
+
+      :param stats: the statistics object
+
+      .. versionadded:: 0.6
+      """
+      c = self.getCursor()
+      if self.statsColumns is None:
+         c.execute("pragma table_info(%s)" % (Consts.CDefSQLiteDBTable,))
+         self.statsColumns = [row[1] for row in c.fetchall()]
+
+      for k, v in stats.items():
+         if k in self.statsColumns: continue
+         pstmt = "alter table %s add column %s %s" % (Consts.CDefSQLiteDBTable, k, self.typeDict[type(v)])
+         logging.debug("Adding the column %s: %s.", k, pstmt)
+         c.execute(pstmt)
+         self.statsColumns.append(k)
+
    def insert(self, ga_engine):
       """ Inserts the statistics data to database
 
@@ -421,11 +444,13 @@ class DBSQLite(DBBaseAdapter):
       generation = ga_engine.getCurrentGeneration()
 
       c = self.getCursor()
-      pstmt = "insert into %s values (?, ?, " % (Consts.CDefSQLiteDBTable)
-      for i in xrange(len(stats)):
-         pstmt += "?, "
-      pstmt = pstmt[:-2] + ")" 
-      c.execute(pstmt, (self.getIdentify(), generation) + stats.asTuple())
+      self.addColumns(stats)
+      items = stats.items()
+      pstmt = "insert into %s(identify, generation" % (Consts.CDefSQLiteDBTable)
+      for k, v in items:
+         pstmt += ", %s" % (k,)
+      pstmt += ") values (?, ?" + ", ?" * len(items) + ")"
+      c.execute(pstmt, (self.getIdentify(), generation) + tuple([v for k, v in items]))
 
       pstmt = "insert into %s values(?, ?, ?, ?, ?)" % (Consts.CDefSQLiteDBTablePop,)
       tups = []
@@ -512,7 +537,7 @@ class DBXMLRPC(DBBaseAdapter):
       """
       stats = ga_engine.getStatistics()
       generation = ga_engine.getCurrentGeneration()
-      di = stats.internalDict.copy()
+      di = dict(stats.items())
       di.update({"identify": self.getIdentify(), "generation": generation})
       self.proxy.insert(di)
 
@@ -652,6 +677,7 @@ class DBMySQLAdapter(DBBaseAdapter):
       self.typeDict = { types.FloatType : "DOUBLE(14,6)" }
       self.cursorPool = None
       self.commitFreq = commit_freq
+      self.statsColumns = None
 
    def __repr__(self):
       """ The string representation of adapter """
@@ -722,6 +748,7 @@ class DBMySQLAdapter(DBBaseAdapter):
 
       """
       c = self.getCursor()
+      self.statsColumns = None
       pstmt = "create table if not exists %s(identify VARCHAR(80), generation INTEGER, " % (Consts.CDefMySQLDBTable)
       for k, v in stats.items():
          pstmt += "%s %s, " % (k, self.typeDict[type(v)])
@@ -761,6 +788,27 @@ class DBMySQLAdapter(DBBaseAdapter):
       self.commit()
       self.createStructure(stats)
       
+   def addColumns(self, stats):
+      """ Add the columns of the statistics that the table doesn't have yet,
+      like the ones that apply only to some runs or a table created by a
+      previous version
+
+      :param stats: the statistics object
+
+      .. versionadded:: 0.6
+      """
+      c = self.getCursor()
+      if self.statsColumns is None:
+         c.execute("show columns from %s" % (Consts.CDefMySQLDBTable,))
+         self.statsColumns = [row[0] for row in c.fetchall()]
+
+      for k, v in stats.items():
+         if k in self.statsColumns: continue
+         pstmt = "alter table %s add column %s %s" % (Consts.CDefMySQLDBTable, k, self.typeDict[type(v)])
+         logging.debug("Adding the column %s: %s.", k, pstmt)
+         c.execute(pstmt)
+         self.statsColumns.append(k)
+
    def insert(self, ga_engine):
       """ Inserts the statistics data to database
 
@@ -774,11 +822,13 @@ class DBMySQLAdapter(DBBaseAdapter):
       generation = ga_engine.getCurrentGeneration()
 
       c = self.getCursor()
-      pstmt = "insert into " + Consts.CDefMySQLDBTable + " values (%s, %s, "
-      for i in xrange(len(stats)):
-         pstmt += "%s, "
-      pstmt = pstmt[:-2] + ")" 
-      c.execute(pstmt, (self.getIdentify(), generation) + stats.asTuple())
+      self.addColumns(stats)
+      items = stats.items()
+      pstmt = "insert into " + Consts.CDefMySQLDBTable + "(identify, generation"
+      for k, v in items:
+         pstmt += ", " + k
+      pstmt += ") values (%s, %s" + ", %s" * len(items) + ")"
+      c.execute(pstmt, (self.getIdentify(), generation) + tuple([v for k, v in items]))
 
       pstmt = "insert into " + Consts.CDefMySQLDBTablePop + " values(%s, %s, %s, %s, %s)"
 
@@ -198,8 +198,10 @@ class FunctionSlot:
          return strRet
 
       for f, w in zip(self.funcList, self.funcWeights):
-         strRet += "\t\tName: %s - Weight: %.2f\n" % (f.func_name, w)
-         if f.func_doc:
-            strRet += "\t\tDoc: " + f.func_doc + "\n"
+         # The callable objects, like the selectors, don't have a func_name
+         name = getattr(f, "func_name", f.__class__.__name__)
+         strRet += "\t\tName: %s - Weight: %.2f\n" % (name, w)
+         if f.__doc__:
+            strRet += "\t\tDoc: " + f.__doc__ + "\n"
 
       return strRet
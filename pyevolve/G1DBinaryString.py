@@ -27,6 +27,12 @@ Default Parameters
 
    The Single Point Crossover for G1DBinaryString
 
+The :class:`G1DBinaryString.G1DBinaryStringPacked` class has the same interface,
+but it keeps the bits in a single integer, its defaults are the packed operators
+:func:`Initializators.G1DBinaryStringPackedInitializator`,
+:func:`Mutators.G1DBinaryStringPackedMutatorFlip` and
+:func:`Crossovers.G1DBinaryStringPackedXSinglePoint`.
+
 
 Class
 -------------------------------------------------------------
@@ -88,15 +94,16 @@ class G1DBinaryString(GenomeBase, G1DBase):
    """
 
 
-   def __init__(self, length=10):
+   def __init__(self, length=10, cloning=False):
       """ The initializator of G1DList representation """
-      GenomeBase.__init__(self)
+      GenomeBase.__init__(self, cloning)
       G1DBase.__init__(self, length)
       self.genomeList = []
       self.stringLength = length
-      self.initializator.set(Consts.CDefG1DBinaryStringInit)
-      self.mutator.set(Consts.CDefG1DBinaryStringMutator)
-      self.crossover.set(Consts.CDefG1DBinaryStringCrossover)
+      if not cloning:
+         self.initializator.set(Consts.CDefG1DBinaryStringInit)
+         self.mutator.set(Consts.CDefG1DBinaryStringMutator)
+         self.crossover.set(Consts.CDefG1DBinaryStringCrossover)
 
    def __setitem__(self, key, value):
       """ Set the specified value for an gene of List
@@ -198,6 +205,321 @@ class G1DBinaryString(GenomeBase, G1DBase):
       :rtype: the G1DBinaryString instance clone
 
       """
-      newcopy = G1DBinaryString(self.getListSize())
+      newcopy = G1DBinaryString(self.getListSize(), True)
+      self.copy(newcopy)
+      return newcopy
+
+class G1DBinaryStringPacked(GenomeBase):
+   """ G1DBinaryStringPacked Class - The 1D Binary String chromosome, packed
+   
+   Inheritance diagram for :class:`G1DBinaryString.G1DBinaryStringPacked`:
+
+   .. inheritance-diagram:: G1DBinaryString.G1DBinaryStringPacked
+
+   This chromosome has the same interface of the :class:`G1DBinaryString.G1DBinaryString`,
+   so it can be used with the G1DBinaryString genetic operators, but the bits are
+   stored in a single python integer instead of a list of integers. The first bit of
+   the string is the most significant bit of the integer, so the *getDecimal* method
+   just returns the integer.
+
+   The packed operators (like :func:`Mutators.G1DBinaryStringPackedMutatorFlip`)
+   work on the integer using bitwise operations, without accessing each bit.
+   
+   Example:
+      >>> genome = G1DBinaryString.G1DBinaryStringPacked(10000)
+
+   :param length: the 1D Binary String size
+
+   .. versionadded:: 0.6
+      The *G1DBinaryStringPacked* class.
+   """
+
+   def __init__(self, length=10, cloning=False):
+      """ The initializator of G1DBinaryStringPacked representation """
+      GenomeBase.__init__(self, cloning)
+      self.stringLength = length
+      self.bitLength = 0
+      self.bits = 0
+      if not cloning:
+         self.initializator.set(Consts.CDefG1DBinaryStringPackedInit)
+         self.mutator.set(Consts.CDefG1DBinaryStringPackedMutator)
+         self.crossover.set(Consts.CDefG1DBinaryStringPackedCrossover)
+
+   def __checkIndex(self, key):
+      """ Returns the non-negative index of the key """
+      if key < 0:
+         key += self.bitLength
+      if key < 0 or key >= self.bitLength:
+         raise IndexError("binary string index out of range")
+      return key
+
+   def __getitem__(self, key):
+      """ Return the specified bit of the string """
+      if isinstance(key, slice):
+         return [self[i] for i in xrange(*key.indices(self.bitLength))]
+      return (self.bits >> (self.bitLength - 1 - self.__checkIndex(key))) & 1
+
+   def __setitem__(self, key, value):
+      """ Set the specified bit of the string
+
+      >>> g = G1DBinaryStringPacked(5)
+      >>> g.setInternalList([0, 0, 0, 0, 1])
+      >>> g[4] = 0
+      >>> g[4]
+      0
+
+      """
+      if isinstance(key, slice):
+         for i, v in zip(xrange(*key.indices(self.bitLength)), value):
+            self[i] = v
+         return
+      if value not in (0, 1):
+         Util.raiseException("The value must be zero (0) or one (1), used (%s)" % value, ValueError)
+      mask = 1 << (self.bitLength - 1 - self.__checkIndex(key))
+      if value:
+         self.bits |= mask
+      else:
+         self.bits &= ~mask
+      self.modified = True
+
+   def __getslice__(self, a, b):
+      """ Return the sliced part of the string as a list of bits """
+      a, b = max(0, a), min(b, self.bitLength)
+      if b <= a: return []
+      word = (self.bits >> (self.bitLength - b)) & ((1 << (b - a)) - 1)
+      return bitsToList(word, b - a)
+
+   def __setslice__(self, a, b, val):
+      """ Sets the slice part of the string, *val* is a sequence of bits """
+      a, b = min(max(0, a), self.bitLength), min(b, self.bitLength)
+      if b < a: b = a
+      val = list(val)
+      tail = self.bitLength - b
+      head = self.bits >> (self.bitLength - a)
+      self.bits = (((head << len(val)) | listToBits(val)) << tail) | (self.bits & ((1 << tail) - 1))
+      self.bitLength = a + len(val) + tail
+      self.modified = True
+
+   def __iter__(self):
+      """ Iterator support to the bits """
+      return iter(self.getInternalList())
+
+   def __len__(self):
+      """ Return the size of the string """
+      return self.bitLength
+
+   def __iadd__(self, value):
+      """ To add more bits using the += operator """
+      self.append(value)
+      return self
+
+   def __contains__(self, value):
+      """ Used on: *value in genome* """
+      if value == 1: return self.bits != 0
+      if value == 0: return self.countOnes() < self.bitLength
+      return False
+
+   def __eq__(self, other):
+      """ Compares one chromosome with another """
+      cond1 = (self.bits == other.bits)
+      cond2 = (self.bitLength == other.bitLength)
+      cond3 = (self.stringLength == other.stringLength)
+      return True if cond1 and cond2 and cond3 else False
+
+   def __repr__(self):
+      """ Return a string representation of Genome """
+      ret = GenomeBase.__repr__(self)
+      ret += "- G1DBinaryStringPacked\n"
+      ret += "\tString length:\t %s\n" % (self.getListSize(),)
+      ret += "\tString:\t\t %s\n\n" % (self.getBinary(),)
+      return ret
+
+   def getListSize(self):
+      """ Returns the string supposed size
+
+      .. warning:: this is different from what the len(obj) returns
+      """
+      return self.stringLength
+
+   def getBits(self):
+      """ Returns the integer with the bits of the string, the first
+      bit of the string is the most significant bit
+
+      :rtype: the integer
+      """
+      return self.bits
+
+   def setBits(self, bits, length=None):
+      """ Sets the integer with the bits of the string
+
+      Example:
+         >>> g = G1DBinaryStringPacked(4)
+         >>> g.setBits(5)
+         >>> g.getBinary()
+         '0101'
+
+      :param bits: the integer, the first bit of the string is the most
+                   significant bit
+      :param length: the number of bits, if None, the string size is used
+      """
+      if length is None:
+         length = self.stringLength
+      self.bitLength = length
+      self.bits = bits & ((1 << length) - 1)
+      self.modified = True
+
+   def countOnes(self):
+      """ Returns the number of bits set to one
+
+      :rtype: the number of ones
+      """
+      return Util.bitCount(self.bits)
+
+   def getDecimal(self):
+      """ Converts the binary string to decimal representation
+
+      Example:
+         >>> g = G1DBinaryStringPacked(5)
+         >>> g.setInternalList([0, 0, 0, 1, 0])
+         >>> g.getDecimal()
+         2
+
+      :rtype: decimal value
+
+      """
+      return self.bits
+
+   def getBinary(self):
+      """ Returns the binary string representation
+
+      Example:
+         >>> g = G1DBinaryStringPacked(2)
+         >>> g.append(0)
+         >>> g.append(1)
+         >>> g.getBinary()
+         '01'
+
+      :rtype: the binary string
+
+      """
+      if self.bitLength == 0: return ""
+      return Util.bitsToString(self.bits, self.bitLength)
+
+   def resumeString(self):
+      """ Returns a resumed string representation of the Genome """
+      return self.getBinary()
+
+   def append(self, value):
+      """ Appends a bit to the string
+
+      Example:
+         >>> g = G1DBinaryStringPacked(2)
+         >>> g.append(0)
+
+      :param value: value to be added, 0 or 1
+
+      """
+      if value not in (0, 1):
+         Util.raiseException("The value must be 0 or 1", ValueError)
+      self.bits = (self.bits << 1) | value
+      self.bitLength += 1
+      self.modified = True
+
+   def clearList(self):
+      """ Remove all bits from the string """
+      self.bits = 0
+      self.bitLength = 0
+      self.modified = True
+
+   def getInternalList(self):
+      """ Returns a new list with the bits of the string
+
+      .. note:: changes on the returned list are not reflected on the string,
+                use the *setInternalList* method
+      :rtype: the list of bits
+      """
+      return bitsToList(self.bits, self.bitLength)
+
+   def setInternalList(self, lst):
+      """ Assigns a list of bits to the string
+      
+      :param lst: the list of bits
+      """
+      self.bits = listToBits(lst)
+      self.bitLength = len(lst)
+      self.modified = True
+
+   def exportGenes(self):
+      """ Returns a compact copy of the genes, used to send the genome
+      data to another process without the genome object itself
+
+      :rtype: a tuple with the string length and the bits integer
+      """
+      return (self.bitLength, self.bits)
+
+   def importGenes(self, genes):
+      """ Replaces the genes with the genes returned by *exportGenes*
+
+      :param genes: the genes tuple
+      """
+      self.bitLength, self.bits = genes
+      self.modified = True
+
+   def copy(self, g):
+      """ Copy genome to 'g'
+
+      :param g: the destination genome
+
+      """
+      GenomeBase.copy(self, g)
+      g.stringLength = self.stringLength
+      g.bitLength = self.bitLength
+      g.bits = self.bits
+   
+   def clone(self):
+      """ Return a new instace copy of the genome
+
+      :rtype: the G1DBinaryStringPacked instance clone
+
+      """
+      newcopy = G1DBinaryStringPacked(self.stringLength, True)
       self.copy(newcopy)
       return newcopy
+
+def bitsToList(bits, length):
+   """ Returns the list of bits of an integer, the first element of the
+   list is the most significant bit
+
+   Example:
+      >>> G1DBinaryString.bitsToList(5, 4)
+      [0, 1, 0, 1]
+
+   :param bits: the integer
+   :param length: the number of bits
+   :rtype: the list of bits
+
+   .. versionadded:: 0.6
+      The *bitsToList* function
+   """
+   if length <= 0: return []
+   return map(int, Util.bitsToString(bits, length))
+
+def listToBits(lst):
+   """ Returns the integer of a list of bits, the first element of the
+   list is the most significant bit
+
+   Example:
+      >>> G1DBinaryString.listToBits([0, 1, 0, 1])
+      5
+
+   :param lst: the list of bits
+   :rtype: the integer
+
+   .. versionadded:: 0.6
+      The *listToBits* function
+   """
+   if len(lst) == 0: return 0
+   for value in lst:
+      if value not in (0, 1):
+         Util.raiseException("The value must be zero (0) or one (1), used (%s)" % value, ValueError)
+   return int("".join(map(str, lst)), 2)
@@ -139,7 +139,7 @@ class G1DList(GenomeBase, G1DBase):
    def __init__(self, size=10, cloning=False):
       """ The initializator of G1DList representation,
       size parameter must be specified """
-      GenomeBase.__init__(self)
+      GenomeBase.__init__(self, cloning)
       G1DBase.__init__(self, size)
       if not cloning:
          self.initializator.set(Consts.CDefG1DListInit)
@@ -31,6 +31,12 @@ Default Parameters
 
    The Single Point Crossover for G2DBinaryString
 
+The :class:`G2DBinaryString.G2DBinaryStringPacked` class keeps each row in a
+single integer, its defaults are the packed operators
+:func:`Initializators.G2DBinaryStringPackedInitializator`,
+:func:`Mutators.G2DBinaryStringPackedMutatorFlip` and
+:func:`Crossovers.G2DBinaryStringPackedXUniform`.
+
 .. versionadded:: 0.6
    Added the module :mod:`G2DBinaryString`
 
@@ -39,6 +45,7 @@ Class
 """
 
 from GenomeBase import GenomeBase
+from G1DBinaryString import bitsToList
 import Consts
 import Util
     
@@ -91,10 +98,10 @@ class G2DBinaryString(GenomeBase):
    """
 
 
-   def __init__(self, height, width):
+   def __init__(self, height, width, cloning=False):
       """ The initializator of G2DBinaryString representation,
       height and width must be specified """
-      GenomeBase.__init__(self)
+      GenomeBase.__init__(self, cloning)
       self.height = height
       self.width = width
 
@@ -102,9 +109,10 @@ class G2DBinaryString(GenomeBase):
       for i in xrange(height):
          self.genomeString[i] = [None] * width
 
-      self.initializator.set(Consts.CDefG2DBinaryStringInit)
-      self.mutator.set(Consts.CDefG2DBinaryStringMutator)
-      self.crossover.set(Consts.CDefG2DBinaryStringCrossover)
+      if not cloning:
+         self.initializator.set(Consts.CDefG2DBinaryStringInit)
+         self.mutator.set(Consts.CDefG2DBinaryStringMutator)
+         self.crossover.set(Consts.CDefG2DBinaryStringCrossover)
    
    def __eq__(self, other):
       """ Compares one chromosome with another """
@@ -141,6 +149,7 @@ class G2DBinaryString(GenomeBase):
       if value not in [0,1]:
          Util.raiseException("The item value must be 0 or 1 in the G2DBinaryString chromosome", ValueError)
       self.genomeString[x][y] = value
+      self.modified = True
 
 
    def __getitem__(self, key):
@@ -202,7 +211,30 @@ class G2DBinaryString(GenomeBase):
       self.genomeString = [None]* self.height
       for i in xrange(self.height):
          self.genomeString[i] = [None] * self.width
+      self.modified = True
    
+   def exportGenes(self):
+      """ Returns a compact copy of the genes, used to send the genome
+      data to another process without the genome object itself
+
+      :rtype: a tuple with the rows, each row as a tuple
+
+      .. versionadded:: 0.6
+         The *exportGenes* method.
+      """
+      return tuple([tuple(row) for row in self.genomeString])
+
+   def importGenes(self, genes):
+      """ Replaces the genes with the genes returned by *exportGenes*
+
+      :param genes: the genes tuple
+
+      .. versionadded:: 0.6
+         The *importGenes* method.
+      """
+      self.genomeString = [list(row) for row in genes]
+      self.modified = True
+
    def copy(self, g):
       """ Copy genome to 'g'
       
@@ -224,7 +256,214 @@ class G2DBinaryString(GenomeBase):
       :rtype: the G2DBinaryString clone instance
 
       """
-      newcopy = G2DBinaryString(self.height, self.width)
+      newcopy = G2DBinaryString(self.height, self.width, True)
       self.copy(newcopy)
       return newcopy
 
+
+class G2DBinaryStringPacked(GenomeBase):
+   """ G2DBinaryStringPacked Class - The 2D Binary String chromosome, packed
+   
+   Inheritance diagram for :class:`G2DBinaryString.G2DBinaryStringPacked`:
+
+   .. inheritance-diagram:: G2DBinaryString.G2DBinaryStringPacked
+
+   Each row of this chromosome is stored in a single python integer (a word),
+   the first column is the most significant bit of the word. The row words are
+   immutable, so the clone just copies the list of words and the clones share
+   the rows until they are changed.
+
+   The *getItem*/*setItem* methods are the same of the
+   :class:`G2DBinaryString.G2DBinaryString`, but the rows returned by the
+   *[]* operator are tuples, they can't be changed in place. The packed
+   operators (like :func:`Crossovers.G2DBinaryStringPackedXUniform`) work
+   on the row words.
+
+   Example:
+      >>> genome = G2DBinaryString.G2DBinaryStringPacked(512, 512)
+
+   :param height: the number of rows
+   :param width: the number of columns
+
+   .. versionadded:: 0.6
+      The *G2DBinaryStringPacked* class.
+   """
+
+   def __init__(self, height, width, cloning=False):
+      """ The initializator of G2DBinaryStringPacked representation,
+      height and width must be specified """
+      GenomeBase.__init__(self, cloning)
+      self.height = height
+      self.width = width
+      self.rows = [0] * height
+
+      if not cloning:
+         self.initializator.set(Consts.CDefG2DBinaryStringPackedInit)
+         self.mutator.set(Consts.CDefG2DBinaryStringPackedMutator)
+         self.crossover.set(Consts.CDefG2DBinaryStringPackedCrossover)
+
+   def __eq__(self, other):
+      """ Compares one chromosome with another """
+      cond1 = (self.rows == other.rows)
+      cond2 = (self.height == other.height)
+      cond3 = (self.width == other.width)
+      return True if cond1 and cond2 and cond3 else False
+
+   def getItem(self, x, y):
+      """ Return the specified gene of List
+
+      Example:
+         >>> genome.getItem(3, 1)
+         0
+      
+      :param x: the x index, the row
+      :param y: the y index, the column
+      :rtype: the item at x,y position
+      
+      """
+      return (self.rows[x] >> (self.width - 1 - y)) & 1
+
+   def setItem(self, x, y, value):
+      """ Set the specified gene of List
+
+      Example:
+         >>> genome.setItem(3, 1, 0)
+      
+      :param x: the x index, the row
+      :param y: the y index, the column
+      :param value: the value (integers 0 or 1)
+      
+      """
+      if value not in (0, 1):
+         Util.raiseException("The item value must be 0 or 1 in the G2DBinaryString chromosome", ValueError)
+      mask = 1 << (self.width - 1 - y)
+      if value:
+         self.rows[x] |= mask
+      else:
+         self.rows[x] &= ~mask
+      self.modified = True
+
+   def getRow(self, x):
+      """ Returns the word of a row, the first column is the most significant bit
+
+      :param x: the row index
+      :rtype: the row integer
+      """
+      return self.rows[x]
+
+   def setRow(self, x, word):
+      """ Sets the word of a row, the first column is the most significant bit
+
+      :param x: the row index
+      :param word: the row integer
+      """
+      self.rows[x] = word & ((1 << self.width) - 1)
+      self.modified = True
+
+   def getRows(self):
+      """ Returns the list of row words
+
+      .. note:: if you change the list, you must call the *setModified* method
+      :rtype: the list of row integers
+      """
+      return self.rows
+
+   def __getitem__(self, key):
+      """ Return the specified row as a tuple of bits """
+      return tuple(bitsToList(self.rows[key], self.width))
+
+   def __iter__(self):
+      """ Iterator support to the rows, each row is a tuple of bits """
+      for i in xrange(self.height):
+         yield self[i]
+
+   def getHeight(self):
+      """ Return the height (lines) of the List """
+      return self.height
+
+   def getWidth(self):
+      """ Return the width (lines) of the List """
+      return self.width
+
+   def getSize(self):
+      """ Returns a tuple (height, widht)
+   
+      Example:
+         >>> genome.getSize()
+         (3, 2)
+
+      """
+      return (self.getHeight(), self.getWidth())
+
+   def countOnes(self):
+      """ Returns the number of bits set to one
+
+      :rtype: the number of ones
+      """
+      return sum([Util.bitCount(word) for word in self.rows])
+
+   def __repr__(self):
+      """ Return a string representation of Genome """
+      ret = GenomeBase.__repr__(self)
+      ret += "- G2DBinaryStringPacked\n"
+      ret += "\tList size:\t %s\n" % (self.getSize(),)
+      ret += "\tList:\n"
+      for line in self:
+         ret += "\t\t\t"
+         for item in line:
+            ret += "[%s] " % (item)
+         ret += "\n"
+      ret += "\n"
+      return ret
+
+   def resumeString(self):
+      """ Returns a resumed string representation of the Genome """
+      ret = ""
+      for word in self.rows:
+         ret += Util.bitsToString(word, self.width) + "\n"
+      return ret
+
+   def clearString(self):
+      """ Sets all genes to zero """
+      self.rows = [0] * self.height
+      self.modified = True
+
+   def exportGenes(self):
+      """ Returns a compact copy of the genes, used to send the genome
+      data to another process without the genome object itself
+
+      :rtype: a tuple with the row words
+      """
+      return tuple(self.rows)
+
+   def importGenes(self, genes):
+      """ Replaces the genes with the genes returned by *exportGenes*
+
+      :param genes: the genes tuple
+      """
+      self.rows = list(genes)
+      self.modified = True
+
+   def copy(self, g):
+      """ Copy genome to 'g'
+      
+      Example:
+         >>> genome_origin.copy(genome_destination)
+      
+      :param g: the destination G2DBinaryStringPacked instance
+
+      """
+      GenomeBase.copy(self, g)
+      g.height = self.height
+      g.width = self.width
+      g.rows = self.rows[:]
+   
+   def clone(self):
+      """ Return a new instace copy of the genome
+      
+      :rtype: the G2DBinaryStringPacked clone instance
+
+      """
+      newcopy = G2DBinaryStringPacked(0, self.width, True)
+      self.copy(newcopy)
+      return newcopy
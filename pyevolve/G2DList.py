@@ -28,6 +28,12 @@ Default Parameters
 
    The Uniform Crossover for G2DList
 
+The :class:`G2DList.G2DListArray` keeps the genes in a single flat
+:class:`array.array`, its defaults are the
+:func:`Initializators.G2DListArrayInitializatorInteger`,
+:func:`Mutators.G2DListArrayMutatorSwap` and
+:func:`Crossovers.G2DListArrayCrossoverUniform`.
+
 
 Class
 -------------------------------------------------------------
@@ -36,7 +42,9 @@ Class
 """
 
 from GenomeBase import GenomeBase
+from array import array
 import Consts
+import Util
     
 class G2DList(GenomeBase):
    """ G2DList Class - The 2D List chromosome representation
@@ -121,7 +129,7 @@ class G2DList(GenomeBase):
    def __init__(self, height, width, cloning=False):
       """ The initializator of G2DList representation,
       height and width must be specified """
-      GenomeBase.__init__(self)
+      GenomeBase.__init__(self, cloning)
       self.height = height
       self.width = width
 
@@ -169,6 +177,7 @@ class G2DList(GenomeBase):
       
       """
       self.genomeList[x][y] = value
+      self.modified = True
 
    def __getitem__(self, key):
       """ Return the specified gene of List """
@@ -230,7 +239,30 @@ class G2DList(GenomeBase):
       self.genomeList = [None]* self.height
       for i in xrange(self.height):
          self.genomeList[i] = [None] * self.width
+      self.modified = True
    
+   def exportGenes(self):
+      """ Returns a compact copy of the genes, used to send the genome
+      data to another process without the genome object itself
+
+      :rtype: a tuple with the rows, each row as a tuple
+
+      .. versionadded:: 0.6
+         The *exportGenes* method.
+      """
+      return tuple([tuple(row) for row in self.genomeList])
+
+   def importGenes(self, genes):
+      """ Replaces the genes with the genes returned by *exportGenes*
+
+      :param genes: the genes tuple
+
+      .. versionadded:: 0.6
+         The *importGenes* method.
+      """
+      self.genomeList = [list(row) for row in genes]
+      self.modified = True
+
    def copy(self, g):
       """ Copy genome to 'g'
       
@@ -257,3 +289,264 @@ class G2DList(GenomeBase):
       return newcopy
 
 
+class G2DListArrayRow:
+   """ A row of the :class:`G2DList.G2DListArray`, it's a view of the
+   flat genes buffer, so the changes are made in the genome.
+
+   :param genome: the G2DListArray instance
+   :param row: the row index
+
+   .. versionadded:: 0.6
+      The *G2DListArrayRow* class.
+   """
+
+   def __init__(self, genome, row):
+      self.genome = genome
+      self.start = row * genome.width
+
+   def __len__(self):
+      """ Returns the row width """
+      return self.genome.width
+
+   def __getitem__(self, key):
+      """ Returns the item or a slice of the row """
+      genome = self.genome
+      if isinstance(key, slice):
+         genes = genome.genomeArray
+         return [genes[self.start+i] for i in xrange(*key.indices(genome.width))]
+      if key < 0: key += genome.width
+      if not 0 <= key < genome.width:
+         raise IndexError("row index out of range")
+      return genome.genomeArray[self.start+key]
+
+   def __setitem__(self, key, value):
+      """ Sets the item or a slice of the row, the slice
+      size can't be changed """
+      genome = self.genome
+      if isinstance(key, slice):
+         indexes = xrange(*key.indices(genome.width))
+         value = array(genome.typecode, value)
+         if len(value) != len(indexes):
+            Util.raiseException("The row slice has %d items, %d were given, the row size can't be changed" % (len(indexes), len(value)), ValueError)
+         genes = genome.genomeArray
+         for i, item in zip(indexes, value):
+            genes[self.start+i] = item
+      else:
+         if key < 0: key += genome.width
+         if not 0 <= key < genome.width:
+            raise IndexError("row index out of range")
+         genome.genomeArray[self.start+key] = value
+      genome.modified = True
+
+   def __iter__(self):
+      """ Iterator support to the row items """
+      return iter(self.genome.genomeArray[self.start:self.start+self.genome.width])
+
+   def __eq__(self, other):
+      """ Compares the row with another sequence """
+      return list(self) == list(other)
+
+   def __ne__(self, other):
+      return not self.__eq__(other)
+
+   def __repr__(self):
+      """ Return a string representation of the row """
+      return repr(self[:])
+
+class G2DListArray(GenomeBase):
+   """ G2DListArray Class - The 2D List chromosome stored in a flat array
+
+   Inheritance diagram for :class:`G2DList.G2DListArray`:
+
+   .. inheritance-diagram:: G2DList.G2DListArray
+
+   This is the same chromosome of the :class:`G2DList.G2DList`, but the genes
+   are kept in a single typed buffer (:class:`array.array`), in row-major
+   order. The clone is a single copy of the buffer and the genetic operators
+   of this class work on slices of the buffer.
+
+   The *getItem*/*setItem* methods work as in the G2DList, the *[]* operator
+   returns a :class:`G2DList.G2DListArrayRow` view of the row, so the
+   *genome[i][j]* syntax and the G2DList operators can still be used.
+
+   Example:
+      >>> genome = G2DList.G2DListArray(200, 200)
+      >>> genome = G2DList.G2DListArray(20, 20, 'd')
+
+   :param height: the number of rows
+   :param width: the number of columns
+   :param typecode: the :mod:`array` type code, by default *'l'* (integers),
+                    use *'d'* for real numbers
+
+   .. versionadded:: 0.6
+      The *G2DListArray* class.
+   """
+
+   def __init__(self, height, width, typecode=Consts.CDefG2DListArrayTypecode, cloning=False):
+      """ The initializator of G2DListArray representation,
+      height and width must be specified """
+      GenomeBase.__init__(self, cloning)
+      self.height = height
+      self.width = width
+      self.typecode = typecode
+
+      if cloning:
+         self.genomeArray = None
+      else:
+         self.genomeArray = array(typecode, [0]) * (height * width)
+         self.initializator.set(Consts.CDefG2DListArrayInit)
+         self.mutator.set(Consts.CDefG2DListArrayMutator)
+         self.crossover.set(Consts.CDefG2DListArrayCrossover)
+
+   def __eq__(self, other):
+      """ Compares one chromosome with another """
+      cond1 = (self.genomeArray == other.genomeArray)
+      cond2 = (self.height      == other.height)
+      cond3 = (self.width       == other.width)
+      return True if cond1 and cond2 and cond3 else False
+
+   def getItem(self, x, y):
+      """ Return the specified gene of List
+
+      Example:
+         >>> genome.getItem(3, 1)
+         666
+      
+      :param x: the x index, the row
+      :param y: the y index, the column
+      :rtype: the item at x,y position
+      
+      """
+      return self.genomeArray[x * self.width + y]
+
+   def setItem(self, x, y, value):
+      """ Set the specified gene of List
+
+      Example:
+         >>> genome.setItem(3, 1, 666)
+      
+      :param x: the x index, the row
+      :param y: the y index, the column
+      :param value: the value
+      
+      """
+      self.genomeArray[x * self.width + y] = value
+      self.modified = True
+
+   def getInternalArray(self):
+      """ Returns the flat genes buffer, in row-major order
+
+      .. note:: if you change the buffer, you must call the *setModified* method
+      :rtype: the :class:`array.array` instance
+      """
+      return self.genomeArray
+
+   def setInternalArray(self, values):
+      """ Replaces the genes with a flat sequence of *height* x *width* values
+
+      :param values: the sequence of values, in row-major order
+      """
+      if len(values) != self.height * self.width:
+         Util.raiseException("The size of the values must be %d" % (self.height * self.width), ValueError)
+      self.genomeArray = array(self.typecode, values)
+      self.modified = True
+
+   def __getitem__(self, key):
+      """ Return a view of the specified row """
+      if key < 0: key += self.height
+      if not 0 <= key < self.height:
+         raise IndexError("list index out of range")
+      return G2DListArrayRow(self, key)
+
+   def __iter__(self):
+      """ Iterator support to the rows """
+      for i in xrange(self.height):
+         yield G2DListArrayRow(self, i)
+
+   def getHeight(self):
+      """ Return the height (lines) of the List """
+      return self.height
+
+   def getWidth(self):
+      """ Return the width (lines) of the List """
+      return self.width
+
+   def getSize(self):
+      """ Returns a tuple (height, widht)
+   
+      Example:
+         >>> genome.getSize()
+         (3, 2)
+
+      """
+      return (self.getHeight(), self.getWidth())
+
+   def __repr__(self):
+      """ Return a string representation of Genome """
+      ret = GenomeBase.__repr__(self)
+      ret += "- G2DListArray\n"
+      ret += "\tList size:\t %s\n" % (self.getSize(),)
+      ret += "\tList:\n"
+      for line in self:
+         ret += "\t\t\t"
+         for item in line:
+            ret += "[%s] " % (item)
+         ret += "\n"
+      ret += "\n"
+      return ret
+
+   def resumeString(self):
+      """ Returns a resumed string representation of the Genome """
+      ret = ""
+      for line in self:
+         for item in line:
+            ret += "[%s] " % (item)
+         ret += "\n"
+      return ret
+
+   def clearList(self):
+      """ Sets all genes to zero """
+      self.genomeArray = array(self.typecode, [0]) * (self.height * self.width)
+      self.modified = True
+
+   def exportGenes(self):
+      """ Returns a compact copy of the genes, used to send the genome
+      data to another process without the genome object itself
+
+      :rtype: the raw bytes of the genes buffer
+      """
+      return self.genomeArray.tostring()
+
+   def importGenes(self, genes):
+      """ Replaces the genes with the genes returned by *exportGenes*
+
+      :param genes: the genes string
+      """
+      self.genomeArray = array(self.typecode)
+      self.genomeArray.fromstring(genes)
+      self.modified = True
+
+   def copy(self, g):
+      """ Copy genome to 'g'
+      
+      Example:
+         >>> genome_origin.copy(genome_destination)
+      
+      :param g: the destination G2DListArray instance
+
+      """
+      GenomeBase.copy(self, g)
+      g.height = self.height
+      g.width = self.width
+      g.typecode = self.typecode
+      g.genomeArray = self.genomeArray[:]
+   
+   def clone(self):
+      """ Return a new instace copy of the genome
+      
+      :rtype: the G2DListArray clone instance
+
+      """
+      newcopy = G2DListArray(self.height, self.width, self.typecode, True)
+      self.copy(newcopy)
+      return newcopy
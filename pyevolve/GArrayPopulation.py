@@ -0,0 +1,378 @@
+"""
+:mod:`GArrayPopulation` -- the NumPy array population module
+================================================================
+
+This module contains the :class:`GArrayPopulation.G1DListArrayPopulation` class,
+a population of :class:`G1DList.G1DList` genomes which keeps all the chromosomes
+in a single 2D `NumPy <http://numpy.scipy.org>`_ array (one row per individual).
+The initialization, the crossover, the mutation and optionally the evaluation are
+done on the whole array at once, instead of calling the genome operators once
+for each individual.
+
+The vectorized operators are set in the population slots, just like the genome
+operators are set in the genome slots: ::
+
+   pop = GArrayPopulation.G1DListArrayPopulation(genome)
+   pop.initializator.set(GArrayPopulation.ArrayInitializatorReal)
+   pop.mutator.set(GArrayPopulation.ArrayMutatorRealGaussian)
+   pop.crossover.set(GArrayPopulation.ArrayCrossoverUniform)
+   pop.batchEvaluator.set(eval_matrix)
+   ga_engine.setPopulation(pop)
+
+The individuals are still :class:`G1DList.G1DList` instances (with plain python
+lists as genes), so the selectors, the scaling methods, the statistics and the
+adapters work as usual.
+
+Default Parameters
+-------------------------------------------------------------
+
+*Initializator*
+
+   :func:`GArrayPopulation.ArrayInitializatorReal`
+
+   The real initializator, using the genome *rangemin* and *rangemax* parameters
+
+*Mutator*
+
+   :func:`GArrayPopulation.ArrayMutatorRealGaussian`
+
+   The gaussian mutator for real values
+
+*Crossover*
+
+   :func:`GArrayPopulation.ArrayCrossoverSinglePoint`
+
+   The single point crossover
+
+.. note:: this module requires the NumPy module.
+
+Class
+-------------------------------------------------------------
+
+
+"""
+
+from random import randint as rand_randint
+import logging
+
+import Consts, Util
+from FunctionSlot import FunctionSlot
+from GPopulation import GPopulation
+
+try:
+   import numpy
+   HAVE_NUMPY = True
+except ImportError:
+   HAVE_NUMPY = False
+
+class G1DListArrayPopulation(GPopulation):
+   """ G1DListArrayPopulation Class - A population of 1D lists kept in a 2D NumPy array
+
+   Inheritance diagram for :class:`GArrayPopulation.G1DListArrayPopulation`:
+
+   .. inheritance-diagram:: GArrayPopulation.G1DListArrayPopulation
+
+   **Examples**
+      Use the array population on the GA Engine
+         >>> pop = GArrayPopulation.G1DListArrayPopulation(genome)
+         >>> ga_engine.setPopulation(pop)
+
+      Get the genes of all the individuals
+         >>> pop.getGenes().shape
+         (80, 20)
+
+   The vectorized operators receive the population and the genes array (the
+   *genes* parameter). The initializator returns the new genes array, the mutator
+   changes the array in place and returns the number of mutations and the crossover
+   receives the arrays with the genes of the mothers and of the fathers (the *mom*
+   and *dad* parameters) and returns the arrays of the sisters and of the brothers.
+   The batch evaluator receives the genes array and returns the raw scores.
+
+   :param genome: the :term:`Sample genome`, or a G1DListArrayPopulation object, when cloning.
+
+   .. versionadded:: 0.6
+      The *G1DListArrayPopulation* class.
+   """
+
+   def __init__(self, genome):
+      """ The G1DListArrayPopulation Class creator """
+      if not HAVE_NUMPY:
+         Util.raiseException("You must install NumPy to use the G1DListArrayPopulation !", ImportError)
+
+      GPopulation.__init__(self, genome)
+      self.genes = None
+      self.rowIndex = {}
+
+      if isinstance(genome, G1DListArrayPopulation):
+         self.initializator = genome.initializator
+         self.mutator = genome.mutator
+         self.crossover = genome.crossover
+         self.randomState = genome.randomState
+         self.allSlots = [self.scaleMethod, self.initializator, self.mutator,
+                          self.crossover, self.batchEvaluator]
+         return
+
+      self.initializator = FunctionSlot("Array Initializator")
+      self.mutator = FunctionSlot("Array Mutator")
+      self.crossover = FunctionSlot("Array Crossover")
+      self.initializator.set(ArrayInitializatorReal)
+      self.mutator.set(ArrayMutatorRealGaussian)
+      self.crossover.set(ArrayCrossoverSinglePoint)
+      self.randomState = None
+      self.allSlots = [self.scaleMethod, self.initializator, self.mutator,
+                       self.crossover, self.batchEvaluator]
+
+   def __setitem__(self, key, value):
+      """ Set an individual of population, the genes of the
+      individual are copied to the genes array """
+      old = self.internalPop[key]
+      row = self.rowIndex.pop(id(old))
+      self.genes[row] = value.genomeList
+      self.rowIndex[id(value)] = row
+      GPopulation.__setitem__(self, key, value)
+
+   def getGenes(self):
+      """ Returns the 2D array with the genes of the population, the
+      row *i* is the chromosome of the individual created on the
+      position *i* of the population
+
+      :rtype: the NumPy array
+      """
+      return self.genes
+
+   def getRow(self, individual):
+      """ Returns the row of the genes array of an individual
+
+      :param individual: the individual of the population
+      :rtype: the row index
+      """
+      return self.rowIndex[id(individual)]
+
+   def setGenes(self, genes, parents=None):
+      """ Replaces the individuals of the population by new individuals
+      created from the genes array
+
+      :param genes: the 2D NumPy array, one row per individual
+      :param parents: an optional list of individuals; when the row of
+                      the genes array is equal to the genes of the parent,
+                      the new individual keeps the parent score.
+
+      .. note:: a new :class:`G1DList.G1DList` is cloned for each row, with
+                the row copied to a python list, so this method costs one
+                clone per individual on each generation. Only the operators
+                work on the whole array at once.
+      """
+      self.genes = genes
+      rows = genes.tolist()
+      template = self.oneSelfGenome
+      self.internalPop = []
+      self.rowIndex = {}
+
+      for i in xrange(len(rows)):
+         ind = template.clone()
+         ind.genomeList = rows[i]
+         if parents is not None and not parents[i].isModified() and rows[i] == parents[i].genomeList:
+            ind.score = parents[i].score
+            ind.setModified(False)
+         else:
+            ind.resetStats()
+         self.internalPop.append(ind)
+         self.rowIndex[id(ind)] = i
+
+      self.clearFlags()
+
+   def create(self, **args):
+      """ Creates the genes array of the population """
+      self.minimax = args["minimax"]
+      if self.randomState is None:
+         self.randomState = numpy.random.RandomState(rand_randint(0, Consts.CDefArrayPopMaxSeed))
+      size = self.oneSelfGenome.getListSize()
+      self.setGenes(numpy.zeros((self.popSize, size)))
+
+   def initialize(self, **args):
+      """ Initialize the genes array using the array initializator """
+      logging.debug("Initializing the array population")
+      genes = self.genes
+      for it in self.initializator.applyFunctions(self, genes=genes, **args):
+         genes = it
+      self.setGenes(genes)
+
+   def evaluateBatch(self, individuals, **args):
+      """ Evaluate the individuals using the batch evaluator, the functions
+      of the slot receive the 2D array with the genes of the individuals
+      and return the array of raw scores
+
+      :param individuals: the list of individuals
+      :param args: this params are passed to the batch evaluator
+      """
+      if len(individuals) == 0: return
+      rows = [self.rowIndex[id(ind)] for ind in individuals]
+      scores = numpy.zeros(len(rows))
+      for it in self.batchEvaluator.applyFunctions(self.genes[rows], **args):
+         scores += it
+
+      for ind, score in zip(individuals, scores.tolist()):
+         ind.resetStats()
+         ind.score = score
+         ind.setModified(False)
+
+   def statistics(self):
+      """ Do statistical analysis of population and set 'statted' to True """
+      if self.statted: return
+      logging.debug("Running statistical calculations")
+      scores = numpy.asarray(self.getScores(), dtype=float)
+
+      self.stats["rawMax"] = float(scores.max())
+      self.stats["rawMin"] = float(scores.min())
+      self.stats["rawAve"] = float(scores.mean())
+      if len(scores) > 1:
+         self.stats["rawVar"] = float(scores.var() * len(scores) / (len(scores) - 1.0))
+      else:
+         self.stats["rawVar"] = 0.0
+      self.stats["rawDev"] = self.stats["rawVar"] ** 0.5
+
+      self.statted = True
+
+   def breed(self, ga_engine):
+      """ Creates the next generation, the parents are chosen with the GA Engine
+      selector and the crossover and the mutation are done on the genes array.
+      This method is called by the :meth:`GSimpleGA.GSimpleGA.step` method.
+
+      :param ga_engine: the GA Engine
+      :rtype: the new population, not evaluated
+      """
+      size = len(self.internalPop)
+      pairs = (size + 1) / 2
+      # The parents are interleaved, mom and dad of each pair
+      parents = [self.internalPop[i] for i in ga_engine.selectParents(pairs * 2)]
+      moms = parents[0::2]
+      dads = parents[1::2]
+      gMoms = self.genes[[self.rowIndex[id(ind)] for ind in moms]]
+      gDads = self.genes[[self.rowIndex[id(ind)] for ind in dads]]
+
+      sisters, brothers = gMoms.copy(), gDads.copy()
+      if not self.crossover.isEmpty():
+         mask = self.randomState.random_sample(pairs) < ga_engine.pCrossover
+         if mask.any():
+            for it in self.crossover.applyFunctions(self, mom=gMoms[mask], dad=gDads[mask], count=2):
+               sisters[mask], brothers[mask] = it
+
+      genes = numpy.empty((pairs * 2, gMoms.shape[1]), dtype=gMoms.dtype)
+      genes[0::2] = sisters
+      genes[1::2] = brothers
+      genes = genes[:size]
+
+      for it in self.mutator.applyFunctions(self, genes=genes, pmut=ga_engine.pMutation, ga_engine=ga_engine):
+         pass
+
+      newPop = self.__class__(self)
+      newPop.setGenes(genes, parents[:size])
+      return newPop
+
+#############################
+##  Array Initializators   ##
+#############################
+
+def ArrayInitializatorReal(population, **args):
+   """ Real initialization function of the array population,
+   uses the genome *rangemin* and *rangemax* parameters
+
+   .. versionadded:: 0.6
+      The *ArrayInitializatorReal* function
+   """
+   genome = population.oneSelfGenome
+   range_min = genome.getParam("rangemin", Consts.CDefRangeMin)
+   range_max = genome.getParam("rangemax", Consts.CDefRangeMax)
+   return population.randomState.uniform(range_min, range_max, args["genes"].shape)
+
+def ArrayInitializatorInteger(population, **args):
+   """ Integer initialization function of the array population,
+   uses the genome *rangemin* and *rangemax* parameters
+
+   .. versionadded:: 0.6
+      The *ArrayInitializatorInteger* function
+   """
+   genome = population.oneSelfGenome
+   range_min = genome.getParam("rangemin", Consts.CDefRangeMin)
+   range_max = genome.getParam("rangemax", Consts.CDefRangeMax)
+   return population.randomState.randint(range_min, range_max + 1, args["genes"].shape)
+
+#############################
+##     Array Mutators      ##
+#############################
+
+def ArrayMutatorRealGaussian(population, **args):
+   """ The gaussian mutator of the array population, for real values,
+   uses the genome *rangemin*, *rangemax*, *gauss_mu* and *gauss_sigma*
+   parameters
+
+   .. versionadded:: 0.6
+      The *ArrayMutatorRealGaussian* function
+   """
+   if args["pmut"] <= 0.0: return 0
+   genes = args["genes"]
+   genome = population.oneSelfGenome
+   mu = genome.getParam("gauss_mu", Consts.CDefG1DListMutRealMU)
+   sigma = genome.getParam("gauss_sigma", Consts.CDefG1DListMutRealSIGMA)
+
+   mask = population.randomState.random_sample(genes.shape) < args["pmut"]
+   mutations = int(mask.sum())
+   if mutations == 0: return 0
+
+   genes[mask] += population.randomState.normal(mu, sigma, mutations)
+   numpy.clip(genes, genome.getParam("rangemin", Consts.CDefRangeMin),
+                     genome.getParam("rangemax", Consts.CDefRangeMax), genes)
+   return mutations
+
+def ArrayMutatorIntegerGaussian(population, **args):
+   """ The gaussian mutator of the array population, for integer values,
+   uses the genome *rangemin*, *rangemax*, *gauss_mu* and *gauss_sigma*
+   parameters
+
+   .. versionadded:: 0.6
+      The *ArrayMutatorIntegerGaussian* function
+   """
+   if args["pmut"] <= 0.0: return 0
+   genes = args["genes"]
+   genome = population.oneSelfGenome
+   mu = genome.getParam("gauss_mu", Consts.CDefG1DListMutIntMU)
+   sigma = genome.getParam("gauss_sigma", Consts.CDefG1DListMutIntSIGMA)
+
+   mask = population.randomState.random_sample(genes.shape) < args["pmut"]
+   mutations = int(mask.sum())
+   if mutations == 0: return 0
+
+   genes[mask] += numpy.rint(population.randomState.normal(mu, sigma, mutations)).astype(genes.dtype)
+   numpy.clip(genes, genome.getParam("rangemin", Consts.CDefRangeMin),
+                     genome.getParam("rangemax", Consts.CDefRangeMax), genes)
+   return mutations
+
+#############################
+##     Array Crossovers    ##
+#############################
+
+def ArrayCrossoverSinglePoint(population, **args):
+   """ The single point crossover of the array population, each pair
+   of parents has its own cut point
+
+   .. versionadded:: 0.6
+      The *ArrayCrossoverSinglePoint* function
+   """
+   moms, dads = args["mom"], args["dad"]
+   rows, size = moms.shape
+   if size == 1:
+      Util.raiseException("The 1D List have one element, can't use the Single Point Crossover method !", TypeError)
+
+   cuts = population.randomState.randint(1, size, (rows, 1))
+   mask = numpy.arange(size) >= cuts
+   return (numpy.where(mask, dads, moms), numpy.where(mask, moms, dads))
+
+def ArrayCrossoverUniform(population, **args):
+   """ The uniform crossover of the array population
+
+   .. versionadded:: 0.6
+      The *ArrayCrossoverUniform* function
+   """
+   moms, dads = args["mom"], args["dad"]
+   mask = population.randomState.random_sample(moms.shape) < Consts.CDefG1DListCrossUniformProb
+   return (numpy.where(mask, dads, moms), numpy.where(mask, moms, dads))
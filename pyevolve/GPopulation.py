@@ -36,8 +36,17 @@ import Consts, Util
 from FunctionSlot import FunctionSlot
 from Statistics import Statistics
 from math import sqrt as math_sqrt
+from time import time
+from operator import attrgetter
+import heapq
 import logging
 
+try:
+   import numpy
+   HAVE_NUMPY = True
+except ImportError:
+   HAVE_NUMPY = False
+
 try:
    from multiprocessing import cpu_count, Pool
    CPU_COUNT = cpu_count()
@@ -81,6 +90,20 @@ def multiprocessing_eval_full(ind):
    ind.evaluate()
    return ind
 
+multiprocessing_genome = None
+
+def multiprocessing_init(genome):
+   """ Internal used by the multiprocessing, keeps the genome used by
+   the worker to evaluate the genes """
+   global multiprocessing_genome
+   multiprocessing_genome = genome.clone()
+
+def multiprocessing_eval_genes(genes):
+   """ Internal used by the multiprocessing (genes only) """
+   multiprocessing_genome.importGenes(genes)
+   multiprocessing_genome.evaluate()
+   return multiprocessing_genome.score
+
 
 class GPopulation:
    """ GPopulation Class - The container for the population
@@ -113,6 +136,16 @@ class GPopulation:
          >>> pop[10].fitness
          12.5
 
+      Evaluate all the individuals with a single call
+         >>> def eval_batch(individuals):
+         ...    return [sum(ind) for ind in individuals]
+         >>> pop.batchEvaluator.set(eval_batch)
+
+      Get the raw scores of all the individuals, in the population order
+         >>> scores = pop.getScores()
+         >>> scores.max()
+         10.4
+
    :param genome: the :term:`Sample genome`, or a GPopulation object, when cloning.
 
    """
@@ -129,13 +162,20 @@ class GPopulation:
          self.sorted        = False
          self.minimax       = genome.minimax
          self.scaleMethod   = genome.scaleMethod
-         self.allSlots      = [self.scaleMethod]
+         self.batchEvaluator = genome.batchEvaluator
+         self.allSlots      = [self.scaleMethod, self.batchEvaluator]
 
          self.internalParams = genome.internalParams
          self.multiProcessing = genome.multiProcessing
+         self.procPool = genome.procPool
+         self.fitnessCache = genome.fitnessCache
+         self.lazyEvaluation = genome.lazyEvaluation
 
          self.statted = False
          self.stats   = Statistics()
+         self.selectionStates = {}
+         self.scoreArray = None
+         self.fitnessArray = None
          return
 
       logging.debug("New population instance, %s class genomes.", genome.__class__.__name__)
@@ -148,16 +188,27 @@ class GPopulation:
       self.minimax       = Consts.CDefPopMinimax
       self.scaleMethod   = FunctionSlot("Scale Method")
       self.scaleMethod.set(Consts.CDefPopScale)
-      self.allSlots      = [self.scaleMethod]
+      self.batchEvaluator = FunctionSlot("Batch Evaluator")
+      self.allSlots      = [self.scaleMethod, self.batchEvaluator]
 
       self.internalParams = {}
-      self.multiProcessing = (False, False)
+      self.multiProcessing = (False, False, None, None)
+      self.procPool = None
+      self.fitnessCache = None
+      self.lazyEvaluation = Consts.CDefPopLazyEvaluation
 
       # Statistics
       self.statted = False
       self.stats   = Statistics()
 
-   def setMultiProcessing(self, flag=True, full_copy=False):
+      # The selection states of the selectors, see the Selectors.SelectorBase
+      self.selectionStates = {}
+
+      # The arrays of the raw scores and of the fitness, see the getScores()
+      self.scoreArray = None
+      self.fitnessArray = None
+
+   def setMultiProcessing(self, flag=True, full_copy=False, max_processes=None, chunksize=None):
       """ Sets the flag to enable/disable the use of python multiprocessing module.
       Use this option when you have more than one core on your CPU and when your
       evaluation function is very slow.
@@ -167,6 +218,10 @@ class GPopulation:
       
       :param flag: True (default) or False
       :param full_copy: True or False (default)
+      :param max_processes: the number of worker processes, None (default) uses
+                            the number of CPU cores
+      :param chunksize: the number of individuals sent to a worker at once, None
+                        (default) lets the pool choose
 
       .. warning:: Use this option only when your evaluation function is slow, se you
                    will get a good tradeoff between the process communication speed and the
@@ -176,7 +231,87 @@ class GPopulation:
          The `setMultiProcessing` method.
 
       """
-      self.multiProcessing = (flag, full_copy)
+      self.multiProcessing = (flag, full_copy, max_processes, chunksize)
+
+   def setLazyEvaluation(self, flag=True):
+      """ Enables or disables the lazy evaluation, when enabled, the individuals
+      which were not changed after their last evaluation keep their raw score
+
+      :param flag: True (default) or False
+
+      .. versionadded:: 0.6
+         The `setLazyEvaluation` method.
+      """
+      self.lazyEvaluation = flag
+
+   def setFitnessCache(self, size=None):
+      """ Enables the cache of raw scores, the individuals with the same genes
+      of a cached individual are not evaluated again
+
+      :param size: the maximum number of cached scores, None disables the cache
+
+      .. note:: the evaluation function must be deterministic, and the genome must
+                have the *exportGenes* method, otherwise the cache is not used
+
+      .. versionadded:: 0.6
+         The `setFitnessCache` method.
+      """
+      if size is None:
+         self.fitnessCache = None
+      else:
+         self.fitnessCache = Util.FitnessCache(size)
+
+   def getFitnessCache(self):
+      """ Returns the cache of raw scores or None if it's disabled
+
+      :rtype: the :class:`Util.FitnessCache` instance
+
+      .. versionadded:: 0.6
+         The `getFitnessCache` method.
+      """
+      return self.fitnessCache
+
+   def createProcessPool(self):
+      """ Creates the long-lived pool of worker processes used by the
+      multiprocessing evaluation. The pool is shared with all the populations
+      cloned from this one, so it is created only once for the whole evolution.
+
+      :rtype: the process pool or None if the multiprocessing is disabled
+
+      """
+      if not (self.multiProcessing[0] and MULTI_PROCESSING):
+         return None
+      if self.procPool is None:
+         logging.debug("Creating the process pool for the multiprocessing evaluation")
+         self.procPool = self.__newProcessPool()
+      return self.procPool
+
+   def __genesTransport(self):
+      """ Returns True if only the genes are sent to the worker processes """
+      return (not self.multiProcessing[1]) and hasattr(self.oneSelfGenome, "exportGenes")
+
+   def __newProcessPool(self):
+      """ Internally used to create the pool of worker processes, when only
+      the genes are sent, the sample genome is sent to each worker once """
+      if self.__genesTransport():
+         return Pool(self.multiProcessing[2], multiprocessing_init, (self.oneSelfGenome,))
+      return Pool(self.multiProcessing[2])
+
+   def terminateProcessPool(self, wait=True):
+      """ Shuts down the pool of worker processes, if any
+
+      :param wait: if True (default), waits for the workers to finish the pending
+                   work, otherwise the workers are killed immediately
+
+      """
+      if self.procPool is None: return
+      logging.debug("Shutting down the process pool of the multiprocessing evaluation")
+      if wait:
+         self.procPool.close()
+      else:
+         self.procPool.terminate()
+      self.procPool.join()
+      self.procPool = None
    
    def setMinimax(self, minimax):
       """ Sets the population minimax
@@ -219,9 +354,81 @@ class GPopulation:
       self.clearFlags()
 
    def clearFlags(self):
-      """ Clear the sorted and statted internal flags """
+      """ Clear the sorted and statted internal flags, the selection
+      states of the selectors and the score arrays """
       self.sorted = False
       self.statted = False
+      self.selectionStates.clear()
+      self.scoreArray = None
+      self.fitnessArray = None
+
+   def useArrays(self):
+      """ Returns True if the scores of the population are kept in NumPy
+      arrays, when NumPy is installed and the population has at least
+      :attr:`Consts.CDefPopVectorSize` individuals
+
+      .. versionadded:: 0.6
+         The *useArrays* method.
+      """
+      return HAVE_NUMPY and len(self.internalPop) >= Consts.CDefPopVectorSize
+
+   def __gatherArray(self, array, key):
+      """ Returns the cached array of the attribute *key* of the
+      individuals, gathered again when it's outdated """
+      len_pop = len(self.internalPop)
+      if (array is not None) and (len(array) == len_pop):
+         return array
+      if self.useArrays():
+         return numpy.fromiter((getattr(ind, key) for ind in self.internalPop), float, len_pop)
+      return [getattr(ind, key) for ind in self.internalPop]
+
+   def getScores(self):
+      """ Returns the raw scores of the individuals, in the population
+      order. With large populations (see the :meth:`useArrays`), it's a
+      NumPy array, kept until the population changes (see the
+      :meth:`clearFlags`), otherwise it's a list. The individuals keep
+      their *score* attribute, the array is a copy and must not be changed.
+
+      :rtype: the array or the list of raw scores
+
+      .. versionadded:: 0.6
+         The *getScores* method.
+      """
+      self.scoreArray = self.__gatherArray(self.scoreArray, "score")
+      return self.scoreArray
+
+   def getFitnesses(self):
+      """ Returns the scaled fitness of the individuals, in the population
+      order, an array or a list as the :meth:`getScores`
+
+      :rtype: the array or the list of fitness
+
+      .. versionadded:: 0.6
+         The *getFitnesses* method.
+      """
+      self.fitnessArray = self.__gatherArray(self.fitnessArray, "fitness")
+      return self.fitnessArray
+
+   def setFitnesses(self, values):
+      """ Sets the scaled fitness of the individuals, used by the scaling
+      schemes which compute the fitness of the whole population at once
+
+      :param values: the sequence of fitness, in the population order
+
+      .. versionadded:: 0.6
+         The *setFitnesses* method.
+      """
+      if len(values) != len(self.internalPop):
+         Util.raiseException("The population needs one fitness for each individual", ValueError)
+
+      if HAVE_NUMPY and isinstance(values, numpy.ndarray):
+         self.fitnessArray = values.astype(float) if self.useArrays() else None
+         values = values.tolist()
+      else:
+         self.fitnessArray = None
+
+      for ind, fitness in zip(self.internalPop, values):
+         ind.fitness = fitness
 
    def getStatistics(self):
       """ Return a Statistics class for statistics
@@ -236,33 +443,19 @@ class GPopulation:
       """ Do statistical analysis of population and set 'statted' to True """
       if self.statted: return
       logging.debug("Running statistical calculations")
-      raw_sum = 0
-      fit_sum = 0
-
       len_pop = len(self)
-      for ind in xrange(len_pop):
-         raw_sum += self[ind].score
-         #fit_sum += self[ind].fitness
-
-      self.stats["rawMax"] = max(self, key=key_raw_score).score
-      self.stats["rawMin"] = min(self, key=key_raw_score).score
-      self.stats["rawAve"] = raw_sum / float(len_pop)
-      #self.stats["rawTot"] = raw_sum
-      #self.stats["fitTot"] = fit_sum
-      
-      tmpvar = 0.0
-      for ind in xrange(len_pop):
-         s = self[ind].score - self.stats["rawAve"]
-         s*= s
-         tmpvar += s
 
-      tmpvar/= float((len(self) - 1))
-      try:
-         self.stats["rawDev"] = math_sqrt(tmpvar)
-      except:
-         self.stats["rawDev"] = 0.0
+      raw_min, raw_max, raw_ave, raw_var = Util.summaryStatistics(self.getScores())
+      self.stats["rawMax"] = raw_max
+      self.stats["rawMin"] = raw_min
+      self.stats["rawAve"] = raw_ave
+      self.stats["rawVar"] = raw_var
+      self.stats["rawDev"] = math_sqrt(raw_var)
 
-      self.stats["rawVar"] = tmpvar
+      if isinstance(self.oneSelfGenome, tuple(Consts.CDefGPGenomes)):
+         sizes = [len(ind) for ind in self.internalPop]
+         self.stats["sizeAve"] = sum(sizes) / float(len_pop)
+         self.stats["sizeMax"] = float(max(sizes))
 
       self.statted = True
 
@@ -286,26 +479,127 @@ class GPopulation:
          The parameter `index`.
       
       """
+      self.sort()
       if self.sortType == Consts.sortType["raw"]:
          return self.internalPop[index]
-      else:
-         self.sort()
-         return self.internalPopRaw[index]
+
+      if index >= len(self.internalPopRaw):
+         self.sortRaw(index + 1)
+      return self.internalPopRaw[index]
 
    def sort(self):
-      """ Sort the population """
+      """ Sort the population, with the scaled sort type the raw score
+      ordering is built only when it's needed, see the :meth:`sortRaw` """
       if self.sorted: return
       rev = (self.minimax == Consts.minimaxType["maximize"])
 
       if self.sortType == Consts.sortType["raw"]:
-         self.internalPop.sort(cmp=Util.cmp_individual_raw, reverse=rev)
+         self.__sortBy("score", rev)
       else:
          self.scale()
-         self.internalPop.sort(cmp=Util.cmp_individual_scaled, reverse=rev)
-         self.internalPopRaw = self.internalPop[:]
-         self.internalPopRaw.sort(cmp=Util.cmp_individual_raw, reverse=rev)
+         self.__sortBy("fitness", rev)
+         del self.internalPopRaw[:]
+
+      self.sorted = True
+
+   def __sortBy(self, key, rev):
+      """ Sorts the individuals by the attribute *key*, with the arrays,
+      the order is found by NumPy and the arrays follow the individuals.
+      Both sorts are stable, so they give the same order """
+      if not self.useArrays():
+         self.internalPop.sort(key=attrgetter(key), reverse=rev)
+         self.scoreArray = None
+         self.fitnessArray = None
+         return
+
+      values = self.getScores() if key == "score" else self.getFitnesses()
+      order = (-values if rev else values).argsort(kind="mergesort")
+      # The list is changed in place, it may be referenced elsewhere
+      self.internalPop[:] = [self.internalPop[i] for i in order.tolist()]
+      if self.scoreArray is not None:
+         self.scoreArray = self.scoreArray[order]
+      if self.fitnessArray is not None:
+         self.fitnessArray = self.fitnessArray[order]
+
+   def sortRaw(self, count=None):
+      """ Sorts the individuals by raw score in the *internalPopRaw* list,
+      used by the :meth:`bestRaw` with the scaled sort type. When only the
+      best individuals are needed, a partial selection is done
+
+      :param count: the number of best individuals needed, None for all
+
+      .. versionadded:: 0.6
+         The *sortRaw* method.
+      """
+      rev = (self.minimax == Consts.minimaxType["maximize"])
+      len_pop = len(self.internalPop)
+
+      if count is not None:
+         # Grows geometrically, for the calls with increasing indexes
+         count = max(count, 2 * len(self.internalPopRaw))
+
+      # The partial selection is faster only for the top tenth
+      if (count is None) or (count * 10 >= len_pop):
+         self.internalPopRaw = sorted(self.internalPop, key=attrgetter("score"), reverse=rev)
+      elif rev:
+         self.internalPopRaw = heapq.nlargest(count, self.internalPop, key=attrgetter("score"))
+      else:
+         self.internalPopRaw = heapq.nsmallest(count, self.internalPop, key=attrgetter("score"))
+
+   def insertSorted(self, individual):
+      """ Inserts an individual in the population, at its place in the
+      raw score order, found with a binary search. The population stays
+      sorted, so it's not sorted again, only the statistics and the
+      selection states are cleared. Used by the steady-state GA Engine
+      (see the :class:`GSteadyStateGA.GSteadyStateGA`)
+
+      :param individual: the individual, evaluated
+      :rtype: the index of the individual in the population
+
+      .. note:: only with the raw sort type
 
+      .. versionadded:: 0.6
+         The *insertSorted* method.
+      """
+      if self.sortType != Consts.sortType["raw"]:
+         Util.raiseException("The sorted insertion needs the raw sort type", ValueError)
+      self.sort()
+
+      pop = self.internalPop
+      score = individual.score
+      lower, upper = 0, len(pop)
+      # After the individuals with the same score, as the stable sort
+      if self.minimax == Consts.minimaxType["maximize"]:
+         while lower < upper:
+            middle = (lower + upper) // 2
+            if score > pop[middle].score: upper = middle
+            else: lower = middle + 1
+      else:
+         while lower < upper:
+            middle = (lower + upper) // 2
+            if score < pop[middle].score: upper = middle
+            else: lower = middle + 1
+
+      pop.insert(lower, individual)
+      self.clearFlags()
+      self.sorted = True
+      return lower
+
+   def removeSorted(self, index):
+      """ Removes the individual at the index of the sorted population,
+      the population stays sorted
+
+      :param index: the index of the individual, -1 is the worst one
+      :rtype: the removed individual
+
+      .. versionadded:: 0.6
+         The *removeSorted* method.
+      """
+      self.sort()
+      individual = self.internalPop.pop(index)
+      self.clearFlags()
       self.sorted = True
+      return individual
 
    def setPopulationSize(self, size):
       """ Set the population size
@@ -358,26 +652,159 @@ class GPopulation:
    
       :param args: this params are passed to the evaluation function
 
+      .. note:: when the lazy evaluation is enabled, only the individuals changed
+                after their last evaluation are evaluated.
+
       """
+      time_init = time()
+      if self.lazyEvaluation:
+         indexes = [i for i, ind in enumerate(self.internalPop) if ind.isModified()]
+      else:
+         indexes = xrange(len(self.internalPop))
+
+      if hasattr(self.oneSelfGenome, "getCodeCache"):
+         code_cache = self.oneSelfGenome.getCodeCache()
+         code_hits, code_misses = code_cache.hits, code_cache.misses
+      else:
+         code_cache = None
+
+      cache = self.fitnessCache
+      if cache is None:
+         self.evaluateIndividuals(indexes, **args)
+      else:
+         self.__evaluateCached(cache, indexes, **args)
+
+      if code_cache is not None:
+         self.stats["compileHits"] = float(code_cache.hits - code_hits)
+         self.stats["compileMisses"] = float(code_cache.misses - code_misses)
+      self.stats["evalTime"] = time() - time_init
+      # Kept when nothing was evaluated, the individuals may be evaluated
+      # elsewhere (see the GSteadyStateGA asynchronous evaluation)
+      if len(indexes) > 0 and self.stats["evalTime"] > 0.0:
+         self.stats["evalRate"] = len(indexes) / self.stats["evalTime"]
+      self.clearFlags()
+
+   def __evaluateCached(self, cache, indexes, **args):
+      """ Evaluates the individuals at the indexes using the fitness cache """
+
+      hits, misses = cache.hits, cache.misses
+      pending = []
+      pending_keys = {}
+      duplicated = []
+      for i in indexes:
+         ind = self.internalPop[i]
+         key = cache.makeKey(ind)
+         if key is None:
+            pending.append(i)
+            continue
+         # Same genes of an individual not evaluated yet
+         if key in pending_keys:
+            cache.hits += 1
+            duplicated.append((i, pending_keys[key]))
+            continue
+         score = cache.lookup(key)
+         if score is None:
+            pending.append(i)
+            pending_keys[key] = i
+         else:
+            ind.resetStats()
+            ind.score = score
+            ind.setModified(False)
+
+      self.evaluateIndividuals(pending, **args)
+
+      for key, i in pending_keys.iteritems():
+         cache.store(key, self.internalPop[i].score)
+
+      for i, j in duplicated:
+         self.internalPop[i].resetStats()
+         self.internalPop[i].score = self.internalPop[j].score
+         self.internalPop[i].setModified(False)
+
+      self.stats["cacheHits"] = float(cache.hits - hits)
+      self.stats["cacheMisses"] = float(cache.misses - misses)
+
+   def evaluateIndividuals(self, indexes, **args):
+      """ Evaluate the individuals of the population at the indexes
+
+      :param indexes: the list of individual indexes
+      :param args: this params are passed to the evaluation function
+
+      .. note:: when the batch evaluator is set, it's used instead of the
+                genome evaluator and the multiprocessing.
+
+      .. versionadded:: 0.6
+         The `evaluateIndividuals` method.
+      """
+      if not self.batchEvaluator.isEmpty():
+         self.evaluateBatch([self.internalPop[i] for i in indexes], **args)
+         return
+
       # We have multiprocessing
       if self.multiProcessing[0] and MULTI_PROCESSING:
+         if len(indexes) == 0: return
          logging.debug("Evaluating the population using the multiprocessing method")
-         proc_pool = Pool()
+         proc_pool = self.procPool
+         chunksize = self.multiProcessing[3]
+         individuals = [self.internalPop[i] for i in indexes]
+
+         # Population evaluated outside the GA Engine, the pool lives only
+         # during this evaluation
+         temp_pool = proc_pool is None
+         if temp_pool:
+            proc_pool = self.__newProcessPool()
+
+         try:
+            # Multiprocessing full_copy parameter
+            if self.multiProcessing[1]:
+               results = proc_pool.map(multiprocessing_eval_full, individuals, chunksize)
+               for i, individual in zip(indexes, results):
+                  self.internalPop[i] = individual
+            elif self.__genesTransport():
+               genes = [ind.exportGenes() for ind in individuals]
+               results = proc_pool.map(multiprocessing_eval_genes, genes, chunksize)
+               for individual, score in zip(individuals, results):
+                  individual.score = score
+                  individual.setModified(False)
+            else:
+               results = proc_pool.map(multiprocessing_eval, individuals, chunksize)
+               for individual, score in zip(individuals, results):
+                  individual.score = score
+                  individual.setModified(False)
+         finally:
+            if temp_pool:
+               proc_pool.close()
+               proc_pool.join()
+      else:
+         for i in indexes:
+            self.internalPop[i].evaluate(**args)
+
+   def evaluateBatch(self, individuals, **args):
+      """ Evaluate the individuals using the batch evaluator, the functions
+      of the slot receive the list of individuals and return a sequence with
+      their raw scores, in the same order
 
-         # Multiprocessing full_copy parameter
-         if self.multiProcessing[1]:
-            results = proc_pool.map(multiprocessing_eval_full, self.internalPop)
-            for i in xrange(len(self.internalPop)):
-               self.internalPop[i] = results[i]
+      :param individuals: the list of individuals
+      :param args: this params are passed to the batch evaluator
+
+      .. versionadded:: 0.6
+         The `evaluateBatch` method.
+      """
+      if len(individuals) == 0: return
+      scores = None
+      for it in self.batchEvaluator.applyFunctions(individuals, **args):
+         if scores is None:
+            scores = list(it)
          else:
-            results = proc_pool.map(multiprocessing_eval, self.internalPop)
-            for individual, score in zip(self.internalPop, results):
-               individual.score = score
-      else:
-         for ind in self.internalPop:
-            ind.evaluate(**args)
+            scores = [a + b for a, b in zip(scores, it)]
 
-      self.clearFlags()
+      if len(scores) != len(individuals):
+         Util.raiseException("The batch evaluator must return one score for each individual", ValueError)
+
+      for ind, score in zip(individuals, scores):
+         ind.resetStats()
+         ind.score = score
+         ind.setModified(False)
 
    def scale(self, **args):
       """ Scale the population using the scaling method
@@ -385,18 +812,19 @@ class GPopulation:
       :param args: this parameter is passed to the scale method
 
       """
+      self.fitnessArray = None
       for it in self.scaleMethod.applyFunctions(self, **args):
          pass
 
-      fit_sum = 0
-      for ind in xrange(len(self)):
-         fit_sum += self[ind].fitness
-
-      self.stats["fitMax"] = max(self, key=key_fitness_score).fitness
-      self.stats["fitMin"] = min(self, key=key_fitness_score).fitness
-      self.stats["fitAve"] = fit_sum / float(len(self))
+      fit_min, fit_max, fit_ave, fit_var = Util.summaryStatistics(self.getFitnesses())
+      self.stats["fitMax"] = fit_max
+      self.stats["fitMin"] = fit_min
+      self.stats["fitAve"] = fit_ave
+      self.stats["fitVar"] = fit_var
+      self.stats["fitDev"] = math_sqrt(fit_var)
 
       self.sorted = False
+      self.selectionStates.clear()
 
    def printStats(self):
       """ Print statistics of the current population """
@@ -424,6 +852,9 @@ class GPopulation:
       #pop.internalParams = self.internalParams.copy()
       pop.internalParams = self.internalParams
       pop.multiProcessing = self.multiProcessing
+      pop.procPool = self.procPool
+      pop.fitnessCache = self.fitnessCache
+      pop.lazyEvaluation = self.lazyEvaluation
    
    def getParam(self, key, nvl=None):
       """ Gets an internal parameter
@@ -50,7 +50,7 @@ Default Parameters
 
 *Selector (Selection Method)*
 
-   :func:`Selectors.GRankSelector`
+   :data:`Selectors.GRankSelector`
 
    The Rank Selection method
 
@@ -64,6 +64,8 @@ from FunctionSlot import FunctionSlot
 from Migration    import MigrationScheme
 from GenomeBase   import GenomeBase
 from DBAdapters   import DBBaseAdapter
+from Bloat        import BloatControl
+from Selectors    import SelectorBase
 
 import Consts
 import Util
@@ -235,6 +237,7 @@ class GSimpleGA:
       self.interactiveMode = interactiveMode
       self.interactiveGen  = -1
       self.GPMode = False
+      self.bloatControl = None
 
       self.selector            = FunctionSlot("Selector")
       self.stepCallback        = FunctionSlot("Generation Step Callback")
@@ -376,12 +379,14 @@ class GSimpleGA:
       ret += "\tElitism:\t\t %s\n" % (self.elitism,)
       ret += "\tElitism Replacement:\t %d\n" % (self.nElitismReplacement,)
       ret += "\tDB Adapter:\t\t %s\n" % (self.dbAdapter,)
+      if self.bloatControl is not None:
+         ret += "\t" + self.bloatControl.__repr__()
       for slot in self.allSlots:
          ret+= "\t" + slot.__repr__()
       ret+="\n"
       return ret
    
-   def setMultiProcessing(self, flag=True, full_copy=False):
+   def setMultiProcessing(self, flag=True, full_copy=False, max_processes=None, chunksize=None):
       """ Sets the flag to enable/disable the use of python multiprocessing module.
       Use this option when you have more than one core on your CPU and when your
       evaluation function is very slow.
@@ -398,9 +403,22 @@ class GSimpleGA:
       The parameter "full_copy" defines where the individual data should be copied back
       after the evaluation or not. This parameter is useful when you change the
       individual in the evaluation function.
+
+      The pool of worker processes is created once when the evolution starts, it is
+      reused by every generation and it is shut down when the evolution ends.
+
+      When "full_copy" is False and the genome supports it (the *exportGenes* and
+      *importGenes* methods), only the genes are sent to the workers. The sample
+      genome, with the evaluator and the parameters, is sent to each worker once
+      when the pool is created, so changes on the genome parameters after the
+      evolution start are not seen by the workers.
       
       :param flag: True (default) or False
       :param full_copy: True or False (default)
+      :param max_processes: the number of worker processes, None (default) uses
+                            the number of CPU cores
+      :param chunksize: the number of individuals sent to a worker at once, None
+                        (default) lets the pool choose
 
       .. warning:: Use this option only when your evaluation function is slow, so you'll
                    get a good tradeoff between the process communication speed and the
@@ -422,7 +440,92 @@ class GSimpleGA:
       if type(full_copy) != BooleanType:
          Util.raiseException("Multiprocessing 'full_copy' option must be True or False", TypeError)
 
-      self.internalPop.setMultiProcessing(flag, full_copy)
+      if (max_processes is not None) and (max_processes < 1):
+         Util.raiseException("Multiprocessing 'max_processes' option must be >= 1", ValueError)
+
+      if (chunksize is not None) and (chunksize < 1):
+         Util.raiseException("Multiprocessing 'chunksize' option must be >= 1", ValueError)
+
+      self.internalPop.setMultiProcessing(flag, full_copy, max_processes, chunksize)
+
+   def setLazyEvaluation(self, flag=True):
+      """ Enables or disables the lazy evaluation. When enabled, the individuals
+      not changed by the crossover or by the mutation keep the raw score of
+      their parents and are not evaluated again. It's disabled by default.
+
+      Example:
+         >>> ga_engine.setLazyEvaluation(True)
+
+      :param flag: True (default) or False
+
+      .. note:: don't enable the lazy evaluation when your evaluation function is
+                not deterministic or when it depends on the generation.
+
+      .. versionadded:: 0.6
+         The `setLazyEvaluation` method.
+      """
+      if type(flag) != BooleanType:
+         Util.raiseException("Lazy evaluation option must be True or False", TypeError)
+
+      self.internalPop.setLazyEvaluation(flag)
+
+   def setFitnessCache(self, size=None):
+      """ Enables the cache of raw scores, so the individuals which have the same
+      genes of an already evaluated individual (like the clones when the crossover
+      doesn't occur and the elitism survivors) are not evaluated again.
+
+      The hits and misses of the cache on each generation are available in the
+      statistics as *cacheHits* and *cacheMisses*.
+
+      Example:
+         >>> ga_engine.setFitnessCache(5000)
+
+      :param size: the maximum number of cached scores, None (default) disables the cache
+
+      .. note:: use the cache only with deterministic evaluation functions, the
+                genome must have the *exportGenes* method.
+
+      .. versionadded:: 0.6
+         The `setFitnessCache` method.
+      """
+      if (size is not None) and (size < 1):
+         Util.raiseException("The fitness cache size must be >= 1", ValueError)
+
+      self.internalPop.setFitnessCache(size)
+
+   def setBloatControl(self, bloat_control=None):
+      """ Sets the bloat control of the Genetic Programming trees, the
+      offspring are filtered by the bloat control when the new generation
+      is created and the Tarpeian penalty is applied before the evaluation
+
+      Example:
+         >>> ga_engine.setBloatControl(Bloat.BloatControl(max_nodes=200))
+
+      :param bloat_control: the :class:`Bloat.BloatControl` instance, None
+                            (default) disables the bloat control
+
+      .. note:: the bloat control can be used only in GP mode.
+
+      .. versionadded:: 0.6
+         The `setBloatControl` method.
+      """
+      if (bloat_control is not None) and (not isinstance(bloat_control, BloatControl)):
+         Util.raiseException("The bloat control must be a BloatControl instance", TypeError)
+
+      if (bloat_control is not None) and (not self.getGPMode()):
+         Util.raiseException("The bloat control can be used only in GP mode", ValueError)
+
+      self.bloatControl = bloat_control
+
+   def getBloatControl(self):
+      """ Returns the bloat control of the GA Engine
+
+      :rtype: the :class:`Bloat.BloatControl` instance or None
+
+      .. versionadded:: 0.6
+         The `getBloatControl` method.
+      """
+      return self.bloatControl
 
    def setMigrationAdapter(self, migration_adapter=None):
       """ Sets the Migration Adapter
@@ -449,6 +552,29 @@ class GSimpleGA:
          Util.raiseException("The DB Adapter must be a DBBaseAdapter subclass", TypeError)
       self.dbAdapter = dbadapter
 
+   def setPopulation(self, population):
+      """ Replaces the population of the GA Engine, the population settings
+      (size, sort type, minimax, scaling and etc.) are kept, the batch evaluator
+      is the one of the new population
+
+      Example:
+         >>> pop = GArrayPopulation.G1DListArrayPopulation(genome)
+         >>> ga_engine.setPopulation(pop)
+
+      :param population: the new population, a :class:`GPopulation.GPopulation` instance
+
+      .. note:: when the population has the *breed* method, it's used to create
+                the next generation instead of the genome crossover and mutator.
+
+      .. versionadded:: 0.6
+         The `setPopulation` method.
+      """
+      if not isinstance(population, GPopulation):
+         Util.raiseException("The population must be a GPopulation instance", TypeError)
+
+      self.internalPop.copy(population)
+      self.internalPop = population
+
    def setPopulationSize(self, size):
       """ Sets the population size, calls setPopulationSize() of GPopulation
 
@@ -611,22 +737,81 @@ class GSimpleGA:
 
    def step(self):
       """ Just do one step in evolution, one generation """
+      if hasattr(self.internalPop, "breed"):
+         newPop = self.internalPop.breed(self)
+      else:
+         newPop = self.breed()
+
+      logging.debug("Evaluating the new created population.")
+      if self.getGPMode() and self.bloatControl is not None:
+         self.bloatControl.evaluate(newPop, self.internalPop)
+      else:
+         newPop.evaluate()
+
+      if self.elitism:
+         logging.debug("Doing elitism.")
+         # The best individuals are compared before any replacement, so the
+         # new population is sorted only once
+         elite = []
+         for i in xrange(self.nElitismReplacement):
+            best = self.internalPop.bestRaw(i)
+            if self.getMinimax() == Consts.minimaxType["maximize"]:
+               better = best.score > newPop.bestRaw(i).score
+            else:
+               better = best.score < newPop.bestRaw(i).score
+            if better:
+               elite.append((len(newPop)-1-i, best))
+
+         for index, best in elite:
+            newPop[index] = best
+
+      self.internalPop = newPop
+      self.internalPop.sort()
+
+      logging.debug("The generation %d was finished.", self.currentGeneration)
+
+      self.currentGeneration += 1
+
+      return (self.currentGeneration == self.nGenerations)
+
+   def breed(self):
+      """ Creates the next generation using the selector and the genome
+      crossover and mutator, the new population is not evaluated
+
+      :rtype: the new population
+
+      .. versionadded:: 0.6
+         The `breed` method.
+      """
       genomeMom = None
       genomeDad = None
 
+      def parents_iter(batch_size):
+         """ Yields the parents, selected in batches """
+         while True:
+            for individual in self.selectIndividuals(batch_size):
+               yield individual
+
       newPop = GPopulation(self.internalPop)
       logging.debug("Population was cloned.")
+
+      bloat = self.bloatControl if self.getGPMode() else None
+      if bloat is not None:
+         bloat.prepare(self.internalPop)
       
       size_iterate = len(self.internalPop)
 
       # Odd population size
       if size_iterate % 2 != 0: size_iterate -= 1
 
-      crossover_empty = self.select(popID=self.currentGeneration).crossover.isEmpty()
+      # All the parents of the generation are selected in one call
+      len_pop = len(self.internalPop)
+      parents = parents_iter(len_pop + len_pop % 2)
+
+      crossover_empty = self.internalPop[0].crossover.isEmpty()
       
-      for i in xrange(0, size_iterate, 2):
-         genomeMom = self.select(popID=self.currentGeneration)
-         genomeDad = self.select(popID=self.currentGeneration)
+      while len(newPop.internalPop) < size_iterate:
+         genomeMom, genomeDad = parents.next(), parents.next()
          
          if not crossover_empty and self.pCrossover >= 1.0:
             for it in genomeMom.crossover.applyFunctions(mom=genomeMom, dad=genomeDad, count=2):
@@ -642,45 +827,36 @@ class GSimpleGA:
          sister.mutate(pmut=self.pMutation, ga_engine=self)
          brother.mutate(pmut=self.pMutation, ga_engine=self)
 
-         newPop.internalPop.append(sister)
-         newPop.internalPop.append(brother)
+         if bloat is None:
+            newPop.internalPop.append(sister)
+            newPop.internalPop.append(brother)
+            continue
 
-      if len(self.internalPop) % 2 != 0:
-         genomeMom = self.select(popID=self.currentGeneration)
-         genomeDad = self.select(popID=self.currentGeneration)
+         # The offspring discarded by the bloat control are bred again
+         for child, parent in ((sister, genomeMom), (brother, genomeDad)):
+            child = bloat.filterChild(child, parent)
+            if (child is not None) and (len(newPop.internalPop) < size_iterate):
+               newPop.internalPop.append(child)
+
+      while len(newPop.internalPop) < len(self.internalPop):
+         genomeMom, genomeDad = parents.next(), parents.next()
 
          if Util.randomFlipCoin(self.pCrossover):
             for it in genomeMom.crossover.applyFunctions(mom=genomeMom, dad=genomeDad, count=1):
                (sister, brother) = it
+            parent = genomeMom
          else:
-            sister = random.choice([genomeMom, genomeDad])
-            sister = sister.clone()
+            parent = random.choice([genomeMom, genomeDad])
+            sister = parent.clone()
             sister.mutate(pmut=self.pMutation, ga_engine=self)
 
-         newPop.internalPop.append(sister)
-
-      logging.debug("Evaluating the new created population.")
-      newPop.evaluate()
-
-      if self.elitism:
-         logging.debug("Doing elitism.")
-         if self.getMinimax() == Consts.minimaxType["maximize"]:
-            for i in xrange(self.nElitismReplacement):
-               if self.internalPop.bestRaw(i).score > newPop.bestRaw(i).score:
-                  newPop[len(newPop)-1-i] = self.internalPop.bestRaw(i)
-         elif self.getMinimax() == Consts.minimaxType["minimize"]:
-            for i in xrange(self.nElitismReplacement):
-               if self.internalPop.bestRaw(i).score < newPop.bestRaw(i).score:
-                  newPop[len(newPop)-1-i] = self.internalPop.bestRaw(i)
-
-      self.internalPop = newPop
-      self.internalPop.sort()
+         if bloat is not None:
+            sister = bloat.filterChild(sister, parent)
+            if sister is None: continue
 
-      logging.debug("The generation %d was finished.", self.currentGeneration)
-
-      self.currentGeneration += 1
+         newPop.internalPop.append(sister)
 
-      return (self.currentGeneration == self.nGenerations)
+      return newPop
    
    def printStats(self):
       """ Print generation statistics
@@ -743,12 +919,17 @@ class GSimpleGA:
          if gp_function_prefix is not None:
             self.__gp_catch_functions(gp_function_prefix)
 
-      self.initialize()
-      self.internalPop.evaluate()
-      self.internalPop.sort()
-      logging.debug("Starting loop over evolutionary algorithm.")
+      # The pool is created only once, all the generations will reuse it
+      self.internalPop.createProcessPool()
+      # The workers are only waited when the evolution wasn't aborted
+      pool_wait = False
 
       try:      
+         self.initialize()
+         self.internalPop.evaluate()
+         self.internalPop.sort()
+         logging.debug("Starting loop over evolutionary algorithm.")
+
          while True:
             if self.migrationAdapter:
                logging.debug("Migration adapter: exchange")
@@ -815,9 +996,13 @@ class GSimpleGA:
 
             if self.step(): break
 
+         pool_wait = True
       except KeyboardInterrupt:
          logging.debug("CTRL-C detected, finishing evolution.")
          if freq_stats: print "\n\tA break was detected, you have interrupted the evolution !\n"
+         pool_wait = True
+      finally:
+         self.internalPop.terminateProcessPool(wait=pool_wait)
 
       if freq_stats != 0:
          self.printStats()
@@ -846,3 +1031,69 @@ class GSimpleGA:
       for it in self.selector.applyFunctions(self.internalPop, **args):
          return it
 
+   def prepareSelection(self):
+      """ Returns the selection state of the current population, used to
+      draw the parents of the new generation, or None when the selector slot
+      doesn't have a single selector object (the selection functions and the
+      random apply of the slot use the :meth:`select` method)
+
+      :rtype: the :class:`Selectors.Selection` instance or None
+
+      .. versionadded:: 0.6
+         The *prepareSelection* method.
+      """
+      if self.selector.rand_apply or len(self.selector) != 1:
+         return None
+      selector = self.selector[0]
+      if not isinstance(selector, SelectorBase):
+         return None
+      return selector.prepare(self.internalPop)
+
+   def selectParents(self, n):
+      """ Selects *n* individuals of the current population in one call,
+      used to select all the parents of the new generation
+
+      :param n: the number of individuals
+      :rtype: the list of indexes of the individuals in the population
+
+      .. note:: the selection functions of the slot must return individuals
+                of the population, use the :meth:`selectIndividuals` when the
+                individuals themselves are needed.
+
+      .. versionadded:: 0.6
+         The *selectParents* method.
+      """
+      selection = self.prepareSelection()
+      if selection is not None:
+         return selection.drawIndexes(n)
+
+      self.internalPop.sort()
+      index = dict((id(ind), i) for i, ind in enumerate(self.internalPop.internalPop))
+      indexes = []
+      for i in xrange(n):
+         individual = self.select(popID=self.currentGeneration)
+         if id(individual) not in index:
+            Util.raiseException("The selection function returned an individual which is not in the population, the indexes of the parents can't be found", ValueError)
+         indexes.append(index[id(individual)])
+      return indexes
+
+   def selectIndividuals(self, n):
+      """ Selects *n* individuals of the current population in one call,
+      used to select all the parents of the new generation. The selection
+      functions of the slot are called once for each individual, their
+      results are used as they are, so they can return individuals which
+      are not in the population (copies, for example)
+
+      :param n: the number of individuals
+      :rtype: the list of individuals
+
+      .. versionadded:: 0.6
+         The *selectIndividuals* method.
+      """
+      selection = self.prepareSelection()
+      if selection is not None:
+         return selection.draw(n)
+
+      self.internalPop.sort()
+      return [self.select(popID=self.currentGeneration) for i in xrange(n)]
+
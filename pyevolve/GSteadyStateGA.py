@@ -0,0 +1,379 @@
+"""
+
+:mod:`GSteadyStateGA` -- the steady-state genetic algorithm
+=====================================================================
+
+This module contains the steady-state GA Engine. Instead of breeding a
+whole new population each generation, as the :class:`GSimpleGA.GSimpleGA`,
+each step breeds and evaluates only a few offspring, which replace
+individuals of the population. It's useful when the evaluation function is
+slow, the good offspring are used as parents as soon as they are evaluated.
+
+The population is kept sorted by raw score and each offspring is inserted
+at its place with a binary search (see the
+:meth:`GPopulation.GPopulation.insertSorted`), so the population is never
+sorted again. There are two replacement policies:
+
+**Replace worst**
+   The offspring is inserted and the worst individual is removed, so an
+   offspring worse than all the population is discarded.
+
+**Replace random**
+   A random individual is removed and the offspring is inserted, the best
+   individuals are kept when the elitism is enabled (see the
+   :meth:`GSimpleGA.GSimpleGA.setElitismReplacement`).
+
+The GA Engine is a :class:`GSimpleGA.GSimpleGA`, it uses the same genome,
+the same selector, step callback and termination criteria slots and the
+same DB and migration adapters. A generation is a step, so the
+:meth:`GSimpleGA.GSimpleGA.setGenerations` sets the number of steps.
+
+**Asynchronous evaluation**
+   With the :meth:`GSteadyStateGA.setAsyncEvaluation`, the offspring are
+   evaluated by a pool of workers of the *concurrent.futures* module (the
+   *futures* package on Python 2). A new offspring is bred and submitted as
+   soon as a worker is free, and each step inserts the offspring whose
+   evaluation finished, so the workers don't wait for the slowest
+   individual. The throughput is in the statistics as *evalRate*, in
+   evaluations per second since the start of the evolution, so the DB
+   adapters store it too (but the CSV adapter, whose columns are fixed).
+
+Example:
+   >>> ga = GSteadyStateGA.GSteadyStateGA(genome)
+   >>> ga.setOffspringSize(4)
+   >>> ga.setReplacement(Consts.replacementType["random"])
+   >>> ga.selector.set(Selectors.GTournamentSelectorAlternative)
+   >>> ga.setGenerations(5000)
+   >>> ga.evolve(freq_stats=500)
+
+.. note:: the steady-state GA Engine uses only the raw sort type, the
+          scaling scheme is not used, and the bloat control is not used.
+
+.. versionadded:: 0.6
+   The *GSteadyStateGA* module.
+
+"""
+
+from GSimpleGA   import GSimpleGA
+from GPopulation import GPopulation
+
+import Consts
+import Util
+
+import random
+import logging
+
+from time import time
+
+try:
+   from multiprocessing import cpu_count
+except ImportError:
+   cpu_count = None
+
+def async_eval(individual):
+   """ Internal used by the asynchronous evaluation, evaluates the
+   individual in the worker and returns its raw score """
+   individual.evaluate()
+   return individual.score
+
+class GSteadyStateGA(GSimpleGA):
+   """ Steady-state GA Engine Class - The GA Engine which replaces a few
+   individuals of the population each step
+
+   Example:
+      >>> ga = GSteadyStateGA.GSteadyStateGA(genome)
+      >>> ga.setReplacement(Consts.replacementType["worst"])
+      >>> ga.evolve()
+
+   :param genome: the :term:`Sample Genome`
+   :param interactiveMode: this flag enables the Interactive Mode, the default is True
+   :param seed: the random seed value
+
+   .. versionadded:: 0.6
+      The *GSteadyStateGA* class.
+   """
+
+   def __init__(self, genome, seed=None, interactiveMode=True):
+      """ Initializator of GSteadyStateGA """
+      GSimpleGA.__init__(self, genome, seed, interactiveMode)
+      self.internalPop.sortType = Consts.sortType["raw"]
+      self.nOffspring  = Consts.CDefSSGAOffspring
+      self.replacement = Consts.CDefSSGAReplacement
+
+      # Asynchronous evaluation: (flag, max_workers, threads)
+      self.asyncEvaluation = (False, None, False)
+      self.futuresmod   = None
+      self.executor     = None
+      self.asyncWorkers = 0
+      self.pending      = {}
+      self.asyncEvals   = 0
+      self.asyncStart   = None
+
+   def __repr__(self):
+      """ The string representation of the GA Engine """
+      ret =  "- GSteadyStateGA\n"
+      ret += "\tOffspring Size:\t\t %d\n" % (self.nOffspring,)
+      ret += "\tReplacement:\t\t %s\n" % (Consts.replacementType.keys()[Consts.replacementType.values().index(self.replacement)].capitalize(),)
+      ret += "\tAsync Evaluation:\t %s\n" % (self.asyncEvaluation[0],)
+      # The settings of the GSimpleGA, without its title
+      ret += GSimpleGA.__repr__(self).split("\n", 1)[1]
+      return ret
+
+   def setOffspringSize(self, size):
+      """ Sets the number of offspring bred and evaluated each step
+
+      :param size: the number of offspring, >= 1
+      """
+      if size < 1:
+         Util.raiseException("The offspring size must be >= 1", ValueError)
+      self.nOffspring = size
+
+   def setReplacement(self, replacement):
+      """ Sets the replacement policy
+
+      Example:
+         >>> ga_engine.setReplacement(Consts.replacementType["random"])
+
+      :param replacement: the replacement type, Consts.replacementType["worst"]
+                          or Consts.replacementType["random"]
+      """
+      if replacement not in Consts.replacementType.values():
+         Util.raiseException("replacement must be a Consts.replacementType type", TypeError)
+      self.replacement = replacement
+
+   def setAsyncEvaluation(self, flag=True, max_workers=None, threads=False):
+      """ Enables or disables the asynchronous evaluation of the offspring,
+      with a pool of workers of the *concurrent.futures* module
+
+      Example:
+         >>> ga_engine.setAsyncEvaluation(True, max_workers=8)
+
+      :param flag: True (default) or False
+      :param max_workers: the number of workers, None (default) uses the
+                          number of CPU cores
+      :param threads: if True, the workers are threads, otherwise (default)
+                      they are processes
+
+      .. note:: with the worker processes, the individuals are sent to the
+                workers, so the evaluation function must be picklable (a
+                module level function). The batch evaluator of the population
+                is not used, the individuals are evaluated one by one.
+
+      .. note:: the initial population is evaluated by the workers too, when
+                the lazy evaluation is enabled.
+      """
+      if flag:
+         self.futuresmod = Util.importSpecial("concurrent.futures").futures
+      if (max_workers is not None) and (max_workers < 1):
+         Util.raiseException("The max_workers must be >= 1", ValueError)
+      self.asyncEvaluation = (flag, max_workers, threads)
+
+   def setSortType(self, sort_type):
+      """ Sets the sort type, only the raw sort type is supported by the
+      steady-state GA Engine
+
+      :param sort_type: the Sort Type, Consts.sortType["raw"]
+      """
+      if sort_type != Consts.sortType["raw"]:
+         Util.raiseException("The steady-state GA Engine supports only the raw sort type", ValueError)
+      GSimpleGA.setSortType(self, sort_type)
+
+   def setPopulation(self, population):
+      """ Replaces the population of the GA Engine, see the
+      :meth:`GSimpleGA.GSimpleGA.setPopulation`
+
+      :param population: the new population, a :class:`GPopulation.GPopulation`
+                         instance without the *breed* method
+      """
+      if hasattr(population, "breed"):
+         Util.raiseException("The steady-state GA Engine doesn't support the populations with the breed method", TypeError)
+      GSimpleGA.setPopulation(self, population)
+
+   def breedOffspring(self, count):
+      """ Creates the offspring of a step using the selector and the genome
+      crossover and mutator, the offspring are not evaluated
+
+      :param count: the number of offspring
+      :rtype: a population with the offspring
+
+      """
+      offspring = GPopulation(self.internalPop)
+      parents = self.selectIndividuals(count + count % 2)
+      crossover_empty = self.internalPop[0].crossover.isEmpty()
+
+      for i in xrange(0, len(parents), 2):
+         genomeMom, genomeDad = parents[i], parents[i+1]
+
+         if not crossover_empty and Util.randomFlipCoin(self.pCrossover):
+            for it in genomeMom.crossover.applyFunctions(mom=genomeMom, dad=genomeDad, count=2):
+               (sister, brother) = it
+         else:
+            sister = genomeMom.clone()
+            brother = genomeDad.clone()
+
+         for child in (sister, brother):
+            if len(offspring.internalPop) < count:
+               child.mutate(pmut=self.pMutation, ga_engine=self)
+               offspring.internalPop.append(child)
+
+      return offspring
+
+   def replace(self, individual):
+      """ Replaces an individual of the population by the offspring, with
+      the replacement policy
+
+      :param individual: the offspring, evaluated
+      """
+      pop = self.internalPop
+      if self.replacement == Consts.replacementType["worst"]:
+         pop.insertSorted(individual)
+         pop.removeSorted(-1)
+      else:
+         protected = self.nElitismReplacement if self.elitism else 0
+         protected = min(protected, len(pop) - 1)
+         pop.removeSorted(random.randint(protected, len(pop) - 1))
+         pop.insertSorted(individual)
+
+   def step(self):
+      """ Just do one step in evolution, breeds and evaluates the offspring
+      and inserts them in the population """
+      if self.executor is not None:
+         return self.asyncStep()
+
+      offspring = self.breedOffspring(self.nOffspring)
+      offspring.evaluate()
+
+      for individual in offspring:
+         self.replace(individual)
+      self.internalPop.stats["evalTime"] = offspring.stats["evalTime"]
+      if "evalRate" in offspring.stats:
+         self.internalPop.stats["evalRate"] = offspring.stats["evalRate"]
+
+      logging.debug("The step %d was finished.", self.currentGeneration)
+
+      self.currentGeneration += 1
+
+      return (self.currentGeneration == self.nGenerations)
+
+   def initialize(self):
+      """ Initializes the GA Engine, with the asynchronous evaluation, the
+      initial population is evaluated by the workers """
+      GSimpleGA.initialize(self)
+      if (self.executor is None) or (not self.internalPop.lazyEvaluation):
+         return
+
+      time_init = time()
+      individuals = self.internalPop.internalPop
+      for individual, score in zip(individuals, self.executor.map(async_eval, individuals)):
+         individual.score = score
+         individual.setModified(False)
+      self.asyncEvals += len(individuals)
+      self.internalPop.stats["evalTime"] = time() - time_init
+      self.updateEvalRate()
+
+   def evolve(self, freq_stats=0):
+      """ Do all the steps until the termination criteria, see the
+      :meth:`GSimpleGA.GSimpleGA.evolve`, the workers of the asynchronous
+      evaluation live during the evolution
+
+      :param freq_stats: if greater than 0, the statistics will be
+                         printed every freq_stats steps.
+      :rtype: returns the best individual of the evolution
+      """
+      if not self.asyncEvaluation[0]:
+         return GSimpleGA.evolve(self, freq_stats)
+
+      flag, max_workers, threads = self.asyncEvaluation
+      if max_workers is None:
+         try:
+            max_workers = cpu_count()
+         except (TypeError, NotImplementedError):
+            max_workers = 1
+
+      logging.debug("Starting %d workers for the asynchronous evaluation", max_workers)
+      if threads:
+         self.executor = self.futuresmod.ThreadPoolExecutor(max_workers)
+      else:
+         self.executor = self.futuresmod.ProcessPoolExecutor(max_workers)
+      self.asyncWorkers = max_workers
+      self.asyncEvals = 0
+      self.asyncStart = time()
+
+      try:
+         return GSimpleGA.evolve(self, freq_stats)
+      finally:
+         logging.debug("Shutting down the workers of the asynchronous evaluation")
+         for future in self.pending:
+            future.cancel()
+         self.pending.clear()
+         self.executor.shutdown(wait=True)
+         self.executor = None
+
+   def updateEvalRate(self):
+      """ Sets the *evalRate* statistic of the asynchronous evaluation, the
+      evaluations per second since the start of the evolution """
+      elapsed = time() - self.asyncStart
+      if elapsed > 0.0:
+         self.internalPop.stats["evalRate"] = self.asyncEvals / elapsed
+
+   def submit(self, individual):
+      """ Sends the offspring to the workers, the offspring which don't need
+      an evaluation (not changed with the lazy evaluation or in the fitness
+      cache) are inserted in the population at once
+
+      :param individual: the offspring
+      :rtype: True if the offspring was sent to the workers
+      """
+      pop = self.internalPop
+      if pop.lazyEvaluation and not individual.isModified():
+         self.replace(individual)
+         return False
+
+      key = None
+      cache = pop.fitnessCache
+      if cache is not None:
+         key = cache.makeKey(individual)
+         score = cache.lookup(key) if key is not None else None
+         if score is not None:
+            individual.resetStats()
+            individual.score = score
+            individual.setModified(False)
+            self.replace(individual)
+            return False
+
+      future = self.executor.submit(async_eval, individual)
+      self.pending[future] = (individual, key)
+      return True
+
+   def asyncStep(self):
+      """ A step of the asynchronous evaluation, the free workers receive new
+      offspring and the offspring whose evaluation finished are inserted in
+      the population """
+      # Bounded, when the offspring don't need evaluations
+      for i in xrange(self.asyncWorkers):
+         if len(self.pending) >= self.asyncWorkers: break
+         for individual in self.breedOffspring(self.nOffspring):
+            self.submit(individual)
+
+      if self.pending:
+         time_init = time()
+         done, not_done = self.futuresmod.wait(self.pending, return_when=self.futuresmod.FIRST_COMPLETED)
+         self.internalPop.stats["evalTime"] = time() - time_init
+
+         cache = self.internalPop.fitnessCache
+         for future in done:
+            individual, key = self.pending.pop(future)
+            individual.score = future.result()
+            individual.setModified(False)
+            if key is not None:
+               cache.store(key, individual.score)
+            self.replace(individual)
+            self.asyncEvals += 1
+
+      self.updateEvalRate()
+
+      logging.debug("The asynchronous step %d was finished.", self.currentGeneration)
+
+      self.currentGeneration += 1
+
+      return (self.currentGeneration == self.nGenerations)
@@ -27,6 +27,17 @@ Default Parameters
 
    The Strict Single Point crossover for GTree
 
+Vectorized GP evaluation
+-------------------------------------------------------------
+
+The :meth:`GTreeGP.evaluateCases` method evaluates the tree only once for all
+the fitness cases, the terminals are bound to `NumPy <http://numpy.scipy.org>`_
+arrays with one value for each case, so the GP functions must work on arrays.
+The protected operators :func:`protectedDiv`, :func:`protectedLog` and
+:func:`protectedSqrt` are safe on arrays and can be used as GP functions: ::
+
+   gp_div = GTree.protectedDiv
+
 .. versionadded:: 0.6
    The *GTree* module.
 
@@ -34,10 +45,17 @@ Classes
 -------------------------------------------------------------
 """
 import random
+import math
 from GenomeBase import GenomeBase, GTreeBase, GTreeNodeBase
 import Consts
 import Util
 
+try:
+   import numpy
+   HAVE_NUMPY = True
+except ImportError:
+   HAVE_NUMPY = False
+
 try:
    import pydot
    HAVE_PYDOT = True
@@ -91,12 +109,13 @@ class GTree(GenomeBase, GTreeBase):
       genome.crossover.set(Crossovers.G1DListCrossoverUniform)
    """
 
-   def __init__(self, root_node=None):
-      GenomeBase.__init__(self)
+   def __init__(self, root_node=None, cloning=False):
+      GenomeBase.__init__(self, cloning)
       GTreeBase.__init__(self, root_node)
-      self.initializator.set(Consts.CDefGTreeInit)
-      self.mutator.set(Consts.CDefGGTreeMutator)
-      self.crossover.set(Consts.CDefGTreeCrossover)
+      if not cloning:
+         self.initializator.set(Consts.CDefGTreeInit)
+         self.mutator.set(Consts.CDefGGTreeMutator)
+         self.crossover.set(Consts.CDefGTreeCrossover)
 
    def __repr__(self):
       """ Return a string representation of Genome """
@@ -104,6 +123,49 @@ class GTree(GenomeBase, GTreeBase):
       ret += GTreeBase.__repr__(self)
       return ret
 
+   def exportGenes(self):
+      """ Returns a compact copy of the tree, used to send the genome
+      data to another process without the node objects
+
+      :rtype: a tuple with the (data, number of childs) of the nodes in pre order
+
+      .. versionadded:: 0.6
+         The *exportGenes* method.
+      """
+      genes = []
+      node_stack = [self.getRoot()]
+      while len(node_stack) > 0:
+         tmp = node_stack.pop()
+         childs = tmp.getChilds()
+         genes.append((tmp.getData(), len(childs)))
+         node_stack.extend(childs[::-1])
+      return tuple(genes)
+
+   def importGenes(self, genes):
+      """ Rebuilds the tree from the genes returned by *exportGenes*
+
+      :param genes: the genes tuple
+
+      .. versionadded:: 0.6
+         The *importGenes* method.
+      """
+      root = None
+      parent_stack = []
+      for data, nchilds in genes:
+         node = GTreeNode(data)
+         if len(parent_stack) > 0:
+            parent, remaining = parent_stack[-1]
+            node.setParent(parent)
+            parent.addChild(node)
+            if remaining == 1: parent_stack.pop()
+            else:              parent_stack[-1] = (parent, remaining-1)
+         else:
+            root = node
+         if nchilds > 0:
+            parent_stack.append((node, nchilds))
+      self.setRoot(root)
+      self.processNodes()
+
    def copy(self, g):
       """ Copy the contents to the destination g
       
@@ -117,7 +179,7 @@ class GTree(GenomeBase, GTreeBase):
       
       :rtype: new GTree instance
       """
-      newcopy = GTree()
+      newcopy = GTree(cloning=True)
       self.copy(newcopy)
       newcopy.processNodes(True)
       return newcopy
@@ -134,6 +196,8 @@ class GTreeNode(GTreeNodeBase):
                   must be *None*
    """
 
+   __slots__ = ("node_data",)
+
    def __init__(self, data, parent=None):
       GTreeNodeBase.__init__(self, parent)
       self.node_data = data
@@ -210,16 +274,20 @@ def buildGTreeGrow(depth, value_callback, max_siblings, max_depth):
    :rtype: the root node of created tree
    """
 
-   random_value = value_callback()
-   n = GTreeNode(random_value)
+   root = None
+   # The (parent, depth) of the nodes still to be created
+   pending = [(None, depth)]
+   while len(pending) > 0:
+      parent, node_depth = pending.pop()
+      n = GTreeNode(value_callback(), parent)
+      if parent is None: root = n
+      else:              parent.childs.append(n)
 
-   if depth == max_depth: return n
+      if node_depth == max_depth: continue
 
-   for i in xrange(random.randint(0, abs(max_siblings))):
-      child = buildGTreeGrow(depth+1, value_callback, max_siblings, max_depth)
-      child.setParent(n)
-      n.addChild(child)
-   return n
+      nchilds = random.randint(0, abs(max_siblings))
+      pending.extend([(n, node_depth+1)] * nchilds)
+   return root
 
 def buildGTreeFull(depth, value_callback, max_siblings, max_depth):
    """ Random generates a Tree structure using the value_callback
@@ -234,19 +302,21 @@ def buildGTreeFull(depth, value_callback, max_siblings, max_depth):
    :rtype: the root node of created tree
    """
 
-   random_value = value_callback()
-   n = GTreeNode(random_value)
+   root = None
+   # The (parent, depth) of the nodes still to be created
+   pending = [(None, depth)]
+   while len(pending) > 0:
+      parent, node_depth = pending.pop()
+      n = GTreeNode(value_callback(), parent)
+      if parent is None: root = n
+      else:              parent.childs.append(n)
 
-   if depth == max_depth: return n
+      if node_depth == max_depth: continue
 
-   if max_siblings < 0: range_val = abs(max_siblings)
-   else:                range_val = random.randint(1, abs(max_siblings))
- 
-   for i in xrange(range_val):
-      child = buildGTreeFull(depth+1, value_callback, max_siblings, max_depth)
-      child.setParent(n)
-      n.addChild(child)
-   return n
+      if max_siblings < 0: range_val = abs(max_siblings)
+      else:                range_val = random.randint(1, abs(max_siblings))
+      pending.extend([(n, node_depth+1)] * range_val)
+   return root
 
 #################################
 #             GTree   GP        # 
@@ -264,6 +334,9 @@ class GTreeNodeGP(GTreeNodeBase):
    :param parent: the node parent
    
    """
+
+   __slots__ = ("node_data", "node_type")
+
    def __init__(self, data, node_type=0, parent=None):
       GTreeNodeBase.__init__(self, parent)
       self.node_type = node_type
@@ -362,11 +435,25 @@ class GTreeGP(GenomeBase, GTreeBase):
 
    .. inheritance-diagram:: GTree.GTreeGP
 
+   The compiled code of the tree is kept in the genome until the tree is
+   changed, and the code objects are shared by all the trees with the same
+   expression using the class-level :attr:`codeCache`.
+
+   .. note:: if you change the nodes of the tree directly, you must call
+             the *processNodes* or the *setModified* method.
+
    :param root_node: the Root node of the GP Tree
    """
+
+   codeCache = None
+   """ The :class:`Util.BoundedCache` of code objects keyed by the
+   expression string, shared by all the GTreeGP genomes, it's created
+   by the :meth:`getCodeCache` method """
+
    def __init__(self, root_node=None, cloning=False):
-      GenomeBase.__init__(self)
+      GenomeBase.__init__(self, cloning)
       GTreeBase.__init__(self, root_node)
+      self.compiledCode = None
       if not cloning:
          self.initializator.set(Consts.CDefGTreeGPInit)
          self.mutator.set(Consts.CDefGGTreeGPMutator)
@@ -473,22 +560,27 @@ class GTreeGP(GenomeBase, GTreeBase):
       
       :rtype: a S-Expression representing the tree
       """
-      str_buff = ""
+      str_buff = []
       if start_node is None:
          start_node = self.getRoot()
-         str_buff += "%s " % start_node.getData()
+         str_buff.append("%s " % start_node.getData())
 
-      is_leaf = start_node.isLeaf()
-      if not is_leaf:
-         str_buff += "( "
+      node_stack = [start_node]
+      while len(node_stack) > 0:
+         tmp = node_stack.pop()
+         if isinstance(tmp, basestring):
+            str_buff.append(tmp)
+            continue
+         if tmp.isLeaf():
+            continue
 
-      for child_node in start_node.getChilds():
-         str_buff += "%s " % child_node.getData()
-         str_buff += self.getSExpression(child_node)
+         str_buff.append("( ")
+         node_stack.append(" )")
+         for child_node in reversed(tmp.getChilds()):
+            node_stack.append(child_node)
+            node_stack.append("%s " % child_node.getData())
 
-      if not is_leaf:
-         str_buff += " )"
-      return str_buff
+      return "".join(str_buff)
 
    def getPreOrderExpression(self, start_node=None):
       """ Return the pre order expression string of the Tree, used
@@ -499,28 +591,172 @@ class GTreeGP(GenomeBase, GTreeBase):
       if start_node is None:
          start_node = self.getRoot()
 
-      str_buff = start_node.getData()
+      str_buff = []
+      node_stack = [start_node]
+      while len(node_stack) > 0:
+         tmp = node_stack.pop()
+         if isinstance(tmp, basestring):
+            str_buff.append(tmp)
+            continue
+
+         str_buff.append(tmp.getData())
+         all_childs = tmp.getChilds()
+         if len(all_childs) > 0:
+            node_stack.append(")")
+            for index in xrange(len(all_childs)-1, 0, -1):
+               node_stack.append(all_childs[index])
+               node_stack.append(", ")
+            node_stack.append(all_childs[0])
+            node_stack.append("(")
+
+      return "".join(str_buff)
 
-      if not start_node.isLeaf():
-         all_childs  = start_node.getChilds()
-         str_buff += "(" + self.getPreOrderExpression(all_childs[0])
+   @staticmethod
+   def getCodeCache():
+      """ Returns the class-level cache of compiled code, the cache size
+      is the :attr:`Consts.CDefGTreeGPCodeCacheSize`
 
-         for index in xrange(1, len(all_childs)):
-            child = all_childs[index]
-            str_buff += ", " + self.getPreOrderExpression(child)
-         str_buff += ")"
-      
-      return str_buff
+      :rtype: the :class:`Util.BoundedCache` instance
+
+      .. versionadded:: 0.6
+         The *getCodeCache* method.
+      """
+      if GTreeGP.codeCache is None:
+         GTreeGP.codeCache = Util.BoundedCache(Consts.CDefGTreeGPCodeCacheSize)
+      return GTreeGP.codeCache
 
    def getCompiledCode(self):
       """ Get the compiled code for the Tree expression
       After getting the compiled code object, you just need to evaluate it using
       the :func:`eval` native Python method.
+
+      The code is compiled only once for each expression, the code object
+      is kept in the genome until the tree changes.
       
       :rtype: compiled python code
       """
+      cache = GTreeGP.getCodeCache()
+      if self.compiledCode is not None:
+         cache.hits += 1
+         return self.compiledCode
+
       expr = self.getPreOrderExpression()
-      return compile(expr, "<string>", "eval")
+      code = cache.lookup(expr)
+      if code is None:
+         code = compile(expr, "<string>", "eval")
+         cache.store(expr, code)
+      self.compiledCode = code
+      return code
+
+   def evaluateCases(self, cases, namespace=None):
+      """ Evaluates the tree expression once for all the fitness cases,
+      the terminals are bound to NumPy arrays with one value for each case
+
+      Example:
+         >>> a = numpy.linspace(-1.0, 1.0, 1000)
+         >>> b = numpy.linspace(0.0, 2.0, 1000)
+         >>> outputs = chromosome.evaluateCases({"a": a, "b": b})
+         >>> rmse = numpy.sqrt(((outputs - (a*a + b)) ** 2).mean())
+
+      :param cases: a dict with the terminal names and the arrays of values
+      :param namespace: the dict with the GP functions, by default the
+                        *__main__* module namespace, the same used to catch
+                        the GP functions by the *gp_function_prefix*
+      :rtype: the NumPy array of outputs, one value for each case
+
+      .. note:: this method requires the NumPy module.
+
+      .. versionadded:: 0.6
+         The *evaluateCases* method.
+      """
+      if not HAVE_NUMPY:
+         Util.raiseException("You must install NumPy to use the evaluateCases method !", ImportError)
+
+      if namespace is None:
+         import __main__ as mod_main
+         namespace = mod_main.__dict__
+
+      outputs = numpy.asarray(eval(self.getCompiledCode(), namespace, cases), dtype=float)
+      if outputs.ndim == 0:
+         # Constant trees
+         shape = numpy.shape(cases.itervalues().next()) if len(cases) > 0 else ()
+         outputs = numpy.zeros(shape) + outputs
+      return outputs
+
+   def processNodes(self, cloning=False):
+      """ Updates the nodes cache of the tree, see the
+      :meth:`GenomeBase.GTreeBase.processNodes`, the compiled
+      code is discarded when the tree was changed
+
+      :param cloning: if the tree is a clone
+      """
+      GTreeBase.processNodes(self, cloning)
+      if not cloning:
+         self.compiledCode = None
+
+   def setModified(self, flag=True):
+      """ Marks the genome as changed, the compiled code is discarded
+
+      :param flag: True (default) or False
+      """
+      GenomeBase.setModified(self, flag)
+      if flag:
+         self.compiledCode = None
+
+   def mutate(self, **args):
+      """ Called to mutate the genome, the compiled code is
+      discarded when the tree is mutated
+
+      :param args: this parameters will be passed to the mutator
+      :rtype: the number of mutations returned by mutation operator
+      """
+      nmuts = GenomeBase.mutate(self, **args)
+      if nmuts > 0:
+         self.compiledCode = None
+      return nmuts
+
+   def exportGenes(self):
+      """ Returns a compact copy of the tree, used to send the genome
+      data to another process without the node objects
+
+      :rtype: a tuple with the (data, type, number of childs) of the nodes in pre order
+
+      .. versionadded:: 0.6
+         The *exportGenes* method.
+      """
+      genes = []
+      node_stack = [self.getRoot()]
+      while len(node_stack) > 0:
+         tmp = node_stack.pop()
+         childs = tmp.getChilds()
+         genes.append((tmp.getData(), tmp.getType(), len(childs)))
+         node_stack.extend(childs[::-1])
+      return tuple(genes)
+
+   def importGenes(self, genes):
+      """ Rebuilds the tree from the genes returned by *exportGenes*
+
+      :param genes: the genes tuple
+
+      .. versionadded:: 0.6
+         The *importGenes* method.
+      """
+      root = None
+      parent_stack = []
+      for data, node_type, nchilds in genes:
+         node = GTreeNodeGP(data, node_type)
+         if len(parent_stack) > 0:
+            parent, remaining = parent_stack[-1]
+            node.setParent(parent)
+            parent.addChild(node)
+            if remaining == 1: parent_stack.pop()
+            else:              parent_stack[-1] = (parent, remaining-1)
+         else:
+            root = node
+         if nchilds > 0:
+            parent_stack.append((node, nchilds))
+      self.setRoot(root)
+      self.processNodes()
 
    def copy(self, g):
       """ Copy the contents to the destination g
@@ -530,6 +766,13 @@ class GTreeGP(GenomeBase, GTreeBase):
       GenomeBase.copy(self, g)
       GTreeBase.copy(self, g)
 
+   def __getstate__(self):
+      """ Returns the genome attributes without the compiled code, which
+      can't be pickled, it's compiled again from the :attr:`codeCache` """
+      state = self.__dict__.copy()
+      state["compiledCode"] = None
+      return state
+
    def clone(self):
       """ Return a new instance of the genome
       
@@ -644,6 +887,56 @@ class GTreeGP(GenomeBase, GTreeBase):
 #    Tree GP Utility Functions  # 
 #################################
 
+def protectedDiv(a, b):
+   """ The protected division for GP, returns 1.0 where the absolute
+   value of the divisor is lower than :attr:`Consts.CDefGPProtectedEpsilon`,
+   works on numbers, the result is a float, and on NumPy arrays
+
+   Example:
+      >>> gp_div = GTree.protectedDiv
+
+   .. versionadded:: 0.6
+      The *protectedDiv* function.
+   """
+   if not (HAVE_NUMPY and (isinstance(a, numpy.ndarray) or isinstance(b, numpy.ndarray))):
+      if abs(b) > Consts.CDefGPProtectedEpsilon:
+         return float(a) / b
+      return 1.0
+
+   safe = numpy.abs(b) > Consts.CDefGPProtectedEpsilon
+   return numpy.where(safe, numpy.divide(a, numpy.where(safe, b, 1.0)), 1.0)
+
+def protectedLog(a):
+   """ The protected logarithm for GP, returns the log of the absolute
+   value and 0.0 where the value is lower than the
+   :attr:`Consts.CDefGPProtectedEpsilon`, works on numbers, the result is
+   a float, and on NumPy arrays
+
+   .. versionadded:: 0.6
+      The *protectedLog* function.
+   """
+   if not (HAVE_NUMPY and isinstance(a, numpy.ndarray)):
+      a = abs(a)
+      if a > Consts.CDefGPProtectedEpsilon:
+         return math.log(a)
+      return 0.0
+
+   a = numpy.abs(a)
+   safe = a > Consts.CDefGPProtectedEpsilon
+   return numpy.where(safe, numpy.log(numpy.where(safe, a, 1.0)), 0.0)
+
+def protectedSqrt(a):
+   """ The protected square root for GP, returns the square root of the
+   absolute value, works on numbers, the result is a float, and on NumPy
+   arrays
+
+   .. versionadded:: 0.6
+      The *protectedSqrt* function.
+   """
+   if not (HAVE_NUMPY and isinstance(a, numpy.ndarray)):
+      return math.sqrt(abs(a))
+   return numpy.sqrt(numpy.abs(a))
+
 def gpdec(**kwds):
    """ This is a decorator to use with genetic programming non-terminals
    
@@ -683,30 +976,32 @@ def buildGTreeGPGrow(ga_engine, depth, max_depth):
    gp_function_set = ga_engine.getParam("gp_function_set")
    assert gp_function_set is not None
 
-   if depth == max_depth:
-      random_terminal = checkTerminal(random.choice(gp_terminals))
-      n = GTreeNodeGP(random_terminal, Consts.nodeType["TERMINAL"])
-      return n
-   else:
-      # Do not generate degenerative trees 
-      if depth == 0:
-         random_node = random.choice(gp_function_set.keys())
+   root = None
+   # The (parent, depth) of the nodes still to be created
+   pending = [(None, depth)]
+   while len(pending) > 0:
+      parent, node_depth = pending.pop()
+      if node_depth == max_depth:
+         random_terminal = checkTerminal(random.choice(gp_terminals))
+         n = GTreeNodeGP(random_terminal, Consts.nodeType["TERMINAL"], parent)
       else:
-         fchoice = random.choice([gp_function_set.keys(), gp_terminals])
-         random_node = random.choice(fchoice)
+         # Do not generate degenerative trees 
+         if node_depth == 0:
+            random_node = random.choice(gp_function_set.keys())
+         else:
+            fchoice = random.choice([gp_function_set.keys(), gp_terminals])
+            random_node = random.choice(fchoice)
 
-      if random_node in gp_terminals:
-         n = GTreeNodeGP(checkTerminal(random_node), Consts.nodeType["TERMINAL"])
-      else:
-         n = GTreeNodeGP(random_node, Consts.nodeType["NONTERMINAL"])
+         if random_node in gp_terminals:
+            n = GTreeNodeGP(checkTerminal(random_node), Consts.nodeType["TERMINAL"], parent)
+         else:
+            n = GTreeNodeGP(random_node, Consts.nodeType["NONTERMINAL"], parent)
+            pending.extend([(n, node_depth+1)] * gp_function_set[random_node])
 
-   if n.getType() == Consts.nodeType["NONTERMINAL"]:
-      for i in xrange(gp_function_set[n.getData()]):
-         child = buildGTreeGPGrow(ga_engine, depth+1, max_depth)
-         child.setParent(n)
-         n.addChild(child)
+      if parent is None: root = n
+      else:              parent.childs.append(n)
 
-   return n
+   return root
 
 def buildGTreeGPFull(ga_engine, depth, max_depth):
    """ Creates a new random GTreeGP root node with subtrees using
@@ -723,19 +1018,21 @@ def buildGTreeGPFull(ga_engine, depth, max_depth):
    gp_function_set = ga_engine.getParam("gp_function_set")
    assert gp_function_set is not None
 
-   if depth == max_depth:
-      random_terminal = checkTerminal(random.choice(gp_terminals))
-      n = GTreeNodeGP(random_terminal, Consts.nodeType["TERMINAL"])
-      return n
-   else:
-      random_oper = random.choice(gp_function_set.keys())
-      n = GTreeNodeGP(random_oper, Consts.nodeType["NONTERMINAL"])
+   root = None
+   # The (parent, depth) of the nodes still to be created
+   pending = [(None, depth)]
+   while len(pending) > 0:
+      parent, node_depth = pending.pop()
+      if node_depth == max_depth:
+         random_terminal = checkTerminal(random.choice(gp_terminals))
+         n = GTreeNodeGP(random_terminal, Consts.nodeType["TERMINAL"], parent)
+      else:
+         random_oper = random.choice(gp_function_set.keys())
+         n = GTreeNodeGP(random_oper, Consts.nodeType["NONTERMINAL"], parent)
+         pending.extend([(n, node_depth+1)] * gp_function_set[random_oper])
 
-   if n.getType() == Consts.nodeType["NONTERMINAL"]:
-      for i in xrange(gp_function_set[n.getData()]):
-         child = buildGTreeGPFull(ga_engine, depth+1, max_depth)
-         child.setParent(n)
-         n.addChild(child)
+      if parent is None: root = n
+      else:              parent.childs.append(n)
 
-   return n
+   return root
 
@@ -0,0 +1,560 @@
+"""
+
+:mod:`GTreeDAG` -- the subtree-sharing GP tree chromosome
+=============================================================
+
+This module contains the :class:`GTreeDAG.GTreeGPDAG` chromosome, a Genetic
+Programming tree where the nodes are immutable and *hash-consed*: there is
+only one :class:`GTreeDAG.GTreeNodeDAG` instance for each distinct subtree, so
+the identical subtrees are shared by all the individuals of the population
+(the trees of the population form a DAG).
+
+Since the nodes are never changed, the clone of the genome just shares the
+root node, and the genetic operators rebuild only the nodes on the path from
+the root to the changed subtree (copy-on-write), the rest of the tree is
+shared with the parents. The nodes don't have a parent, they are addressed
+by their *path*, the list of child indexes from the root.
+
+The :meth:`GTreeGPDAG.evaluateCases` method evaluates the tree over a batch
+of fitness cases node by node, and accepts a *memo* dict to reuse the
+results of the subtrees shared by many individuals: ::
+
+   memo = {}
+   def eval_func(chromosome):
+      outputs = chromosome.evaluateCases({"a": a, "b": b}, memo=memo)
+      (...)
+
+   def step_callback(ga_engine):
+      memo.clear()
+
+Default Parameters
+-------------------------------------------------------------
+
+*Initializator*
+
+   :func:`Initializators.GTreeGPDAGInitializator`
+
+   The initializator, accepts the *max_depth* and *method* parameters
+
+*Mutator*
+
+   :func:`Mutators.GTreeGPDAGMutatorSubtree`
+
+   The subtree mutator
+
+*Crossover*
+
+   :func:`Crossovers.GTreeGPDAGCrossoverSinglePoint`
+
+   The single point crossover
+
+.. versionadded:: 0.6
+   The *GTreeDAG* module.
+
+Classes
+-------------------------------------------------------------
+"""
+import random
+import weakref
+from GenomeBase import GenomeBase
+from GTree import GTreeGP, checkTerminal
+import Consts
+import Util
+
+nodeStore = weakref.WeakValueDictionary()
+""" The store of the live nodes, keyed by (data, type, childs) """
+
+class GTreeNodeDAG(object):
+   """ The GTreeNodeDAG Class - The immutable node of the GTreeGPDAG
+
+   The nodes must be created by the :func:`makeNode` function, which returns
+   the existing node when the same subtree was already created. Since the
+   nodes are unique, they are compared by identity.
+
+   :param data: the node data
+   :param node_type: the node type
+   :param childs: the tuple of child nodes
+
+   .. versionadded:: 0.6
+      The *GTreeNodeDAG* class.
+   """
+
+   __slots__ = ("node_data", "node_type", "childs", "size", "leafs", "height",
+                "code", "__weakref__")
+
+   def __init__(self, data, node_type, childs):
+      self.node_data = data
+      self.node_type = node_type
+      self.childs = childs
+      self.code = None
+      if len(childs) == 0:
+         self.size, self.leafs, self.height = 1, 1, 0
+      else:
+         self.size = 1 + sum([child.size for child in childs])
+         self.leafs = sum([child.leafs for child in childs])
+         self.height = 1 + max([child.height for child in childs])
+
+   def __reduce__(self):
+      """ The unpickled nodes are added to the store of the process """
+      return (makeNode, (self.node_data, self.node_type, self.childs))
+
+   def __repr__(self):
+      return "GTreeNodeDAG [Childs=%d] - [%s]" % (len(self.childs), self.node_data)
+
+   def __len__(self):
+      return len(self.childs)
+
+   def getData(self):
+      """ Gets the node internal data
+
+      :rtype: the internal data
+      """
+      return self.node_data
+
+   def getType(self):
+      """ Get the node type
+
+      :rtype: the node type is type of Consts.nodeType
+      """
+      return self.node_type
+
+   def getChilds(self):
+      """ Returns the tuple of child nodes
+
+      :rtype: the tuple of nodes
+      """
+      return self.childs
+
+   def getChild(self, index):
+      """ Returns the index-child of the node
+
+      :rtype: child node
+      """
+      return self.childs[index]
+
+   def isLeaf(self):
+      """ Return True if the node is a leaf
+
+      :rtype: True or False
+      """
+      return len(self.childs) == 0
+
+   def getCount(self, node_type=0):
+      """ Returns the number of nodes of the subtree
+
+      :param node_type: 0 = Any, 1 = Leaf, 2 = Branch
+      :rtype: the number of nodes
+      """
+      if node_type == 0: return self.size
+      if node_type == 1: return self.leafs
+      return self.size - self.leafs
+
+def makeNode(data, node_type, childs=()):
+   """ Returns the node with the data, type and childs, the node is
+   created only if it doesn't exist yet
+
+   Example:
+      >>> a = GTreeDAG.makeNode("a", Consts.nodeType["TERMINAL"])
+      >>> add = GTreeDAG.makeNode("gp_add", Consts.nodeType["NONTERMINAL"], (a, a))
+      >>> add.getChild(0) is add.getChild(1)
+      True
+
+   :param data: the node data
+   :param node_type: the node type
+   :param childs: the child nodes
+   :rtype: the :class:`GTreeDAG.GTreeNodeDAG` instance
+   """
+   childs = tuple(childs)
+   key = (data, node_type, childs)
+   node = nodeStore.get(key)
+   if node is None:
+      node = GTreeNodeDAG(data, node_type, childs)
+      nodeStore[key] = node
+   return node
+
+def fromGTreeNode(node):
+   """ Converts a tree of :class:`GTree.GTreeNodeGP` nodes
+
+   :param node: the root of the GTreeNodeGP tree
+   :rtype: the root :class:`GTreeDAG.GTreeNodeDAG` node
+   """
+   done = {}
+   node_stack = [node]
+   while len(node_stack) > 0:
+      tmp = node_stack[-1]
+      pending = [child for child in tmp.getChilds() if id(child) not in done]
+      if len(pending) > 0:
+         node_stack.extend(pending)
+         continue
+      node_stack.pop()
+      childs = [done[id(child)] for child in tmp.getChilds()]
+      done[id(tmp)] = makeNode(tmp.getData(), tmp.getType(), childs)
+   return done[id(node)]
+
+def getNodeAt(root, index, node_type=0):
+   """ Returns the node at the index of the pre order of the tree, only
+   the nodes of the *node_type* are counted
+
+   :param root: the root node
+   :param index: the index of the node
+   :param node_type: 0 = Any, 1 = Leaf, 2 = Branch
+   :rtype: a tuple (node, path)
+   """
+   path = []
+   node = root
+   while True:
+      if node_type == 0 or (node_type == 1) == node.isLeaf():
+         if index == 0:
+            return (node, path)
+         index -= 1
+      for i, child in enumerate(node.childs):
+         count = child.getCount(node_type)
+         if index < count:
+            path.append(i)
+            node = child
+            break
+         index -= count
+      else:
+         Util.raiseException("The node index is out of range", IndexError)
+
+def replacePath(root, path, new_node):
+   """ Returns a new root where the node at the path is replaced by
+   the *new_node*, only the nodes on the path are created
+
+   :param root: the root node
+   :param path: the list of child indexes from the root
+   :param new_node: the new subtree
+   :rtype: the new root node
+   """
+   nodes = [root]
+   for index in path[:-1]:
+      nodes.append(nodes[-1].childs[index])
+
+   for depth in xrange(len(path)-1, -1, -1):
+      parent = nodes[depth]
+      childs = list(parent.childs)
+      childs[path[depth]] = new_node
+      new_node = makeNode(parent.node_data, parent.node_type, childs)
+   return new_node
+
+def evaluateNode(node, cases, namespace, memo=None):
+   """ Evaluates the subtree over the cases, the results of the
+   subtrees are kept in the *memo* dict
+
+   :param node: the root node of the subtree
+   :param cases: a dict with the terminal names and the values
+   :param namespace: the dict with the GP functions
+   :param memo: the dict of the subtree results, it must be used only
+                with the same cases
+   :rtype: the result of the subtree
+   """
+   if memo is None:
+      memo = {}
+
+   node_stack = [node]
+   while len(node_stack) > 0:
+      tmp = node_stack[-1]
+      if tmp in memo:
+         node_stack.pop()
+         continue
+      pending = [child for child in tmp.childs if child not in memo]
+      if len(pending) > 0:
+         node_stack.extend(pending)
+         continue
+      node_stack.pop()
+
+      if len(tmp.childs) > 0:
+         memo[tmp] = namespace[tmp.node_data](*[memo[child] for child in tmp.childs])
+      elif tmp.node_data in cases:
+         memo[tmp] = cases[tmp.node_data]
+      else:
+         memo[tmp] = eval(tmp.node_data, namespace, cases)
+
+   return memo[node]
+
+class GTreeGPDAG(GenomeBase):
+   """ The GTreeGPDAG Class - The subtree-sharing Genetic Programming tree
+
+   Inheritance diagram for :class:`GTreeDAG.GTreeGPDAG`:
+
+   .. inheritance-diagram:: GTreeDAG.GTreeGPDAG
+
+   The interface is close to the :class:`GTree.GTreeGP`, but the nodes are
+   immutable :class:`GTreeDAG.GTreeNodeDAG` instances, the tree is changed
+   by replacing the subtrees with the *replaceSubtree* method.
+
+   Example:
+      >>> genome = GTreeDAG.GTreeGPDAG()
+      >>> genome.setParams(max_depth=4, method="ramped")
+
+   :param root_node: the root node of the GP tree
+
+   .. versionadded:: 0.6
+      The *GTreeGPDAG* class.
+   """
+
+   def __init__(self, root_node=None, cloning=False):
+      GenomeBase.__init__(self, cloning)
+      self.root_node = root_node
+      if not cloning:
+         self.initializator.set(Consts.CDefGTreeGPDAGInit)
+         self.mutator.set(Consts.CDefGTreeGPDAGMutator)
+         self.crossover.set(Consts.CDefGTreeGPDAGCrossover)
+
+   def __repr__(self):
+      """ Return a string representation of Genome """
+      ret  = GenomeBase.__repr__(self)
+      ret += "- GTreeGPDAG\n"
+      ret += "\tHeight:\t\t\t%s\n" % self.getHeight()
+      ret += "\tNodes:\t\t\t%d\n" % self.getNodesCount()
+      if self.root_node is not None:
+         ret += "\tExpression: %s\n" % self.getPreOrderExpression()
+      return ret
+
+   def __len__(self):
+      return self.getNodesCount()
+
+   def getRoot(self):
+      """ Return the tree root node
+
+      :rtype: the tree root node
+      """
+      return self.root_node
+
+   def setRoot(self, root):
+      """ Sets the root of the tree
+
+      :param root: the tree root node
+      """
+      if not isinstance(root, GTreeNodeDAG):
+         Util.raiseException("The root must be a GTreeNodeDAG node", TypeError)
+      self.root_node = root
+      self.modified = True
+
+   def getHeight(self):
+      """ Return the tree height
+
+      :rtype: the tree height
+      """
+      return None if self.root_node is None else self.root_node.height
+
+   def getNodesCount(self, node_type=0):
+      """ Return the number of the nodes on the tree
+
+      :param node_type: 0 = Any, 1 = Leaf, 2 = Branch
+      :rtype: the number of nodes
+      """
+      return 0 if self.root_node is None else self.root_node.getCount(node_type)
+
+   def getRandomPath(self, node_type=0):
+      """ Returns a random node of the tree and its path
+
+      :param node_type: 0 = Any, 1 = Leaf, 2 = Branch
+      :rtype: a tuple (node, path) or (None, None) if there are no nodes of the type
+      """
+      count = self.getNodesCount(node_type)
+      if count <= 0:
+         return (None, None)
+      return getNodeAt(self.root_node, random.randint(0, count-1), node_type)
+
+   def getNodeByPath(self, path):
+      """ Returns the node at the path
+
+      :param path: the list of child indexes from the root
+      :rtype: the node
+      """
+      node = self.root_node
+      for index in path:
+         node = node.childs[index]
+      return node
+
+   def replaceSubtree(self, path, node):
+      """ Replaces the subtree at the path, only the nodes on the path
+      are created, the rest of the tree is still shared
+
+      :param path: the list of child indexes from the root
+      :param node: the new subtree root
+      """
+      self.setRoot(replacePath(self.root_node, path, node))
+
+   def getPreOrderExpression(self, start_node=None):
+      """ Return the pre order expression string of the Tree, used
+      to python *eval*.
+
+      :rtype: the expression string
+      """
+      if start_node is None:
+         start_node = self.root_node
+
+      str_buff = []
+      node_stack = [start_node]
+      while len(node_stack) > 0:
+         tmp = node_stack.pop()
+         if isinstance(tmp, basestring):
+            str_buff.append(tmp)
+            continue
+
+         str_buff.append(tmp.node_data)
+         all_childs = tmp.childs
+         if len(all_childs) > 0:
+            node_stack.append(")")
+            for index in xrange(len(all_childs)-1, 0, -1):
+               node_stack.append(all_childs[index])
+               node_stack.append(", ")
+            node_stack.append(all_childs[0])
+            node_stack.append("(")
+
+      return "".join(str_buff)
+
+   getCodeCache = staticmethod(GTreeGP.getCodeCache)
+
+   def getCompiledCode(self):
+      """ Get the compiled code for the Tree expression, the code is kept
+      in the root node, so it's shared by all the identical trees
+
+      :rtype: compiled python code
+      """
+      cache = self.getCodeCache()
+      root = self.root_node
+      if root.code is not None:
+         cache.hits += 1
+         return root.code
+
+      expr = self.getPreOrderExpression()
+      code = cache.lookup(expr)
+      if code is None:
+         code = compile(expr, "<string>", "eval")
+         cache.store(expr, code)
+      root.code = code
+      return code
+
+   def evaluateCases(self, cases, namespace=None, memo=None):
+      """ Evaluates the tree over a batch of fitness cases, node by node,
+      the values of the *cases* can be numbers or NumPy arrays
+
+      :param cases: a dict with the terminal names and the values
+      :param namespace: the dict with the GP functions, by default the
+                        *__main__* module namespace
+      :param memo: a dict to keep the results of the subtrees, use the same
+                   dict for all the individuals evaluated with the same cases
+      :rtype: the output of the tree
+      """
+      if namespace is None:
+         import __main__ as mod_main
+         namespace = mod_main.__dict__
+      return evaluateNode(self.root_node, cases, namespace, memo)
+
+   def compare(self, other):
+      """ Compares the tree with another one, since the nodes are
+      unique, the trees are the same when the roots are the same
+
+      :param other: the other GTreeGPDAG
+      :rtype: 0 if the trees are equal, -1 otherwise
+      """
+      return 0 if self.root_node is other.root_node else -1
+
+   def exportGenes(self):
+      """ Returns a compact copy of the tree, used to send the genome
+      data to another process without the node objects
+
+      :rtype: a tuple with the (data, type, number of childs) of the nodes in pre order
+      """
+      genes = []
+      node_stack = [self.root_node]
+      while len(node_stack) > 0:
+         tmp = node_stack.pop()
+         genes.append((tmp.node_data, tmp.node_type, len(tmp.childs)))
+         node_stack.extend(tmp.childs[::-1])
+      return tuple(genes)
+
+   def importGenes(self, genes):
+      """ Rebuilds the tree from the genes returned by *exportGenes*
+
+      :param genes: the genes tuple
+      """
+      node_stack = []
+      for data, node_type, nchilds in reversed(genes):
+         childs = node_stack[len(node_stack)-nchilds:][::-1] if nchilds > 0 else ()
+         if nchilds > 0:
+            del node_stack[len(node_stack)-nchilds:]
+         node_stack.append(makeNode(data, node_type, childs))
+      self.setRoot(node_stack[0])
+
+   def copy(self, g):
+      """ Copy the contents to the destination g, the nodes are shared
+
+      :param g: the GTreeGPDAG genome destination
+      """
+      GenomeBase.copy(self, g)
+      g.root_node = self.root_node
+
+   def clone(self):
+      """ Return a new instance of the genome, the clone shares the
+      nodes with this genome
+
+      :rtype: the new GTreeGPDAG instance
+      """
+      newcopy = GTreeGPDAG(cloning=True)
+      self.copy(newcopy)
+      return newcopy
+
+###################################
+#  Tree GP DAG Utility Functions  #
+###################################
+
+def buildGTreeGPDAGGrow(ga_engine, depth, max_depth):
+   """ Creates a new random GTreeGPDAG root node with subtrees using
+   the "Grow" method.
+
+   :param ga_engine: the GA Core
+   :param depth: the initial depth
+   :max_depth: the maximum depth of the tree
+   :rtype: the root node
+   """
+   gp_terminals = ga_engine.getParam("gp_terminals")
+   assert gp_terminals is not None
+
+   gp_function_set = ga_engine.getParam("gp_function_set")
+   assert gp_function_set is not None
+
+   if depth == max_depth:
+      random_terminal = checkTerminal(random.choice(gp_terminals))
+      return makeNode(random_terminal, Consts.nodeType["TERMINAL"])
+
+   # Do not generate degenerative trees
+   if depth == 0:
+      random_node = random.choice(gp_function_set.keys())
+   else:
+      fchoice = random.choice([gp_function_set.keys(), gp_terminals])
+      random_node = random.choice(fchoice)
+
+   if random_node in gp_terminals:
+      return makeNode(checkTerminal(random_node), Consts.nodeType["TERMINAL"])
+
+   childs = [buildGTreeGPDAGGrow(ga_engine, depth+1, max_depth)
+             for i in xrange(gp_function_set[random_node])]
+   return makeNode(random_node, Consts.nodeType["NONTERMINAL"], childs)
+
+def buildGTreeGPDAGFull(ga_engine, depth, max_depth):
+   """ Creates a new random GTreeGPDAG root node with subtrees using
+   the "Full" method.
+
+   :param ga_engine: the GA Core
+   :param depth: the initial depth
+   :max_depth: the maximum depth of the tree
+   :rtype: the root node
+   """
+   gp_terminals = ga_engine.getParam("gp_terminals")
+   assert gp_terminals is not None
+
+   gp_function_set = ga_engine.getParam("gp_function_set")
+   assert gp_function_set is not None
+
+   if depth == max_depth:
+      random_terminal = checkTerminal(random.choice(gp_terminals))
+      return makeNode(random_terminal, Consts.nodeType["TERMINAL"])
+
+   random_oper = random.choice(gp_function_set.keys())
+   childs = [buildGTreeGPDAGFull(ga_engine, depth+1, max_depth)
+             for i in xrange(gp_function_set[random_oper])]
+   return makeNode(random_oper, Consts.nodeType["NONTERMINAL"], childs)
@@ -0,0 +1,492 @@
+"""
+
+:mod:`GTreeLinear` -- the linear (prefix array) GP tree chromosome
+=====================================================================
+
+This module contains the :class:`GTreeLinear.GTreeGPLinear` chromosome, a
+Genetic Programming tree stored as a flat prefix array: the *program* list
+has the data of the nodes in pre order and the *arities* list has the number
+of childs of each node. There are no node objects, a node is just an index of
+the arrays and its subtree is the slice starting at the index.
+
+The *processNodes* method annotates each index with the subtree size, the
+subtree height and the node depth in a single pass, so the random node
+selection, the height queries and the subtree crossover are just lookups and
+list slicing.
+
+The trees are evaluated by a stack-based interpreter,
+:meth:`GTreeGPLinear.evaluateCases`, the terminals can be bound to numbers or
+to NumPy arrays with all the fitness cases: ::
+
+   def eval_func(chromosome):
+      outputs = chromosome.evaluateCases({"a": a, "b": b})
+      (...)
+
+Default Parameters
+-------------------------------------------------------------
+
+*Initializator*
+
+   :func:`Initializators.GTreeGPLinearInitializator`
+
+   The initializator, accepts the *max_depth* and *method* parameters
+
+*Mutator*
+
+   :func:`Mutators.GTreeGPLinearMutatorSubtree`
+
+   The subtree mutator
+
+*Crossover*
+
+   :func:`Crossovers.GTreeGPLinearCrossoverSinglePoint`
+
+   The single point crossover
+
+.. versionadded:: 0.6
+   The *GTreeLinear* module.
+
+Classes
+-------------------------------------------------------------
+"""
+from random import randint as rand_randint, choice as rand_choice
+from GenomeBase import GenomeBase
+from GTree import GTreeGP, checkTerminal
+import Consts
+import Util
+
+def runProgram(program, arities, cases, namespace):
+   """ The stack-based interpreter of the prefix programs, the program
+   is read backwards, so the childs of a function are on the top of the
+   stack when the function is reached
+
+   :param program: the list of node data, in pre order
+   :param arities: the list of the number of childs of the nodes
+   :param cases: a dict with the terminal names and the values
+   :param namespace: the dict with the GP functions
+   :rtype: the output of the program
+   """
+   stack = []
+   for i in xrange(len(program)-1, -1, -1):
+      arity = arities[i]
+      if arity == 0:
+         terminal = program[i]
+         if terminal in cases:
+            stack.append(cases[terminal])
+         else:
+            stack.append(eval(terminal, namespace, cases))
+      elif arity == 2:
+         stack.append(namespace[program[i]](stack.pop(), stack.pop()))
+      else:
+         stack.append(namespace[program[i]](*[stack.pop() for k in xrange(arity)]))
+   return stack[0]
+
+class GTreeGPLinear(GenomeBase):
+   """ The GTreeGPLinear Class - The Genetic Programming tree as a prefix array
+
+   Inheritance diagram for :class:`GTreeLinear.GTreeGPLinear`:
+
+   .. inheritance-diagram:: GTreeLinear.GTreeGPLinear
+
+   Example:
+      >>> genome = GTreeLinear.GTreeGPLinear()
+      >>> genome.setParams(max_depth=4, method="ramped")
+
+      The tree *gp_add(a, gp_mul(b, b))*
+         >>> genome.setProgram(["gp_add", "a", "gp_mul", "b", "b"], [2, 0, 2, 0, 0])
+         >>> genome.getSubtreeSize(2), genome.getNodeHeight(2), genome.getNodeDepth(2)
+         (3, 1, 1)
+
+   .. note:: if you change the program directly, you must call the
+             *processNodes* method.
+
+   :param program: the list of node data, in pre order
+   :param arities: the list of the number of childs of the nodes
+
+   .. versionadded:: 0.6
+      The *GTreeGPLinear* class.
+   """
+
+   def __init__(self, program=None, arities=None, cloning=False):
+      GenomeBase.__init__(self, cloning)
+      self.program = []
+      self.arities = []
+      self.sizes = []
+      self.heights = []
+      self.depths = []
+      self.nodes_leaf = []
+      self.nodes_branch = []
+      self.compiledCode = None
+
+      if program is not None:
+         self.setProgram(program, arities)
+
+      if not cloning:
+         self.initializator.set(Consts.CDefGTreeGPLinearInit)
+         self.mutator.set(Consts.CDefGTreeGPLinearMutator)
+         self.crossover.set(Consts.CDefGTreeGPLinearCrossover)
+
+   def __repr__(self):
+      """ Return a string representation of Genome """
+      ret  = GenomeBase.__repr__(self)
+      ret += "- GTreeGPLinear\n"
+      ret += "\tHeight:\t\t\t%s\n" % self.getHeight()
+      ret += "\tNodes:\t\t\t%d\n" % self.getNodesCount()
+      if len(self.program) > 0:
+         ret += "\tExpression: %s\n" % self.getPreOrderExpression()
+      return ret
+
+   def __len__(self):
+      return len(self.program)
+
+   def setProgram(self, program, arities):
+      """ Sets the program of the tree
+
+      :param program: the list of node data, in pre order
+      :param arities: the list of the number of childs of the nodes
+      """
+      if len(program) != len(arities):
+         Util.raiseException("The program and the arities must have the same size", ValueError)
+      self.program = list(program)
+      self.arities = list(arities)
+      self.processNodes()
+
+   def getProgram(self):
+      """ Returns the list of node data, in pre order
+
+      :rtype: the program list
+      """
+      return self.program
+
+   def getArities(self):
+      """ Returns the list of the number of childs of the nodes
+
+      :rtype: the arities list
+      """
+      return self.arities
+
+   def processNodes(self, cloning=False):
+      """ Computes the subtree sizes, the subtree heights and the node
+      depths of the program in a single pass, this method must be called
+      every time you change the shape of the tree, the tree is also
+      marked as modified.
+      """
+      arities = self.arities
+      size = len(arities)
+      sizes = [1] * size
+      heights = [0] * size
+      depths = [0] * size
+
+      stack = []
+      for i in xrange(size-1, -1, -1):
+         arity = arities[i]
+         if arity > 0:
+            if len(stack) < arity:
+               Util.raiseException("The program is not a valid prefix tree", ValueError)
+            for k in xrange(arity):
+               child = stack.pop()
+               sizes[i] += sizes[child]
+               if heights[child] >= heights[i]:
+                  heights[i] = heights[child] + 1
+         stack.append(i)
+
+      if size > 0 and len(stack) != 1:
+         Util.raiseException("The program is not a valid prefix tree", ValueError)
+
+      pending = []
+      for i in xrange(size):
+         if len(pending) > 0:
+            depths[i] = pending[-1][0]
+            pending[-1][1] -= 1
+            if pending[-1][1] == 0:
+               pending.pop()
+         if arities[i] > 0:
+            pending.append([depths[i]+1, arities[i]])
+
+      self.sizes = sizes
+      self.heights = heights
+      self.depths = depths
+      self.nodes_leaf = [i for i in xrange(size) if arities[i] == 0]
+      self.nodes_branch = [i for i in xrange(size) if arities[i] > 0]
+
+      if not cloning:
+         self.modified = True
+         self.compiledCode = None
+
+   def getHeight(self):
+      """ Return the tree height
+
+      :rtype: the tree height
+      """
+      return self.heights[0] if len(self.heights) > 0 else None
+
+   def getNodesCount(self):
+      """ Return the number of the nodes on the tree
+
+      :rtype: the number of nodes
+      """
+      return len(self.program)
+
+   def getNodeDepth(self, index):
+      """ Returns the depth of a node
+
+      :param index: the node index
+      :rtype: the depth of the node, the depth of root node is 0
+      """
+      return self.depths[index]
+
+   def getNodeHeight(self, index):
+      """ Returns the height of a node
+
+      :param index: the node index
+      :rtype: the height of the node, the height of the leafs is 0
+      """
+      return self.heights[index]
+
+   def getSubtreeSize(self, index):
+      """ Returns the number of nodes of the subtree
+
+      :param index: the subtree root index
+      :rtype: the subtree size
+      """
+      return self.sizes[index]
+
+   def getNodeType(self, index):
+      """ Returns the type of a node
+
+      :param index: the node index
+      :rtype: the node type is type of Consts.nodeType
+      """
+      if self.arities[index] == 0:
+         return Consts.nodeType["TERMINAL"]
+      return Consts.nodeType["NONTERMINAL"]
+
+   def getRandomIndex(self, node_type=0):
+      """ Returns the index of a random node
+
+      :param node_type: 0 = Any, 1 = Leaf, 2 = Branch
+      :rtype: the node index or None if there are no nodes of the type
+      """
+      if node_type == 0:
+         if len(self.program) == 0: return None
+         return rand_randint(0, len(self.program)-1)
+      cho = self.nodes_leaf if node_type == 1 else self.nodes_branch
+      if len(cho) <= 0:
+         return None
+      return rand_choice(cho)
+
+   def getSubtree(self, index):
+      """ Returns the program and the arities of the subtree
+
+      :param index: the subtree root index
+      :rtype: a tuple (program, arities) with the slices of the subtree
+      """
+      end = index + self.sizes[index]
+      return (self.program[index:end], self.arities[index:end])
+
+   def replaceSubtree(self, index, program, arities):
+      """ Replaces the subtree at the index
+
+      :param index: the subtree root index
+      :param program: the program of the new subtree
+      :param arities: the arities of the new subtree
+      """
+      end = index + self.sizes[index]
+      self.program[index:end] = program
+      self.arities[index:end] = arities
+      self.processNodes()
+
+   def getPreOrderExpression(self, start_index=0):
+      """ Return the pre order expression string of the Tree, used
+      to python *eval*.
+
+      :param start_index: the index of the subtree root
+      :rtype: the expression string
+      """
+      program, arities = self.program, self.arities
+      stack = []
+      for i in xrange(start_index + self.sizes[start_index] - 1, start_index-1, -1):
+         arity = arities[i]
+         if arity == 0:
+            stack.append(program[i])
+         else:
+            args = [stack.pop() for k in xrange(arity)]
+            stack.append("%s(%s)" % (program[i], ", ".join(args)))
+      return stack[0]
+
+   getCodeCache = staticmethod(GTreeGP.getCodeCache)
+
+   def getCompiledCode(self):
+      """ Get the compiled code for the Tree expression, the code is
+      kept in the genome until the tree changes
+
+      :rtype: compiled python code
+      """
+      cache = self.getCodeCache()
+      if self.compiledCode is not None:
+         cache.hits += 1
+         return self.compiledCode
+
+      expr = self.getPreOrderExpression()
+      code = cache.lookup(expr)
+      if code is None:
+         code = compile(expr, "<string>", "eval")
+         cache.store(expr, code)
+      self.compiledCode = code
+      return code
+
+   def evaluateCases(self, cases, namespace=None):
+      """ Evaluates the tree with the stack-based interpreter, the
+      values of the *cases* can be numbers or NumPy arrays
+
+      :param cases: a dict with the terminal names and the values
+      :param namespace: the dict with the GP functions, by default the
+                        *__main__* module namespace
+      :rtype: the output of the tree
+      """
+      if namespace is None:
+         import __main__ as mod_main
+         namespace = mod_main.__dict__
+      return runProgram(self.program, self.arities, cases, namespace)
+
+   def setModified(self, flag=True):
+      """ Marks the genome as changed, the compiled code is discarded
+
+      :param flag: True (default) or False
+      """
+      GenomeBase.setModified(self, flag)
+      if flag:
+         self.compiledCode = None
+
+   def mutate(self, **args):
+      """ Called to mutate the genome, the compiled code is
+      discarded when the tree is mutated
+
+      :param args: this parameters will be passed to the mutator
+      :rtype: the number of mutations returned by mutation operator
+      """
+      nmuts = GenomeBase.mutate(self, **args)
+      if nmuts > 0:
+         self.compiledCode = None
+      return nmuts
+
+   def compare(self, other):
+      """ Compares the tree with another one
+
+      :param other: the other GTreeGPLinear
+      :rtype: 0 if the trees are equal, -1 otherwise
+      """
+      if self.program == other.program and self.arities == other.arities:
+         return 0
+      return -1
+
+   def exportGenes(self):
+      """ Returns a compact copy of the tree, used to send the genome
+      data to another process
+
+      :rtype: a tuple (program, arities) of tuples
+      """
+      return (tuple(self.program), tuple(self.arities))
+
+   def importGenes(self, genes):
+      """ Rebuilds the tree from the genes returned by *exportGenes*
+
+      :param genes: the genes tuple
+      """
+      self.setProgram(genes[0], genes[1])
+
+   def copy(self, g):
+      """ Copy the contents to the destination g
+
+      :param g: the GTreeGPLinear genome destination
+      """
+      GenomeBase.copy(self, g)
+      g.program = self.program[:]
+      g.arities = self.arities[:]
+      g.sizes = self.sizes[:]
+      g.heights = self.heights[:]
+      g.depths = self.depths[:]
+      g.nodes_leaf = self.nodes_leaf[:]
+      g.nodes_branch = self.nodes_branch[:]
+
+   def __getstate__(self):
+      """ Returns the genome attributes without the compiled code, which
+      can't be pickled, it's compiled again from the code cache """
+      state = self.__dict__.copy()
+      state["compiledCode"] = None
+      return state
+
+   def clone(self):
+      """ Return a new instance of the genome
+
+      :rtype: the new GTreeGPLinear instance
+      """
+      newcopy = GTreeGPLinear(cloning=True)
+      self.copy(newcopy)
+      return newcopy
+
+######################################
+#  Tree GP Linear Utility Functions  #
+######################################
+
+def buildGTreeGPLinear(ga_engine, depth, max_depth, method="grow"):
+   """ Creates a new random prefix program using the "grow" or
+   the "full" method, the nodes are created directly in pre order,
+   without recursion.
+
+   :param ga_engine: the GA Core
+   :param depth: the initial depth
+   :param max_depth: the maximum depth of the tree
+   :param method: "grow" or "full"
+   :rtype: a tuple (program, arities)
+   """
+   gp_terminals = ga_engine.getParam("gp_terminals")
+   assert gp_terminals is not None
+
+   gp_function_set = ga_engine.getParam("gp_function_set")
+   assert gp_function_set is not None
+
+   program, arities = [], []
+
+   # The depths of the nodes still to be created
+   pending = [depth]
+   while len(pending) > 0:
+      node_depth = pending.pop()
+      if node_depth == max_depth:
+         random_node = rand_choice(gp_terminals)
+      elif method == "full" or node_depth == 0:
+         # Do not generate degenerative trees
+         random_node = rand_choice(gp_function_set.keys())
+      else:
+         random_node = rand_choice(rand_choice([gp_function_set.keys(), gp_terminals]))
+
+      if random_node in gp_terminals:
+         program.append(checkTerminal(random_node))
+         arities.append(0)
+      else:
+         arity = gp_function_set[random_node]
+         program.append(random_node)
+         arities.append(arity)
+         pending.extend([node_depth+1] * arity)
+
+   return (program, arities)
+
+def buildGTreeGPLinearGrow(ga_engine, depth, max_depth):
+   """ Creates a new random prefix program using the "Grow" method.
+
+   :param ga_engine: the GA Core
+   :param depth: the initial depth
+   :max_depth: the maximum depth of the tree
+   :rtype: a tuple (program, arities)
+   """
+   return buildGTreeGPLinear(ga_engine, depth, max_depth, "grow")
+
+def buildGTreeGPLinearFull(ga_engine, depth, max_depth):
+   """ Creates a new random prefix program using the "Full" method.
+
+   :param ga_engine: the GA Core
+   :param depth: the initial depth
+   :max_depth: the maximum depth of the tree
+   :rtype: a tuple (program, arities)
+   """
+   return buildGTreeGPLinear(ga_engine, depth, max_depth, "full")
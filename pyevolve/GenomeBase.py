@@ -50,16 +50,22 @@ class GenomeBase:
    """
 
 
-   def __init__(self):
-      """Genome Constructor"""
-      self.evaluator = FunctionSlot("Evaluator")
-      self.initializator = FunctionSlot("Initializator")
-      self.mutator = FunctionSlot("Mutator")
-      self.crossover = FunctionSlot("Crossover")
+   def __init__(self, cloning=False):
+      """Genome Constructor
+
+      :param cloning: when True, the function slots are not created, they
+                      will be shared with the source genome by the *copy*
+      """
+      if not cloning:
+         self.evaluator = FunctionSlot("Evaluator")
+         self.initializator = FunctionSlot("Initializator")
+         self.mutator = FunctionSlot("Mutator")
+         self.crossover = FunctionSlot("Crossover")
  
       self.internalParams = {}
       self.score = 0.0
       self.fitness = 0.0
+      self.modified = True
 
    def getRawScore(self):
       """ Get the Raw Score of the genome
@@ -124,9 +130,33 @@ class GenomeBase:
       return self.internalParams.get(key, nvl)
       
    def resetStats(self):
-      """ Clear score and fitness of genome """
+      """ Clear score and fitness of genome, the genome is marked as
+      modified until the next evaluation """
       self.score = 0.0
       self.fitness = 0.0
+      self.modified = True
+
+   def setModified(self, flag=True):
+      """ Marks the genome as changed since the last evaluation, the
+      genetic operators and the genes setters call this method
+
+      :param flag: True (default) or False
+
+      .. versionadded:: 0.6
+         The *setModified* method.
+      """
+      self.modified = flag
+
+   def isModified(self):
+      """ Returns True if the genome was changed after its last evaluation,
+      when it's False, the raw score is still valid
+
+      :rtype: True or False
+
+      .. versionadded:: 0.6
+         The *isModified* method.
+      """
+      return self.modified
       
    def evaluate(self, **args):
       """ Called to evaluate genome
@@ -137,6 +167,7 @@ class GenomeBase:
       self.resetStats()
       for it in self.evaluator.applyFunctions(self, **args):
          self.score += it
+      self.modified = False
 
    def initialize(self, **args):
       """ Called to initialize genome
@@ -146,6 +177,7 @@ class GenomeBase:
       """
       for it in self.initializator.applyFunctions(self, **args):
          pass
+      self.modified = True
 
    def mutate(self, **args):
       """ Called to mutate the genome
@@ -157,6 +189,8 @@ class GenomeBase:
       nmuts = 0
       for it in self.mutator.applyFunctions(self, **args):
          nmuts+=it
+      if nmuts > 0:
+         self.modified = True
       return nmuts
 
    def copy(self, g):
@@ -170,6 +204,7 @@ class GenomeBase:
       """
       g.score = self.score
       g.fitness = self.fitness
+      g.modified = self.modified
       g.evaluator = self.evaluator
       g.initializator = self.initializator
       g.mutator = self.mutator
@@ -185,7 +220,7 @@ class GenomeBase:
       .. note:: If you are planning to create a new chromosome representation, you
                 **must** implement this method on your class.
       """
-      newcopy = GenomeBase()
+      newcopy = GenomeBase(True)
       self.copy(newcopy)
       return newcopy
    
@@ -205,6 +240,7 @@ class G1DBase:
    def __iadd__(self, item):
       """ To add more items using the += operator """
       self.genomeList.append(item)
+      self.modified = True
       return self
 
    def __eq__(self, other):
@@ -224,6 +260,7 @@ class G1DBase:
    def __setslice__(self, a, b, val):
       """ Sets the slice part of chromosome """
       self.genomeList[a:b] = val
+      self.modified = True
 
    def __getitem__(self, key):
       """ Return the specified gene of List """
@@ -232,6 +269,7 @@ class G1DBase:
    def __setitem__(self, key, value):
       """ Set the specified value for an gene of List """
       self.genomeList[key] = value
+      self.modified = True
 
    def __iter__(self):
       """ Iterator support to the list """
@@ -262,6 +300,7 @@ class G1DBase:
       
       """
       self.genomeList.append(value)
+      self.modified = True
 
    def remove(self, value):
       """ Removes an item from the list
@@ -273,10 +312,12 @@ class G1DBase:
       
       """
       self.genomeList.remove(value)
+      self.modified = True
 
    def clearList(self):
       """ Remove all genes from Genome """
       del self.genomeList[:]
+      self.modified = True
    
    def copy(self, g):
       """ Copy genome to 'g'
@@ -290,6 +331,28 @@ class G1DBase:
       g.genomeSize = self.genomeSize
       g.genomeList = self.genomeList[:]
 
+   def exportGenes(self):
+      """ Returns a compact copy of the genes, used to send the genome
+      data to another process without the genome object itself
+
+      :rtype: a tuple with the genes
+
+      .. versionadded:: 0.6
+         The *exportGenes* method.
+      """
+      return tuple(self.genomeList)
+
+   def importGenes(self, genes):
+      """ Replaces the genes with the genes returned by *exportGenes*
+
+      :param genes: the genes tuple
+
+      .. versionadded:: 0.6
+         The *importGenes* method.
+      """
+      self.genomeList = list(genes)
+      self.modified = True
+
    def getInternalList(self):
       """ Returns the internal list of the genome
 
@@ -304,9 +367,14 @@ class G1DBase:
       :param lst: the list to assign the internal list of the chromosome
       """
       self.genomeList = lst
+      self.modified = True
 
-class GTreeNodeBase:
+class GTreeNodeBase(object):
    """ GTreeNodeBase Class - The base class for the node tree genomes
+
+   The node classes use *__slots__*, so the nodes don't have a *__dict__*,
+   if you subclass a node, declare the new attributes in the *__slots__*
+   of the subclass to keep the nodes compact.
    
    :param parent: the parent node of the node
    :param childs: the childs of the node, must be a list of nodes   
@@ -315,6 +383,8 @@ class GTreeNodeBase:
       Added te *GTreeNodeBase* class
    """
 
+   __slots__ = ("parent", "childs")
+
    def __init__(self, parent, childs=None):
       self.parent = parent
       self.childs = []
@@ -396,6 +466,22 @@ class GTreeNodeBase:
    def __len__(self):
       return len(self.childs)
 
+   def __getstate__(self):
+      """ Returns the node attributes, used by the pickle """
+      state = {}
+      for cls in type(self).__mro__:
+         for name in getattr(cls, "__slots__", ()):
+            if hasattr(self, name):
+               state[name] = getattr(self, name)
+      if hasattr(self, "__dict__"):
+         state.update(self.__dict__)
+      return state
+
+   def __setstate__(self, state):
+      """ Restores the node attributes, used by the pickle """
+      for name, value in state.iteritems():
+         setattr(self, name, value)
+
    def copy(self, g):
       """ Copy the current contents GTreeNodeBase to 'g'
 
@@ -438,15 +524,66 @@ class GTreeBase:
       """ Creates a *cache* on the tree, this method must be called
       every time you change the shape of the tree. It updates the
       internal nodes list and the internal nodes properties such as
-      depth and height.
+      depth and height, the tree is also marked as modified.
       """
       if self.root_node is None: return
-      self.nodes_list   = self.getAllNodes()
-      self.nodes_leaf   = filter(lambda n: n.isLeaf(), self.nodes_list)
-      self.nodes_branch = filter(lambda n: n.isLeaf()==False, self.nodes_list)
 
-      if not cloning:
-         self.tree_height = self.getNodeHeight(self.getRoot())
+      if cloning:
+         self.nodes_list = self.getAllNodes()
+      else:
+         self.nodes_list, heights, sizes, depths = self.getNodesProperties()
+         self.tree_height = heights[self.root_node]
+         self.modified = True
+
+      self.nodes_leaf   = [n for n in self.nodes_list if len(n.childs) == 0]
+      self.nodes_branch = [n for n in self.nodes_list if len(n.childs) > 0]
+
+   def getNodesProperties(self, start_node=None):
+      """ Computes the height, the size (number of nodes of the subtree)
+      and the depth of all the nodes together, in a single traversal
+
+      Example:
+         >>> nodes, heights, sizes, depths = tree.getNodesProperties()
+         >>> heights[tree.getRoot()] == tree.getHeight()
+         True
+
+      :param start_node: the subtree root, the depths are relative to it,
+                         if *start_node* is None, the tree root is used
+      :rtype: a tuple (nodes, heights, sizes, depths), the nodes in the same
+              order of *getAllNodes* and three dicts keyed by the nodes
+
+      .. versionadded:: 0.6
+         The *getNodesProperties* method.
+      """
+      if start_node is None:
+         start_node = self.getRoot()
+
+      nodes  = []
+      depths = {}
+      node_stack = [start_node]
+      depths[start_node] = 0
+      while len(node_stack) > 0:
+         tmp = node_stack.pop()
+         nodes.append(tmp)
+         child_depth = depths[tmp] + 1
+         for child in tmp.childs:
+            depths[child] = child_depth
+         node_stack.extend(tmp.childs)
+
+      heights = {}
+      sizes   = {}
+      # The childs are always after the parent on the nodes list
+      for i in xrange(len(nodes)-1, -1, -1):
+         tmp = nodes[i]
+         height, size = 0, 1
+         for child in tmp.childs:
+            if heights[child] >= height:
+               height = heights[child] + 1
+            size += sizes[child]
+         heights[tmp] = height
+         sizes[tmp]   = size
+
+      return (nodes, heights, sizes, depths)
    
    def getRoot(self):
       """ Return the tree root node 
@@ -469,8 +606,12 @@ class GTreeBase:
 
       :rtype: the depth of the node, the depth of root node is 0
       """
-      if node==self.getRoot(): return 0
-      else:                    return 1 + self.getNodeDepth(node.getParent())
+      root  = self.getRoot()
+      depth = 0
+      while node != root:
+         node = node.getParent()
+         depth += 1
+      return depth
 
    def getNodeHeight(self, node):
       """ Returns the height of a node
@@ -480,12 +621,13 @@ class GTreeBase:
       :rtype: the height of the node
       """
       height = 0
-      if len(node) <= 0:
-         return 0
-      for child in node.getChilds():
-         h_inner = self.getNodeHeight(child)+1
-         if h_inner > height:
-            height = h_inner
+      level = node.childs
+      while len(level) > 0:
+         height += 1
+         next_level = []
+         for tmp in level:
+            next_level.extend(tmp.childs)
+         level = next_level
       return height
 
    def getHeight(self):
@@ -505,8 +647,13 @@ class GTreeBase:
       count = 1
       if start_node is None:
          start_node = self.getRoot()
-      for i in start_node.getChilds():
-         count += self.getNodesCount(i)
+      level = start_node.childs
+      while len(level) > 0:
+         count += len(level)
+         next_level = []
+         for tmp in level:
+            next_level.extend(tmp.childs)
+         level = next_level
       return count
    
    def getTraversalString(self, start_node=None, spc=0):
@@ -515,15 +662,17 @@ class GTreeBase:
       
       :rtype: a string representing the tree
       """
-      str_buff = ""
+      str_buff = []
       if start_node is None:
          start_node = self.getRoot()
-         str_buff += "%s\n" % start_node
-      spaces = spc + 2
-      for child_node in start_node.getChilds():
-         str_buff += "%s%s\n" % (" " * spaces, child_node)
-         str_buff += self.getTraversalString(child_node, spaces)
-      return str_buff
+         str_buff.append("%s\n" % start_node)
+
+      node_stack = [(child, spc+2) for child in reversed(start_node.getChilds())]
+      while len(node_stack) > 0:
+         tmp, spaces = node_stack.pop()
+         str_buff.append("%s%s\n" % (" " * spaces, tmp))
+         node_stack.extend([(child, spaces+2) for child in reversed(tmp.getChilds())])
+      return "".join(str_buff)
 
 
    def traversal(self, callback, start_node=None):
@@ -539,9 +688,12 @@ class GTreeBase:
       if start_node is None:
          start_node = self.getRoot()
          callback(start_node)
-      for child_node in start_node.getChilds():
-         callback(child_node)
-         self.traversal(callback, child_node)
+
+      node_stack = list(reversed(start_node.getChilds()))
+      while len(node_stack) > 0:
+         tmp = node_stack.pop()
+         callback(tmp)
+         node_stack.extend(reversed(tmp.getChilds()))
 
    def getRandomNode(self, node_type=0):
       """ Returns a random node from the Tree
@@ -611,9 +763,17 @@ class GTreeBase:
       else:
          newnode.setParent(node_parent)
          node_parent.replaceChild(node, newnode)
-      
-      for ci in xrange(len(newnode)):
-         GTreeBase.copy(self, g, newnode.getChild(ci), newnode)
+
+      # The cloned nodes still point to the original childs
+      node_stack = [newnode]
+      while len(node_stack) > 0:
+         tmp = node_stack.pop()
+         childs = tmp.childs
+         for ci in xrange(len(childs)):
+            newchild = childs[ci].clone()
+            newchild.parent = tmp
+            childs[ci] = newchild
+         node_stack.extend(childs)
 
       return newnode
       
@@ -15,7 +15,10 @@ choosing random data.
 """
 
 from random import randint as rand_randint, uniform as rand_uniform, choice as rand_choice
+from random import getrandbits as rand_getrandbits
 import GTree
+import GTreeDAG
+import GTreeLinear
 import Util
 
 #############################
@@ -24,7 +27,16 @@ import Util
 
 def G1DBinaryStringInitializator(genome, **args):
    """ 1D Binary String initializator """
-   genome.genomeList = [ rand_choice((0,1)) for i in xrange(genome.getListSize()) ]
+   genome.setInternalList([ rand_choice((0,1)) for i in xrange(genome.getListSize()) ])
+
+def G1DBinaryStringPackedInitializator(genome, **args):
+   """ Packed 1D Binary String initializator, draws all the bits at once
+
+   .. versionadded:: 0.6
+      The *G1DBinaryStringPackedInitializator* function
+   """
+   size = genome.getListSize()
+   genome.setBits(rand_getrandbits(size) if size > 0 else 0, size)
 
 #############################
 ##     2D Binary String    ##
@@ -43,6 +55,16 @@ def G2DBinaryStringInitializator(genome, **args):
          random_gene = rand_choice((0,1))
          genome.setItem(i, j, random_gene)
 
+def G2DBinaryStringPackedInitializator(genome, **args):
+   """ Packed 2D Binary String initializator, draws each row at once
+   
+   .. versionadded:: 0.6
+      The *G2DBinaryStringPackedInitializator* function
+   """
+   width = genome.getWidth()
+   for i in xrange(genome.getHeight()):
+      genome.setRow(i, rand_getrandbits(width) if width > 0 else 0)
+
 
 ####################
 ##     1D List    ##
@@ -142,6 +164,34 @@ def G2DListInitializatorAllele(genome, **args):
          random_allele = allele[0].getRandomAllele()
          genome.setItem(i, j, random_allele)
 
+def G2DListArrayInitializatorInteger(genome, **args):
+   """ Integer initialization function of G2DListArray, the genes
+   buffer is filled at once
+
+   This initializator accepts the *rangemin* and *rangemax* genome parameters.
+
+   .. versionadded:: 0.6
+      The *G2DListArrayInitializatorInteger* function
+   """
+   range_min = genome.getParam("rangemin", 0)
+   range_max = genome.getParam("rangemax", 100)
+   size = genome.getHeight() * genome.getWidth()
+   genome.setInternalArray([rand_randint(range_min, range_max) for i in xrange(size)])
+
+def G2DListArrayInitializatorReal(genome, **args):
+   """ Real initialization function of G2DListArray, the genes
+   buffer is filled at once
+
+   This initializator accepts the *rangemin* and *rangemax* genome parameters.
+
+   .. versionadded:: 0.6
+      The *G2DListArrayInitializatorReal* function
+   """
+   range_min = genome.getParam("rangemin", 0)
+   range_max = genome.getParam("rangemax", 100)
+   size = genome.getHeight() * genome.getWidth()
+   genome.setInternalArray([rand_uniform(range_min, range_max) for i in xrange(size)])
+
 ####################
 ##      Tree      ##
 ####################
@@ -265,3 +315,55 @@ def GTreeGPInitializator(genome, **args):
    genome.setRoot(root)
    genome.processNodes()
    assert genome.getHeight() <= max_depth
+
+def GTreeGPDAGInitializator(genome, **args):
+   """ The initializator of the :class:`GTreeDAG.GTreeGPDAG`, accepts the
+   same *max_depth* and *method* parameters of the :func:`GTreeGPInitializator`
+
+   .. versionadded:: 0.6
+      The *GTreeGPDAGInitializator* function.
+   """
+   max_depth = genome.getParam("max_depth", 5)
+   method    = genome.getParam("method", "grow")
+   ga_engine = args["ga_engine"]
+
+   if method == "grow":
+      root = GTreeDAG.buildGTreeGPDAGGrow(ga_engine, 0, max_depth)
+   elif method == "full":
+      root = GTreeDAG.buildGTreeGPDAGFull(ga_engine, 0, max_depth)
+   elif method == "ramped":
+      if Util.randomFlipCoin(0.5):
+         root = GTreeDAG.buildGTreeGPDAGFull(ga_engine, 0, max_depth)
+      else:
+         root = GTreeDAG.buildGTreeGPDAGGrow(ga_engine, 0, max_depth)
+   else:
+      Util.raiseException("Unknown tree initialization method [%s] !" % method)
+
+   genome.setRoot(root)
+   assert genome.getHeight() <= max_depth
+
+def GTreeGPLinearInitializator(genome, **args):
+   """ The initializator of the :class:`GTreeLinear.GTreeGPLinear`, accepts
+   the same *max_depth* and *method* parameters of the :func:`GTreeGPInitializator`
+
+   .. versionadded:: 0.6
+      The *GTreeGPLinearInitializator* function.
+   """
+   max_depth = genome.getParam("max_depth", 5)
+   method    = genome.getParam("method", "grow")
+   ga_engine = args["ga_engine"]
+
+   if method == "grow":
+      program, arities = GTreeLinear.buildGTreeGPLinearGrow(ga_engine, 0, max_depth)
+   elif method == "full":
+      program, arities = GTreeLinear.buildGTreeGPLinearFull(ga_engine, 0, max_depth)
+   elif method == "ramped":
+      if Util.randomFlipCoin(0.5):
+         program, arities = GTreeLinear.buildGTreeGPLinearFull(ga_engine, 0, max_depth)
+      else:
+         program, arities = GTreeLinear.buildGTreeGPLinearGrow(ga_engine, 0, max_depth)
+   else:
+      Util.raiseException("Unknown tree initialization method [%s] !" % method)
+
+   genome.setProgram(program, arities)
+   assert genome.getHeight() <= max_depth
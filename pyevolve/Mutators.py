@@ -12,6 +12,8 @@ from random import randint as rand_randint, gauss as rand_gauss, uniform as rand
 from random import choice as rand_choice
 import Consts
 import GTree
+import GTreeDAG
+import GTreeLinear
 
 #############################
 ##     1D Binary String    ##
@@ -60,6 +62,20 @@ def G1DBinaryStringMutatorFlip(genome, **args):
 
    return int(mutations)
 
+def G1DBinaryStringPackedMutatorFlip(genome, **args):
+   """ The flip mutator for the packed binary strings, each bit is
+   flipped with the *pmut* probability using a random mask
+
+   .. versionadded:: 0.6
+      The *G1DBinaryStringPackedMutatorFlip* function
+   """
+   if args["pmut"] <= 0.0: return 0
+   mask = Util.randomBitMask(len(genome), args["pmut"])
+   if mask == 0: return 0
+
+   genome.setBits(genome.getBits() ^ mask, len(genome))
+   return Util.bitCount(mask)
+
 ####################
 ##     1D List    ##
 ####################
@@ -333,13 +349,17 @@ def G2DListMutatorSwap(genome, **args):
          for j in xrange(width):
             if Util.randomFlipCoin(args["pmut"]):
                index_b = (rand_randint(0, height-1), rand_randint(0, width-1))
-               Util.list2DSwapElement(genome.genomeList, (i,j), index_b)
+               temp = genome.getItem(i, j)
+               genome.setItem(i, j, genome.getItem(*index_b))
+               genome.setItem(index_b[0], index_b[1], temp)
                mutations+=1
    else:
       for it in xrange(int(round(mutations))):
          index_a = (rand_randint(0, height-1), rand_randint(0, width-1))
          index_b = (rand_randint(0, height-1), rand_randint(0, width-1))
-         Util.list2DSwapElement(genome.genomeList, index_a, index_b)
+         temp = genome.getItem(*index_a)
+         genome.setItem(index_a[0], index_a[1], genome.getItem(*index_b))
+         genome.setItem(index_b[0], index_b[1], temp)
 
    return int(mutations)
 
@@ -521,6 +541,38 @@ def G2DListMutatorRealGaussian(genome, **args):
    return int(mutations)
 
 
+def G2DListArrayMutatorSwap(genome, **args):
+   """ The Swap Mutator for G2DListArray, swaps the genes
+   using the flat indexes of the genes buffer
+
+   .. note:: this mutator is :term:`Data Type Independent`
+
+   .. versionadded:: 0.6
+      The *G2DListArrayMutatorSwap* function
+   """
+   if args["pmut"] <= 0.0: return 0
+   genes = genome.getInternalArray()
+   elements = len(genes)
+
+   mutations = args["pmut"] * elements
+
+   if mutations < 1.0:
+      mutations = 0
+      for i in xrange(elements):
+         if Util.randomFlipCoin(args["pmut"]):
+            index_b = rand_randint(0, elements-1)
+            genes[i], genes[index_b] = genes[index_b], genes[i]
+            mutations+=1
+   else:
+      for it in xrange(int(round(mutations))):
+         index_a = rand_randint(0, elements-1)
+         index_b = rand_randint(0, elements-1)
+         genes[index_a], genes[index_b] = genes[index_b], genes[index_a]
+
+   if mutations > 0:
+      genome.setModified()
+   return int(mutations)
+
 #############################
 ##     2D Binary String    ##
 #############################
@@ -587,6 +639,28 @@ def G2DBinaryStringMutatorFlip(genome, **args):
 
    return int(mutations)
 
+def G2DBinaryStringPackedMutatorFlip(genome, **args):
+   """ A flip mutator for G2DBinaryStringPacked, each bit is flipped
+   with the *pmut* probability using a random mask for each row
+   
+   .. versionadded:: 0.6
+      The *G2DBinaryStringPackedMutatorFlip* function
+   """
+   if args["pmut"] <= 0.0: return 0
+   width = genome.getWidth()
+   rows = genome.getRows()
+   mutations = 0
+
+   for i in xrange(genome.getHeight()):
+      mask = Util.randomBitMask(width, args["pmut"])
+      if mask:
+         rows[i] ^= mask
+         mutations += Util.bitCount(mask)
+
+   if mutations > 0:
+      genome.setModified()
+   return mutations
+
 #################
 ##     Tree    ##
 #################
@@ -868,4 +942,154 @@ def GTreeGPMutatorSubtree(genome, **args):
    
    return int(mutations)
 
+def GTreeGPDAGMutatorSubtree(genome, **args):
+   """ The mutator of GTreeGPDAG, Subtree Mutator
+
+   This mutator will recreate random subtree of the tree using the grow
+   algorithm, only the nodes on the path to the new subtree are created.
+
+   .. versionadded:: 0.6
+      The *GTreeGPDAGMutatorSubtree* function
+   """
+   if args["pmut"] <= 0.0: return 0
+   ga_engine = args["ga_engine"]
+   max_depth = genome.getParam("max_depth", None)
+   mutations = 0
+
+   if max_depth is None:
+      Util.raiseException("You must specify the max_depth genome parameter !", ValueError)
+
+   if max_depth < 0:
+      Util.raiseException("The max_depth must be >= 1, if you want to use GTreeGPDAGMutatorSubtree mutator !", ValueError)
+
+   for i in xrange(genome.getNodesCount(2)):
+      if Util.randomFlipCoin(args["pmut"]):
+         node, path = genome.getRandomPath(2)
+         if node is None: break
+         mutations += 1
+
+         root_subtree = GTreeDAG.buildGTreeGPDAGGrow(ga_engine, 0, max_depth-len(path))
+         genome.replaceSubtree(path, root_subtree)
+         if len(path) == 0:
+            return mutations
+
+   return int(mutations)
+
+def GTreeGPDAGMutatorOperation(genome, **args):
+   """ The mutator of GTreeGPDAG, Operation Mutator, changes the data of
+   random nodes by terminals or functions with the same arity
+
+   .. versionadded:: 0.6
+      The *GTreeGPDAGMutatorOperation* function
+   """
+   if args["pmut"] <= 0.0: return 0
+   elements = len(genome)
+   mutations = args["pmut"] * elements
+   ga_engine = args["ga_engine"]
+
+   gp_terminals = ga_engine.getParam("gp_terminals")
+   assert gp_terminals is not None
+
+   gp_function_set = ga_engine.getParam("gp_function_set")
+   assert gp_function_set is not None
+
+   if mutations < 1.0:
+      mutations = 0
+      for i in xrange(elements):
+         if Util.randomFlipCoin(args["pmut"]):
+            mutations += 1
+   else:
+      mutations = int(round(mutations))
+
+   for it in xrange(mutations):
+      node, path = genome.getRandomPath()
+      if node.getType() == Consts.nodeType["TERMINAL"]:
+         term_operator = GTree.checkTerminal(rand_choice(gp_terminals))
+      else:
+         op_len = gp_function_set[node.getData()]
+         fun_candidates = [o for o, l in gp_function_set.items() if l==op_len]
+         if len(fun_candidates) <= 0:
+            continue
+         term_operator = rand_choice(fun_candidates)
+      new_node = GTreeDAG.makeNode(term_operator, node.getType(), node.getChilds())
+      genome.replaceSubtree(path, new_node)
+
+   return int(mutations)
+
+def GTreeGPLinearMutatorSubtree(genome, **args):
+   """ The mutator of GTreeGPLinear, Subtree Mutator
+
+   This mutator will recreate random subtree of the tree using the grow
+   algorithm, the subtree is replaced with a single slice assignment.
+
+   .. versionadded:: 0.6
+      The *GTreeGPLinearMutatorSubtree* function
+   """
+   if args["pmut"] <= 0.0: return 0
+   ga_engine = args["ga_engine"]
+   max_depth = genome.getParam("max_depth", None)
+   mutations = 0
+
+   if max_depth is None:
+      Util.raiseException("You must specify the max_depth genome parameter !", ValueError)
+
+   if max_depth < 0:
+      Util.raiseException("The max_depth must be >= 1, if you want to use GTreeGPLinearMutatorSubtree mutator !", ValueError)
+
+   for i in xrange(len(genome.nodes_branch)):
+      if Util.randomFlipCoin(args["pmut"]):
+         index = genome.getRandomIndex(2)
+         if index is None: break
+         mutations += 1
+
+         depth = genome.getNodeDepth(index)
+         program, arities = GTreeLinear.buildGTreeGPLinearGrow(ga_engine, 0, max_depth-depth)
+         genome.replaceSubtree(index, program, arities)
+         if index == 0:
+            return mutations
+
+   return int(mutations)
+
+def GTreeGPLinearMutatorOperation(genome, **args):
+   """ The mutator of GTreeGPLinear, Operation Mutator, changes the opcodes
+   of random nodes by terminals or functions with the same arity, the
+   shape of the tree is not changed
+
+   .. versionadded:: 0.6
+      The *GTreeGPLinearMutatorOperation* function
+   """
+   if args["pmut"] <= 0.0: return 0
+   elements = len(genome)
+   mutations = args["pmut"] * elements
+   ga_engine = args["ga_engine"]
+
+   gp_terminals = ga_engine.getParam("gp_terminals")
+   assert gp_terminals is not None
+
+   gp_function_set = ga_engine.getParam("gp_function_set")
+   assert gp_function_set is not None
+
+   if mutations < 1.0:
+      mutations = 0
+      for i in xrange(elements):
+         if Util.randomFlipCoin(args["pmut"]):
+            mutations += 1
+   else:
+      mutations = int(round(mutations))
+
+   program = genome.getProgram()
+   arities = genome.getArities()
+   for it in xrange(mutations):
+      index = genome.getRandomIndex()
+      if arities[index] == 0:
+         program[index] = GTree.checkTerminal(rand_choice(gp_terminals))
+      else:
+         op_len = arities[index]
+         fun_candidates = [o for o, l in gp_function_set.items() if l==op_len]
+         if len(fun_candidates) <= 0:
+            continue
+         program[index] = rand_choice(fun_candidates)
+
+   return int(mutations)
+
 
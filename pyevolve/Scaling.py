@@ -5,12 +5,36 @@
 
 This module have the *scaling schemes* like Linear scaling, etc.
 
+When NumPy is installed and the population keeps its scores in arrays (see
+the :meth:`GPopulation.GPopulation.useArrays`), the schemes compute the
+fitness of the whole population with array operations.
+
 """
 import Consts
 import Util
 import math
 import logging
 
+try:
+   import numpy
+   HAVE_NUMPY = True
+except ImportError:
+   HAVE_NUMPY = False
+
+def getScoreArray(pop):
+   """ Returns the NumPy array of the raw scores of the population, or
+   None when the population doesn't keep its scores in arrays
+
+   :param pop: the population
+   :rtype: the NumPy array or None
+
+   .. versionadded:: 0.6
+      The *getScoreArray* function.
+   """
+   if HAVE_NUMPY and pop.useArrays():
+      return pop.getScores()
+   return None
+
 def LinearScaling(pop):
    """ Linear Scaling scheme
 
@@ -38,6 +62,13 @@ def LinearScaling(pop):
       a = pop_rawAve / delta
       b = -pop_rawMin * pop_rawAve / delta
 
+   scores = getScoreArray(pop)
+   if scores is not None:
+      if (scores < 0.0).any():
+         Util.raiseException("Negative score, linear scaling not supported !", ValueError)
+      pop.setFitnesses(numpy.maximum(scores * a + b, 0.0))
+      return
+
    for i in xrange(len(pop)):
       f = pop[i].score
       if f < 0.0:
@@ -54,6 +85,12 @@ def SigmaTruncScaling(pop):
    c = Consts.CDefScaleSigmaTruncMultiplier
    pop_rawAve = pop.stats["rawAve"]
    pop_rawDev = pop.stats["rawDev"]
+
+   scores = getScoreArray(pop)
+   if scores is not None:
+      pop.setFitnesses(numpy.maximum((scores - pop_rawAve) + c * pop_rawDev, 0.0))
+      return
+
    for i in xrange(len(pop)):
       f = pop[i].score - pop_rawAve
       f+= c * pop_rawDev
@@ -68,6 +105,14 @@ def PowerLawScaling(pop):
    """
    logging.debug("Running power law scaling.")
    k = Consts.CDefScalePowerLawFactor
+
+   scores = getScoreArray(pop)
+   if scores is not None:
+      if (scores < 0.0).any():
+         Util.raiseException("Negative score, power law scaling not supported !", ValueError)
+      pop.setFitnesses(numpy.power(scores, k))
+      return
+
    for i in xrange(len(pop)):
       f = pop[i].score
       if f < 0.0:
@@ -82,6 +127,10 @@ def BoltzmannScaling(pop):
    can specify the **boltz_factor** and the **boltz_min** parameters, the **boltz_factor**
    is the value that the temperature will be subtracted and the **boltz_min** is the
    mininum temperature of the scaling scheme.
+
+   The fitness is e^(score/temperature) divided by its average, it's computed
+   with the largest exponent subtracted (the log-sum-exp method), so the large
+   scores don't overflow.
    
    .. versionadded: 0.6
       The `BoltzmannScaling` function.
@@ -95,14 +144,25 @@ def BoltzmannScaling(pop):
    boltz_temperature = max(boltz_temperature, boltz_min)
    pop.setParams(boltzTemperature=boltz_temperature)
 
+   boltz_temperature = float(boltz_temperature)
+
+   scores = getScoreArray(pop)
+   if scores is not None:
+      exponents = scores / boltz_temperature
+      boltz_e = numpy.exp(exponents - exponents.max())
+      pop.setFitnesses(boltz_e / boltz_e.mean())
+      return
+
+   exponents = [pop[i].score / boltz_temperature for i in xrange(len(pop))]
+   max_exponent = max(exponents)
    boltz_e = []
    avg = 0.0
 
    for i in xrange(len(pop)):
-      val = math.exp(pop[i].score / boltz_temperature)
+      val = math.exp(exponents[i] - max_exponent)
       boltz_e.append(val)
       avg += val
-      
+
    avg /= len(pop)
 
    for i in xrange(len(pop)):
@@ -114,6 +174,11 @@ def ExponentialScaling(pop):
    .. versionadded: 0.6
       The `ExponentialScaling` function.
    """
+   scores = getScoreArray(pop)
+   if scores is not None:
+      pop.setFitnesses(numpy.exp(scores))
+      return
+
    for i in xrange(len(pop)):
       score = pop[i].score
       pop[i].fitness = math.exp(score)
@@ -124,6 +189,11 @@ def SaturatedScaling(pop):
    .. versionadded: 0.6
       The `SaturatedScaling` function.
    """
+   scores = getScoreArray(pop)
+   if scores is not None:
+      pop.setFitnesses(1.0 - numpy.exp(scores))
+      return
+
    for i in xrange(len(pop)):
       score = pop[i].score
       pop[i].fitness = 1.0 - math.exp(score)
@@ -5,47 +5,341 @@
 
 This module have the *selection methods*, like roulette wheel, tournament, ranking, etc.
 
+The selection methods are objects derived from the :class:`SelectorBase`
+class. A selector doesn't keep any state, the tables of the selection method
+(the cumulative sums of the roulette wheel, the alias table, the ranks of the
+individuals) are computed only once per generation by the
+:meth:`SelectorBase.prepare` method and stored in the population as a
+:class:`Selection` instance, which draws the individuals: ::
+
+   >>> selection = Selectors.GRouletteWheel.prepare(population)
+   >>> mom, dad = selection.draw(2)
+
+When NumPy is installed, the large batches of individuals (see the
+:attr:`Consts.CDefSelectionVectorSize`) are drawn with vectorized
+implementations, the NumPy random generator of the selection is seeded from
+the python random module, so the engine seed is respected.
+
+The selectors are callable like the selection functions of the previous
+versions, each call returns one individual of the population, so they can be
+used in the function slots: ::
+
+   >>> ga_engine.selector.set(Selectors.GRouletteWheel)
+   >>> ga_engine.selector.set(Selectors.TournamentSelector(pool_size=4))
+
+.. versionchanged:: 0.6
+   The selection methods are objects with the *prepare/draw* API.
+
 """
 
 import random
+from bisect import bisect_right
 import Consts
-import operator
+import Util
 
-def GRankSelector(population, **args):
+try:
+   import numpy
+   HAVE_NUMPY = True
+except ImportError:
+   HAVE_NUMPY = False
+
+class Selection:
+   """ Selection Class - The selection state of a population
+
+   It's created by the :meth:`SelectorBase.prepare` method of the selector and
+   keeps the tables of the selection method as attributes, the population must
+   not be changed while the selection is used.
+
+   :param selector: the selector
+   :param population: the population, sorted
+
+   .. versionadded:: 0.6
+      The *Selection* class.
+   """
+
+   def __init__(self, selector, population):
+      self.selector = selector
+      self.population = population
+      self.arrays = {}
+      self.randomState = None
+
+   def getArray(self, name):
+      """ Returns a table of the selection as a NumPy array, the array is
+      created only once
+
+      :param name: the name of the table attribute
+      :rtype: the NumPy array
+      """
+      array = self.arrays.get(name)
+      if array is None:
+         array = numpy.asarray(getattr(self, name))
+         self.arrays[name] = array
+      return array
+
+   def getRandomState(self):
+      """ Returns the NumPy random generator of the selection
+
+      :rtype: the NumPy RandomState instance
+      """
+      if self.randomState is None:
+         self.randomState = numpy.random.RandomState(random.randint(0, Consts.CDefArrayPopMaxSeed))
+      return self.randomState
+
+   def drawIndexes(self, n):
+      """ Returns the indexes of *n* selected individuals, all the
+      individuals are drawn in one call
+
+      :param n: the number of individuals
+      :rtype: the list of indexes of the population
+      """
+      if HAVE_NUMPY and self.selector.vectorized and n >= Consts.CDefSelectionVectorSize:
+         return self.selector.drawIndexesVector(self, n).tolist()
+      return self.selector.drawIndexes(self, n)
+
+   def draw(self, n):
+      """ Returns *n* selected individuals
+
+      :param n: the number of individuals
+      :rtype: the list of individuals
+      """
+      pop = self.population.internalPop
+      return [pop[i] for i in self.drawIndexes(n)]
+
+class SelectorBase:
+   """ SelectorBase Class - The base class of the selection methods
+
+   The new selection methods must override the :meth:`setup` and the
+   :meth:`drawIndexes` methods, the vectorized selection methods must set
+   the *vectorized* attribute and override the :meth:`drawIndexesVector`
+   method too.
+
+   .. versionadded:: 0.6
+      The *SelectorBase* class.
+   """
+
+   vectorized = False
+
+   def prepare(self, population):
+      """ Returns the selection state of the population, the tables of the
+      selection method are computed only in the first call of each generation
+
+      :param population: the population
+      :rtype: the :class:`Selection` instance
+      """
+      population.sort()
+      selection = population.selectionStates.get(self)
+      if selection is None:
+         selection = Selection(self, population)
+         self.setup(selection, population)
+         population.selectionStates[self] = selection
+      return selection
+
+   def setup(self, selection, population):
+      """ Computes the tables of the selection method and stores them in
+      the selection state, does nothing by default
+
+      :param selection: the :class:`Selection` instance
+      :param population: the population, sorted
+      """
+      pass
+
+   def drawIndexes(self, selection, n):
+      """ Returns the indexes of *n* selected individuals
+
+      :param selection: the :class:`Selection` instance
+      :param n: the number of individuals
+      :rtype: the list of indexes of the population
+      """
+      Util.raiseException("This method is not implemented on the ABC", NotImplementedError)
+
+   def drawIndexesVector(self, selection, n):
+      """ Returns the indexes of *n* selected individuals, drawn with the
+      NumPy random generator of the selection
+
+      :param selection: the :class:`Selection` instance
+      :param n: the number of individuals
+      :rtype: the NumPy array of indexes of the population
+      """
+      Util.raiseException("This method is not implemented on the ABC", NotImplementedError)
+
+   def __call__(self, population, **args):
+      """ Selects one individual of the population, like the selection
+      functions used in the function slots """
+      return self.prepare(population).draw(1)[0]
+
+   def __repr__(self):
+      """ Returns the string representation of the selector """
+      return "%s selector" % (self.__class__.__name__,)
+
+class RankSelector(SelectorBase):
    """ The Rank Selector - This selector will pick the best individual of
-   the population every time.
+   the population every time, the ties are picked at random.
    """
-   count = 0
-
-   if args["popID"] != GRankSelector.cachePopID:
-      if population.sortType == Consts.sortType["scaled"]:
-         best_fitness = population.bestFitness().fitness
-         for index in xrange(1, len(population.internalPop)):
-            if population[index].fitness == best_fitness:
-               count += 1
-      else:
-         best_raw = population.bestRaw().score
-         for index in xrange(1, len(population.internalPop)):
-            if population[index].score == best_raw:
-               count += 1
 
-      GRankSelector.cachePopID = args["popID"]
-      GRankSelector.cacheCount = count
+   vectorized = True
 
-   else: count = GRankSelector.cacheCount
+   def setup(self, selection, population):
+      selection.count = GRank_PrepareTable(population).count(0) - 1
 
-   return population[random.randint(0, count)]
+   def drawIndexes(self, selection, n):
+      count = selection.count
+      return [random.randint(0, count) for i in xrange(n)]
 
-GRankSelector.cachePopID = None
-GRankSelector.cacheCount = None
+   def drawIndexesVector(self, selection, n):
+      return selection.getRandomState().randint(0, selection.count + 1, n)
 
-def GUniformSelector(population, **args):
+class UniformSelector(SelectorBase):
    """ The Uniform Selector """
-   return population[random.randint(0, len(population)-1)]
 
-def GTournamentSelector(population, **args):
+   vectorized = True
+
+   def drawIndexes(self, selection, n):
+      last = len(selection.population) - 1
+      return [random.randint(0, last) for i in xrange(n)]
+
+   def drawIndexesVector(self, selection, n):
+      return selection.getRandomState().randint(0, len(selection.population), n)
+
+class RouletteWheelSelector(SelectorBase):
+   """ The Roulette Wheel Selector
+
+   Each draw is a binary search on the cumulative sums of the wheel, with the
+   alias table the draw takes a constant time. The alias table is the best
+   choice for large populations, it takes a bit more time to build.
+
+   :param alias: if True, uses the alias table instead of the binary search
+   """
+
+   vectorized = True
+
+   def __init__(self, alias=False):
+      self.alias = alias
+
+   def setup(self, selection, population):
+      selection.psum = GRouletteWheel_PrepareWheel(population)
+      if self.alias:
+         selection.prob, selection.alias = GRouletteWheel_PrepareAlias(selection.psum)
+
+   def drawIndexes(self, selection, n):
+      rand_random = random.random
+      if self.alias:
+         prob, alias = selection.prob, selection.alias
+         len_pop = len(prob)
+         indexes = []
+         for i in xrange(n):
+            r = rand_random() * len_pop
+            index = int(r)
+            indexes.append(index if r - index < prob[index] else alias[index])
+         return indexes
+
+      psum = selection.psum
+      last = len(psum) - 1
+      return [min(last, bisect_right(psum, rand_random())) for i in xrange(n)]
+
+   def drawIndexesVector(self, selection, n):
+      random_state = selection.getRandomState()
+      if self.alias:
+         prob, alias = selection.getArray("prob"), selection.getArray("alias")
+         r = random_state.random_sample(n) * len(prob)
+         indexes = r.astype(int)
+         return numpy.where(r - indexes < prob[indexes], indexes, alias[indexes])
+
+      psum = selection.getArray("psum")
+      return numpy.minimum(psum.searchsorted(random_state.random_sample(n), "right"), len(psum) - 1)
+
+class StochasticUniversalSelector(RouletteWheelSelector):
+   """ The Stochastic Universal Sampling Selector
+
+   The individuals of a batch are picked on the roulette wheel by equally
+   spaced pointers, with only one random number, in one sweep of the
+   wheel. Each individual is picked as many times as expected by the
+   roulette wheel, give or take one. The picked individuals are shuffled,
+   so the parents are paired at random.
+   """
+
+   def __init__(self):
+      RouletteWheelSelector.__init__(self)
+
+   def drawIndexes(self, selection, n):
+      psum = selection.psum
+      last = len(psum) - 1
+      step = psum[last] / float(n)
+      pointer = random.random() * step
+      indexes = []
+      i = 0
+      for j in xrange(n):
+         while i < last and psum[i] <= pointer:
+            i += 1
+         indexes.append(i)
+         pointer += step
+      random.shuffle(indexes)
+      return indexes
+
+   def drawIndexesVector(self, selection, n):
+      random_state = selection.getRandomState()
+      psum = selection.getArray("psum")
+      pointers = (random_state.random_sample() + numpy.arange(n)) * (psum[-1] / float(n))
+      indexes = numpy.minimum(psum.searchsorted(pointers, "right"), len(psum) - 1)
+      random_state.shuffle(indexes)
+      return indexes
+
+class LinearRankSelector(RouletteWheelSelector):
+   """ The Linear Ranking Selector
+
+   The probability of an individual depends only on its rank in the
+   population, it decreases linearly from *pressure* / N for the best
+   individual to (2 - *pressure*) / N for the worst one. The individuals
+   are drawn on the wheel of these probabilities, like the Roulette Wheel,
+   so the raw scores and the fitness can be negative.
+
+   :param pressure: the selection pressure, between 1.0 (uniform) and 2.0,
+                    by default the :attr:`Consts.CDefLinearRankPressure`
+   :param alias: if True, uses the alias table instead of the binary search
+   """
+
+   def __init__(self, pressure=None, alias=False):
+      if (pressure is not None) and ((pressure < 1.0) or (pressure > 2.0)):
+         Util.raiseException("The pressure must be between 1.0 and 2.0", ValueError)
+      RouletteWheelSelector.__init__(self, alias)
+      self.pressure = pressure
+
+   def setup(self, selection, population):
+      pressure = self.pressure or Consts.CDefLinearRankPressure
+      selection.psum = GLinearRank_PrepareTable(len(population), pressure)
+      if self.alias:
+         selection.prob, selection.alias = GRouletteWheel_PrepareAlias(selection.psum)
+
+class TruncationSelector(SelectorBase):
+   """ The Truncation Selector
+
+   The individuals are picked at random among the best ones, the worst
+   individuals are never selected.
+
+   :param rate: the fraction of the population which can be selected, by
+                default the :attr:`Consts.CDefTruncationRate`
+   """
+
+   vectorized = True
+
+   def __init__(self, rate=None):
+      if (rate is not None) and ((rate <= 0.0) or (rate > 1.0)):
+         Util.raiseException("The rate must be in the (0.0, 1.0] interval", ValueError)
+      self.rate = rate
+
+   def setup(self, selection, population):
+      rate = self.rate or Consts.CDefTruncationRate
+      selection.count = max(1, int(round(len(population) * rate)))
+
+   def drawIndexes(self, selection, n):
+      last = selection.count - 1
+      return [random.randint(0, last) for i in xrange(n)]
+
+   def drawIndexesVector(self, selection, n):
+      return selection.getRandomState().randint(0, selection.count, n)
+
+class TournamentSelector(SelectorBase):
    """ The Tournament Selector
-   
+
    It accepts the *tournamentPool* population parameter.
 
    .. note::
@@ -56,24 +350,50 @@ def GTournamentSelector(population, **args):
       Changed the parameter `poolSize` to the `tournamentPool`, now the selector
       gets the pool size from the population.
 
-   """
-   choosen = None
-   should_minimize = population.minimax == Consts.minimaxType["minimize"]
-   minimax_operator = min if should_minimize else max
-
-   poolSize = population.getParam("tournamentPool", Consts.CDefTournamentPoolSize)
-   tournament_pool = [GRouletteWheel(population, **args) for i in xrange(poolSize) ] 
+   :param pool_size: the size of the pool, by default the *tournamentPool*
+                     population parameter is used
 
-   if population.sortType == Consts.sortType["scaled"]:
-      choosen = minimax_operator(tournament_pool, key=lambda ind: ind.fitness)
-   else:
-      choosen = minimax_operator(tournament_pool, key=lambda ind: ind.score)
-
-   return choosen
+   """
 
-def GTournamentSelectorAlternative(population, **args):
+   vectorized = True
+
+   def __init__(self, pool_size=None):
+      self.poolSize = pool_size
+
+   def setup(self, selection, population):
+      # The winner of the pool is the individual with the lowest key
+      selection.key = GRank_PrepareTable(population)
+      selection.poolSize = self.poolSize or population.getParam("tournamentPool", Consts.CDefTournamentPoolSize)
+      selection.psum = GRouletteWheel_PrepareWheel(population)
+
+   def drawIndexes(self, selection, n):
+      rand_random = random.random
+      psum, key = selection.psum, selection.key.__getitem__
+      last = len(psum) - 1
+      pool_range = xrange(selection.poolSize)
+      return [min([min(last, bisect_right(psum, rand_random())) for j in pool_range], key=key)
+              for i in xrange(n)]
+
+   def drawIndexesVector(self, selection, n):
+      psum = selection.getArray("psum")
+      cutoffs = selection.getRandomState().random_sample((n, selection.poolSize))
+      pool = numpy.minimum(psum.searchsorted(cutoffs, "right"), len(psum) - 1)
+      return self.poolWinners(selection, pool)
+
+   def poolWinners(self, selection, pool):
+      """ Returns the winners of the tournaments, the first individual
+      with the lowest key of each row of the pool
+
+      :param selection: the :class:`Selection` instance
+      :param pool: the NumPy array of indexes, one row for each tournament
+      :rtype: the NumPy array of indexes of the winners
+      """
+      winners = selection.getArray("key")[pool].argmin(axis=1)
+      return pool[numpy.arange(len(pool)), winners]
+
+class TournamentSelectorAlternative(TournamentSelector):
    """ The alternative Tournament Selector
-   
+
    This Tournament Selector don't uses the Roulette Wheel
 
    It accepts the *tournamentPool* population parameter.
@@ -81,97 +401,213 @@ def GTournamentSelectorAlternative(population, **args):
    .. versionadded: 0.6
       Added the GTournamentAlternative function.
 
+   :param pool_size: the size of the pool, by default the *tournamentPool*
+                     population parameter is used
+
+   """
+
+   def setup(self, selection, population):
+      selection.key = GRank_PrepareTable(population)
+      selection.poolSize = self.poolSize or population.getParam("tournamentPool", Consts.CDefTournamentPoolSize)
+
+   def drawIndexes(self, selection, n):
+      rand_randint = random.randint
+      key = selection.key.__getitem__
+      last = len(selection.key) - 1
+      pool_range = xrange(selection.poolSize)
+      return [min([rand_randint(0, last) for j in pool_range], key=key) for i in xrange(n)]
+
+   def drawIndexesVector(self, selection, n):
+      pool = selection.getRandomState().randint(0, len(selection.key), (n, selection.poolSize))
+      return self.poolWinners(selection, pool)
+
+class TournamentSelectorLexicographic(TournamentSelectorAlternative):
+   """ The Tournament Selector with the lexicographic parsimony pressure
+
+   The individuals of the pool are compared by their scores and, when the
+   scores are equal, the individual with less nodes wins. It's used to
+   control the bloat of the Genetic Programming trees, see the :mod:`Bloat`
+   module. This Tournament Selector don't uses the Roulette Wheel.
+
+   It accepts the *tournamentPool* population parameter.
+
+   .. versionadded: 0.6
+      Added the GTournamentSelectorLexicographic function.
+
+   :param pool_size: the size of the pool, by default the *tournamentPool*
+                     population parameter is used
+
+   """
+
+   def setup(self, selection, population):
+      TournamentSelectorAlternative.setup(self, selection, population)
+      # The key sorts by the rank and then by the size
+      sizes = [len(ind) for ind in population.internalPop]
+      max_size = max(sizes) + 1
+      selection.key = [rank * max_size + size for rank, size in zip(selection.key, sizes)]
+
+GRankSelector = RankSelector()
+""" The Rank Selector, see the :class:`RankSelector` """
+
+GUniformSelector = UniformSelector()
+""" The Uniform Selector, see the :class:`UniformSelector` """
+
+GTournamentSelector = TournamentSelector()
+""" The Tournament Selector, see the :class:`TournamentSelector` """
+
+GTournamentSelectorAlternative = TournamentSelectorAlternative()
+""" The alternative Tournament Selector, see the :class:`TournamentSelectorAlternative` """
+
+GTournamentSelectorLexicographic = TournamentSelectorLexicographic()
+""" The lexicographic Tournament Selector, see the :class:`TournamentSelectorLexicographic` """
+
+GRouletteWheel = RouletteWheelSelector()
+""" The Roulette Wheel Selector, see the :class:`RouletteWheelSelector` """
+
+GRouletteWheelAlias = RouletteWheelSelector(alias=True)
+""" The Roulette Wheel Selector with the alias table, see the :class:`RouletteWheelSelector` """
+
+GStochasticUniversalSampling = StochasticUniversalSelector()
+""" The Stochastic Universal Sampling Selector, see the :class:`StochasticUniversalSelector` """
+
+GLinearRankSelector = LinearRankSelector()
+""" The Linear Ranking Selector, see the :class:`LinearRankSelector` """
+
+GTruncationSelector = TruncationSelector()
+""" The Truncation Selector, see the :class:`TruncationSelector` """
+
+def GRank_PrepareTable(population):
+   """ Returns the rank table of a sorted population, the rank of each
+   individual is the index of the first individual with the same score (the
+   fitness or the raw score, as the sort type), so the ties share the rank
+   and the best individuals have the rank 0
+
+   :param population: the population, sorted
+   :rtype: the list of ranks
+
+   .. versionadded:: 0.6
+      The *GRank_PrepareTable* function.
    """
-   pool_size = population.getParam("tournamentPool", Consts.CDefTournamentPoolSize)
-   len_pop = len(population)
-   should_minimize = population.minimax == Consts.minimaxType["minimize"]
-   minimax_operator = min if should_minimize else max
-   tournament_pool = [population[random.randint(0, len_pop-1)] for i in xrange(pool_size)]
-   
    if population.sortType == Consts.sortType["scaled"]:
-      choosen = minimax_operator(tournament_pool, key=lambda ind: ind.fitness)
+      scores = population.getFitnesses()
    else:
-      choosen = minimax_operator(tournament_pool, key=lambda ind: ind.score)
+      scores = population.getScores()
 
-   return choosen
+   if HAVE_NUMPY and isinstance(scores, numpy.ndarray):
+      # The rank is the index of the last change of score
+      rank = numpy.arange(len(scores))
+      rank[1:][scores[1:] == scores[:-1]] = 0
+      return numpy.maximum.accumulate(rank).tolist()
 
-def GRouletteWheel(population, **args):
-   """ The Roulette Wheel selector """
-   psum = None
-   if args["popID"] != GRouletteWheel.cachePopID:
-      GRouletteWheel.cachePopID = args["popID"]
-      psum = GRouletteWheel_PrepareWheel(population)
-      GRouletteWheel.cacheWheel = psum
-   else:
-      psum = GRouletteWheel.cacheWheel
-  
-   cutoff = random.random()
-   lower = 0
-   upper = len(population) - 1
-   while(upper >= lower):
-      i = lower + ((upper-lower)/2)
-      if psum[i] > cutoff: upper = i-1
-      else: lower = i+1
+   rank = [0] * len(scores)
+   for i in xrange(1, len(scores)):
+      rank[i] = rank[i-1] if scores[i] == scores[i-1] else i
+   return rank
+
+def GLinearRank_PrepareTable(len_pop, pressure):
+   """ Returns the cumulative probabilities of the linear ranking, the
+   best individual first
+
+   :param len_pop: the population size
+   :param pressure: the selection pressure, between 1.0 and 2.0
+   :rtype: the list of cumulative probabilities
+
+   .. versionadded:: 0.6
+      The *GLinearRank_PrepareTable* function.
+   """
+   if len_pop == 1: return [1.0]
+
+   slope = 2.0 * (pressure - 1.0) / (len_pop - 1)
+   psum = [0.0] * len_pop
+   acc = 0.0
+   for i in xrange(len_pop):
+      acc += pressure - slope * i
+      psum[i] = acc
+   for i in xrange(len_pop):
+      psum[i] /= acc
+   return psum
 
-   lower = min(len(population)-1, lower)
-   lower = max(0, lower)
+def GRouletteWheel_PrepareAlias(psum):
+   """ Builds the alias table (Vose's method) of the roulette wheel, it
+   allows to draw an individual in constant time
 
-   return population.bestFitness(lower)
+   :param psum: the cumulative sums of the wheel
+   :rtype: a tuple (probabilities, aliases)
 
-GRouletteWheel.cachePopID = None
-GRouletteWheel.cacheWheel = None
+   .. versionadded:: 0.6
+      The *GRouletteWheel_PrepareAlias* function.
+   """
+   len_pop = len(psum)
+   weights = [psum[0]] + [psum[i] - psum[i-1] for i in xrange(1, len_pop)]
+   total = float(sum(weights))
+   if total <= 0.0:
+      return [1.0] * len_pop, range(len_pop)
+
+   prob = [w * len_pop / total for w in weights]
+   alias = range(len_pop)
+   small = [i for i in xrange(len_pop) if prob[i] < 1.0]
+   large = [i for i in xrange(len_pop) if prob[i] >= 1.0]
+
+   while small and large:
+      s = small.pop()
+      l = large[-1]
+      alias[s] = l
+      prob[l] -= 1.0 - prob[s]
+      if prob[l] < 1.0:
+         small.append(large.pop())
+
+   # The remaining probabilities are 1.0 except for the rounding errors
+   for i in small + large:
+      prob[i] = 1.0
+
+   return prob, alias
 
 def GRouletteWheel_PrepareWheel(population):
-   """ A preparation for Roulette Wheel selection """
+   """ A preparation for Roulette Wheel selection, with the score arrays
+   of the population (see the :meth:`GPopulation.GPopulation.getScores`)
+   the cumulative sums are computed by NumPy """
 
    len_pop = len(population)
-   
+
    psum = [i for i in xrange(len_pop)]
 
    population.statistics()
 
    if population.sortType == Consts.sortType["scaled"]:
-      pop_fitMax = population.stats["fitMax"]
-      pop_fitMin = population.stats["fitMin"]
-
-      if pop_fitMax == pop_fitMin:
-         for index in xrange(len_pop):
-            psum[index] = (index+1) / float(len_pop)
-      elif (pop_fitMax > 0 and pop_fitMin >= 0) or (pop_fitMax <= 0 and pop_fitMin < 0):
-         population.sort()
-         if population.minimax == Consts.minimaxType["maximize"]:
-            psum[0] = population[0].fitness
-            for i in xrange(1, len_pop):
-               psum[i] = population[i].fitness + psum[i-1]
-            for i in xrange(len_pop):
-               psum[i] /= float(psum[len_pop - 1])
-         else:
-            psum[0] = -population[0].fitness + pop_fitMax + pop_fitMin
-            for i in xrange(1, len_pop):
-               psum[i] = -population[i].fitness + pop_fitMax + pop_fitMin + psum[i-1]
-            for i in xrange(len_pop):
-               psum[i] /= float(psum[len_pop - 1])
+      pop_max = population.stats["fitMax"]
+      pop_min = population.stats["fitMin"]
+      get_values = population.getFitnesses
    else:
-      pop_rawMax = population.stats["rawMax"]
-      pop_rawMin = population.stats["rawMin"]
-
-      if pop_rawMax == pop_rawMin:
-         for index in xrange(len_pop):
-            psum[index] = (index+1) / float(len_pop)
-      
-      elif (pop_rawMax > 0 and pop_rawMin >= 0) or (pop_rawMax <= 0 and pop_rawMin < 0):
-         population.sort()
-         if population.minimax == Consts.minimaxType["maximize"]:
-            psum[0] = population[0].score
-            for i in xrange(1, len_pop):
-               psum[i] = population[i].score + psum[i-1]
-            for i in xrange(len_pop):
-               psum[i] /= float(psum[len_pop-1])
-         else:
-            psum[0] = - population[0].score + pop_rawMax + pop_rawMin
-            for i in xrange(1, len_pop):
-               psum[i] = - population[i].score + pop_rawMax + pop_rawMin + psum[i-1]
-            for i in xrange(len_pop):
-               psum[i] /= float(psum[len_pop-1])
+      pop_max = population.stats["rawMax"]
+      pop_min = population.stats["rawMin"]
+      get_values = population.getScores
+
+   if pop_max == pop_min:
+      for index in xrange(len_pop):
+         psum[index] = (index+1) / float(len_pop)
+
+   elif (pop_max > 0 and pop_min >= 0) or (pop_max <= 0 and pop_min < 0):
+      population.sort()
+      values = get_values()
+      maximize = (population.minimax == Consts.minimaxType["maximize"])
+
+      if HAVE_NUMPY and isinstance(values, numpy.ndarray):
+         # Same operations in the same order of the loops, same sums
+         if not maximize:
+            values = -values + pop_max + pop_min
+         wheel = values.cumsum()
+         wheel /= float(wheel[-1])
+         return wheel.tolist()
+
+      if maximize:
+         psum[0] = values[0]
+         for i in xrange(1, len_pop):
+            psum[i] = values[i] + psum[i-1]
+      else:
+         psum[0] = - values[0] + pop_max + pop_min
+         for i in xrange(1, len_pop):
+            psum[i] = - values[i] + pop_max + pop_min + psum[i-1]
+      for i in xrange(len_pop):
+         psum[i] /= float(psum[len_pop-1])
 
    return psum
@@ -21,9 +21,32 @@ class Statistics:
    **fitMax, fitMin, fitAve**
       Maximum, mininum and average of fitness scores
 
+   **fitDev, fitVar**
+      Standard Deviation and Variance of fitness scores
+
    **rawTot, fitTot**
       The total (sum) of raw scores and the fitness scores
 
+   **cacheHits, cacheMisses**
+      Hits and misses of the fitness cache on the generation evaluation
+
+   **compileHits, compileMisses**
+      Hits and misses of the compiled code cache of the
+      :class:`GTree.GTreeGP` on the generation evaluation
+
+   **sizeAve, sizeMax**
+      Average and maximum number of nodes of the Genetic Programming trees
+
+   **evalTime**
+      Time, in seconds, spent on the generation evaluation
+
+   **evalRate**
+      Throughput of the evaluation, in evaluations per second
+
+   The statistics that apply only to some runs, like the *cacheHits*, are
+   set only when they are computed. They are kept apart from the others,
+   so :meth:`asTuple` returns always the same statistics.
+
    Example:
       >>> stats = ga_engine.getStatistics()
       >>> st["rawMax"]
@@ -43,6 +66,9 @@ class Statistics:
                               "fitMin"  : 0.0,
                               "fitAve"  : 0.0 }
 
+      # The statistics set only when they apply to the run
+      self.extraDict = {}
+
       self.descriptions = {   "rawMax" : "Maximum raw score",
                               "rawMin" : "Minimum raw score",
                               "rawAve" : "Average of raw scores",
@@ -50,23 +76,42 @@ class Statistics:
                               "rawVar" : "Raw scores variance",
                               "fitMax" : "Maximum fitness",
                               "fitMin" : "Minimum fitness",
-                              "fitAve" : "Fitness average" }
+                              "fitAve" : "Fitness average",
+                              "fitDev" : "Standard deviation of fitness",
+                              "fitVar" : "Fitness variance",
+                              "cacheHits"   : "Fitness cache hits",
+                              "cacheMisses" : "Fitness cache misses",
+                              "compileHits"   : "Compiled code cache hits",
+                              "compileMisses" : "Compiled code cache misses",
+                              "sizeAve"  : "Average tree size (nodes)",
+                              "sizeMax"  : "Maximum tree size (nodes)",
+                              "evalTime" : "Evaluation time (seconds)",
+                              "evalRate" : "Evaluations per second" }
    def __getitem__(self, key):
       """ Return the specific statistic by key """
-      return self.internalDict[key]
+      if key in self.internalDict:
+         return self.internalDict[key]
+      return self.extraDict[key]
 
    def __setitem__(self, key, value):
       """ Set the statistic """
-      self.internalDict[key] = value
+      if key in self.internalDict:
+         self.internalDict[key] = value
+      else:
+         self.extraDict[key] = value
+
+   def __contains__(self, key):
+      """ Return True if the statistic is set """
+      return key in self.internalDict or key in self.extraDict
 
    def __len__(self):
       """ Return the lenght of internal stats dictionary """
-      return len(self.internalDict)
+      return len(self.internalDict) + len(self.extraDict)
 
    def __repr__(self):
       """ Return a string representation of the statistics """
       strBuff  = "- Statistics\n"
-      for k,v in self.internalDict.items():
+      for k,v in self.items():
          strBuff += "\t%-45s = %.2f\n" % (self.descriptions.get(k, k), v)
       return strBuff
 
@@ -78,10 +123,11 @@ class Statistics:
       """ Set all statistics to zero """
       for k in self.internalDict.keys():
          self.internalDict[k] = 0
+      self.extraDict.clear()
 
    def items(self):
       """ Return a tuple (name, value) for all stored statistics """
-      return self.internalDict.items()
+      return self.internalDict.items() + self.extraDict.items()
 
    def clone(self):
       """ Instantiate a new Statistic class with the same contents """
@@ -96,6 +142,7 @@ class Statistics:
 
       """
       obj.internalDict = self.internalDict.copy()
+      obj.extraDict = self.extraDict.copy()
       obj.descriptions = self.descriptions.copy()
       
 
@@ -8,11 +8,18 @@ use, like list item swap, random utilities and etc.
 
 """
 
-from random import random as rand_random
-from math import sqrt as math_sqrt
+from random import random as rand_random, getrandbits as rand_getrandbits
+from math import sqrt as math_sqrt, log as math_log
+from collections import deque
 import logging
 import Consts
 
+try:
+   import numpy
+   HAVE_NUMPY = True
+except ImportError:
+   HAVE_NUMPY = False
+
 def randomFlipCoin(p):
    """ Returns True with the *p* probability. If the *p* is 1.0,
    the function will always return True, or if is 0.0, the
@@ -31,6 +38,118 @@ def randomFlipCoin(p):
 
    return True if rand_random() <= p else False
    
+def randomBitMask(length, p=0.5):
+   """ Returns an integer with *length* random bits, each bit is
+   one with the *p* probability. The positions of the ones are
+   drawn directly, so the cost depends on the number of ones and
+   not on the length.
+
+   Example:
+      >>> Util.randomBitMask(8, 0.0)
+      0
+
+   :param length: the number of bits
+   :param p: the probability of each bit, between 0.0 and 1.0
+   :rtype: the integer mask
+
+   .. versionadded:: 0.6
+      The *randomBitMask* function
+   """
+   if length <= 0 or p <= 0.0: return 0
+   if p >= 1.0: return (1 << length) - 1
+   if p == 0.5: return rand_getrandbits(length)
+
+   mask = 0
+   log_q = math_log(1.0 - p)
+   pos = -1
+   while True:
+      # The gap between two ones is geometric
+      pos += 1 + int(math_log(1.0 - rand_random()) / log_q)
+      if pos >= length: break
+      mask |= 1 << pos
+   return mask
+
+def bitCount(bits):
+   """ Returns the number of bits set to one of an integer
+
+   Example:
+      >>> Util.bitCount(11)
+      3
+
+   :param bits: the integer, zero or positive
+   :rtype: the number of ones
+
+   .. versionadded:: 0.6
+      The *bitCount* function
+   """
+   count = 0
+   while bits:
+      # Clears the lowest one
+      bits &= bits - 1
+      count += 1
+   return count
+
+# The bits of each hexadecimal digit, used by bitsToString
+_hexBits = dict([("%x" % i, "".join([str((i >> j) & 1) for j in (3, 2, 1, 0)])) for i in xrange(16)])
+
+def bitsToString(bits, length):
+   """ Returns the binary string of an integer, the most significant
+   bit first, padded with zeros to the *length* bits
+
+   Example:
+      >>> Util.bitsToString(5, 4)
+      '0101'
+
+   :param bits: the integer, zero or positive
+   :param length: the number of bits
+   :rtype: the binary string
+
+   .. versionadded:: 0.6
+      The *bitsToString* function
+   """
+   if length <= 0: return ""
+   string = "".join([_hexBits[c] for c in "%x" % bits]).lstrip("0")
+   return string.zfill(length)
+
+def summaryStatistics(values):
+   """ Returns the minimum, the maximum, the mean and the sample variance
+   of the values in a single pass, with the Welford's method, which is
+   stable even when the values are large and close to each other. When
+   NumPy is installed, the NumPy arrays and the long lists (see the
+   :attr:`Consts.CDefPopVectorSize`) are computed by NumPy.
+
+   Example:
+      >>> Util.summaryStatistics([1.0, 2.0, 3.0, 4.0])
+      (1.0, 4.0, 2.5, 1.6666666666666667)
+
+   :param values: the list or the NumPy array of values, not empty
+   :rtype: a tuple of floats (minimum, maximum, mean, variance), the
+           variance of a single value is 0.0
+
+   .. versionadded:: 0.6
+      The *summaryStatistics* function
+   """
+   count = len(values)
+   if HAVE_NUMPY and (count >= Consts.CDefPopVectorSize or isinstance(values, numpy.ndarray)):
+      array = numpy.asarray(values, dtype=float)
+      return (float(array.min()), float(array.max()), float(array.mean()),
+              float(array.var(ddof=1)))
+
+   minimum = maximum = values[0]
+   mean = 0.0
+   m2 = 0.0
+   n = 0
+   for x in values:
+      n += 1
+      delta = x - mean
+      mean += delta / n
+      m2 += delta * (x - mean)
+      if x < minimum: minimum = x
+      elif x > maximum: maximum = x
+
+   variance = m2 / (n - 1) if n > 1 else 0.0
+   return float(minimum), float(maximum), mean, variance
+
 def listSwapElement(lst, indexa, indexb):
    """ Swaps elements A and B in a list.
 
@@ -288,6 +407,112 @@ class Graph:
       return ret         
       
 
+class BoundedCache:
+   """ A size-capped cache with hit/miss counters, when the cache
+   is full, the oldest entry is discarded.
+
+   Example:
+      >>> cache = BoundedCache(1000)
+      >>> cache.store("key", 10.5)
+      >>> cache.lookup("key")
+      10.5
+      >>> cache.hits, cache.misses
+      (1, 0)
+
+   :param size: the maximum number of entries
+
+   .. versionadded:: 0.6
+      The *BoundedCache* class.
+   """
+
+   def __init__(self, size):
+      """ The constructor """
+      self.size = size
+      self.values = {}
+      self.keyOrder = deque()
+      self.hits = 0
+      self.misses = 0
+
+   def __len__(self):
+      """ Returns the number of entries """
+      return len(self.values)
+
+   def lookup(self, key):
+      """ Returns the cached value of the key or None if it's not cached,
+      the hit/miss counters are updated
+
+      :param key: the key
+      :rtype: the value or None
+      """
+      value = self.values.get(key)
+      if value is None:
+         self.misses += 1
+      else:
+         self.hits += 1
+      return value
+
+   def store(self, key, value):
+      """ Stores the value of the key
+
+      :param key: the key
+      :param value: the value
+      """
+      if key in self.values:
+         self.values[key] = value
+         return
+      if len(self.keyOrder) >= self.size:
+         del self.values[self.keyOrder.popleft()]
+      self.values[key] = value
+      self.keyOrder.append(key)
+
+   def resetCounters(self):
+      """ Sets the hit/miss counters to zero """
+      self.hits = 0
+      self.misses = 0
+
+   def clear(self):
+      """ Removes all the entries and resets the counters """
+      self.values.clear()
+      self.keyOrder.clear()
+      self.resetCounters()
+
+class FitnessCache(BoundedCache):
+   """ A size-capped cache of raw scores, keyed by the genome genes
+
+   The key of an individual is the result of its *exportGenes* method, when
+   the cache is full, the oldest entry is discarded.
+
+   Example:
+      >>> cache = FitnessCache(1000)
+      >>> key = cache.makeKey(genome)
+      >>> cache.store(key, 10.5)
+      >>> cache.lookup(key)
+      10.5
+      >>> cache.hits, cache.misses
+      (1, 0)
+
+   :param size: the maximum number of entries
+
+   .. versionadded:: 0.6
+      The *FitnessCache* class.
+   """
+
+   def makeKey(self, genome):
+      """ Returns the cache key of the genome or None if the genome
+      can't be cached
+
+      :param genome: the genome
+      :rtype: the key or None
+      """
+      if not hasattr(genome, "exportGenes"):
+         return None
+      key = genome.exportGenes()
+      try:
+         hash(key)
+      except TypeError:
+         return None
+      return key
+
 def G1DListGetEdgesComposite(mom, dad):
    """ Get the edges and the merge between the edges of two G1DList individuals
 
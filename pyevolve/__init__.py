@@ -9,11 +9,11 @@ is above this namespace, for example, to import :mod:`Mutators`:
 
 
 """
-__all__ = ["Consts", "Crossovers", "DBAdapters", "FunctionSlot",
+__all__ = ["Bloat", "Consts", "Crossovers", "DBAdapters", "FunctionSlot",
            "G1DBinaryString", "G1DList", "G2DBinaryString",
-           "G2DList", "GAllele", "GenomeBase", "GPopulation",
-           "GSimpleGA", "GTree", "Initializators",
-           "Migration", "Mutators", "Network", "Scaling", "Selectors",
+           "G2DList", "GAllele", "GArrayPopulation", "GenomeBase", "GPopulation",
+           "GSimpleGA", "GSteadyStateGA", "GTree", "GTreeDAG", "GTreeLinear",
+           "Initializators", "Migration", "Mutators", "Network", "Scaling", "Selectors",
            "Statistics", "Util"]
 
 __version__ =  '0.6'
@@ -41,4 +41,5 @@ def logEnable(filename=Consts.CDefLogFile, level=Consts.CDefLogLevel):
    logging.basicConfig(level=level,
                     format='%(asctime)s [%(module)s:%(funcName)s:%(lineno)d] %(levelname)s %(message)s',
                     filename=filename,
-                    filemode='w')   logging.info("Pyevolve v.%s, the log was enabled by user.", __version__)
+                    filemode='w')
+   logging.info("Pyevolve v.%s, the log was enabled by user.", __version__)